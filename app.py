@@ -1,29 +1,115 @@
 import streamlit as st
 import pandas as pd
 import database as db
-import scraper as sc
+import exports
+import bulk_import
+import setup
+from job_runner import JobRunner
 import asyncio
 import sys
-import io
-import time
+import threading
 from datetime import datetime
 
 # This is only needed for running locally on Windows
 if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
+POLL_SECONDS = 1 # How often a scrape's progress panel refreshes while the scrape is running
+
 st.set_page_config(page_title="Job Scraper Dashboard", layout="wide")
 st.title("🚀 Startup Job Search")
 
+@st.cache_resource
+def get_job_runner():
+    """One runner per server process, so scrapes keep going across reruns and browser disconnects."""
+    return JobRunner()
+
+@st.cache_resource
+def start_prewarm():
+    """Imports the scraping stack and launches a shared browser on a background thread, once per process."""
+    def warm_up():
+        import scraper as sc
+        if setup.chromium_installed():
+            sc.prewarm_browser()
+    threading.Thread(target=warm_up, name="scraper-prewarm", daemon=True).start()
+    return True
+
+# The scraping stack (LinkedIn scraper, Playwright) is only imported once a scrape is started
+def broad_scrape(job):
+    import scraper as sc
+    params = job.params
+    # On resume, skip finished queries/categories and only ask LinkedIn for what is still missing
+    return sc.iter_broad_jobs(max(0, params['linkedin_limit'] - job.kept('linkedin')), params['iimjobs_limit'],
+                              progress=True, skip_units=job.done_units, should_stop=job.should_stop)
+
+def targeted_scrape(job):
+    import scraper as sc
+    params = job.params
+    return sc.iter_targeted_jobs(params['role'], params['location'], params['limit'], params['apply_filter'],
+                                 progress=True, should_stop=job.should_stop)
+
+SCRAPE_KINDS = {'broad': broad_scrape, 'targeted': targeted_scrape}
+
+def start_scrape(kind, params):
+    # Only the IIMJobs half of a broad scrape drives Playwright; targeted scrapes are LinkedIn-only
+    if kind == 'broad' and not setup.setup_playwright():
+        return None
+    job = runner.submit(kind, params, SCRAPE_KINDS[kind], store.add_jobs_df)
+    st.session_state[f"{kind}_job_id"] = job.job_id
+    return job
+
+def show_scrape_job(kind, container):
+    """Renders the progress of this session's scrape of the given kind; returns True while it is still running."""
+    job = runner.get(st.session_state.get(f"{kind}_job_id", ''))
+    if job is None:
+        return False
+    progress = job.progress()
+    stage = progress['stage'] or 'starting'
+    fraction = progress['stage_done'] / progress['stage_total'] if progress['stage_total'] else 0.0
+    counts = f"{progress['jobs_found']} jobs found, {progress['jobs_added']} new ones saved"
+    if progress['status'] in ('queued', 'running'):
+        container.progress(fraction, text=f"{stage}: {progress['stage_done']}/{progress['stage_total']} done - {counts}")
+        if container.button("⏹️ Cancel", key=f"cancel_{kind}"):
+            job.cancel()
+        return True
+    if progress['status'] == 'done':
+        container.success(f"Scrape complete! {counts}.")
+    elif progress['status'] == 'cancelled':
+        container.warning(f"Scrape cancelled. {counts}.")
+    else:
+        container.error(f"Scrape failed: {progress['error']}. {counts}.")
+    if progress['status'] != 'done' and container.button("🔁 Resume", key=f"resume_{kind}"):
+        start_scrape(kind, job.params)
+        st.rerun()
+    return False
+
+def scrape_panel(kind):
+    """A scrape's progress, its cancel/resume buttons and, for targeted scrapes, the jobs found so far."""
+    running = show_scrape_job(kind, st)
+    if kind == 'targeted':
+        targeted_df = runner.get(st.session_state["targeted_job_id"]).found_df()
+        if not targeted_df.empty:
+            st.dataframe(targeted_df, use_container_width=True, hide_index=True)
+        elif not running:
+            st.warning("The targeted scrape did not find any new startup jobs.")
+
+def render_scrape_panel(kind):
+    # Only the panel reruns while the scrape is going, so searches and uploads elsewhere on the page are left alone
+    job = runner.get(st.session_state.get(f"{kind}_job_id", ''))
+    running = job is not None and not job.finished
+    st.fragment(scrape_panel, run_every=POLL_SECONDS if running else None)(kind)
+
 # --- Initial Setup ---
-# Connect to Google Sheets once at the start of the app
-worksheet = db.connect_to_gsheet()
+# Open the storage backend chosen by STORAGE_BACKEND in st.secrets (Google Sheets by default)
+store = db.connect_store()
 
 # Stop the app if connection fails
-if worksheet is None:
-    st.error("Failed to connect to Google Sheets. Please check your credentials and sheet name in st.secrets.")
+if store is None:
+    st.error("Failed to connect to the job database. Please check STORAGE_BACKEND and its settings in st.secrets.")
     st.stop()
 
+runner = get_job_runner()
+
 # --- Main Page Search UI ---
 st.header("Search Jobs in Database")
 col1, col2 = st.columns(2)
@@ -41,8 +127,7 @@ if filter_by_date:
 # --- Search Execution ---
 if st.button("Search", key="search_button", type="primary"):
     with st.spinner("Searching..."):
-        results_df = db.search_jobs(
-            worksheet, # Pass the worksheet object
+        results_df = store.search_jobs(
             role=search_role, 
             location=search_location,
             start_date=start_date,
@@ -65,16 +150,14 @@ if st.button("Search", key="search_button", type="primary"):
             targeted_limit = st.number_input("Number of jobs to scrape", 10, 200, 25, 5, key="targeted_scrape_limit")
             scrape_prompt = f"Scrape for '{search_role or 'any role'}' in '{search_location or 'any location'}'?"
             if st.button(scrape_prompt, key="scrape_now_button"):
-                with st.spinner(f"Performing a targeted scrape... this may take a moment."):
-                    targeted_df = sc.scrape_targeted_jobs(role=search_role, location=search_location, limit=targeted_limit, apply_filter=apply_startup_filter)
-                if not targeted_df.empty:
-                    st.write(f"Found {len(targeted_df)} jobs. Adding to spreadsheet...")
-                    num_added = db.add_jobs_df(worksheet, targeted_df) # Pass worksheet
-                    st.success(f"Scrape complete! Added {num_added} new jobs. Rerunning search...")
-                    time.sleep(2)
-                    st.rerun()
-                else:
-                    st.warning("The targeted scrape did not find any new startup jobs.")
+                start_scrape('targeted', {'role': search_role, 'location': search_location,
+                                          'limit': int(targeted_limit), 'apply_filter': apply_startup_filter})
+
+# Targeted scrapes run in the background; show their progress and the jobs found so far
+if st.session_state.get("targeted_job_id") and runner.get(st.session_state["targeted_job_id"]):
+    st.markdown("---")
+    st.subheader("Targeted Scrape")
+    render_scrape_panel('targeted')
 
 # --- Sidebar ---
 st.sidebar.header("Database Maintenance")
@@ -84,52 +167,56 @@ with st.sidebar.expander("Update Database (Broad Scrape)", expanded=True):
     iim_limit = st.number_input("IIMJobs Pages to Scroll", 1, 10, 2, key="broad_iim_limit")
 
     if st.button("▶️ Start Broad Scrape"):
-        progress_bar = st.sidebar.progress(0, text="Starting broad scrape...")
-        scraped_df = sc.run_full_scrape(linkedin_limit=li_limit, iimjobs_limit=iim_limit)
-        progress_bar.progress(100, text="Scrape complete! Saving to spreadsheet...")
-        
-        if scraped_df is not None and not scraped_df.empty:
-            num_added = db.add_jobs_df(worksheet, scraped_df) # Pass worksheet
-            if num_added > 0:
-                st.sidebar.success(f"Success! Added {num_added} new jobs.")
-            else:
-                st.sidebar.info("No new jobs found. Database is already up to date.")
-            time.sleep(3)
-            st.rerun()
-        else:
-            st.sidebar.warning("No jobs were found in the scrape.")
-        progress_bar.empty()
+        start_scrape('broad', {'linkedin_limit': int(li_limit), 'iimjobs_limit': int(iim_limit)})
+    render_scrape_panel('broad')
 
-with st.sidebar.expander("Download Database"):
-    st.write("Download the entire job database as an Excel file.")
-    all_jobs_df = db.get_all_jobs_df(worksheet) # Pass worksheet
-    if not all_jobs_df.empty:
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            all_jobs_df.to_excel(writer, index=False, sheet_name='Jobs')
-        excel_data = output.getvalue()
+with st.sidebar.expander("Last Run Report"):
+    last_job = runner.get(st.session_state.get("broad_job_id") or st.session_state.get("targeted_job_id") or '')
+    if last_job is not None and last_job.report is not None:
+        report = last_job.report.to_dict()
+        st.write(f"{report['name']}: {report['seconds']:.1f}s")
+        st.dataframe(pd.DataFrame(last_job.report.stage_table()), use_container_width=True, hide_index=True)
+        st.json(report['counters'])
         st.download_button(
-            label="📄 Download as Excel", 
-            data=excel_data,
-            file_name="job_database.xlsx"
+            label="🧾 Download report as JSON",
+            data=last_job.report.to_json(),
+            file_name=f"run_report_{last_job.job_id}.json"
         )
     else:
-        st.warning("Database is empty.")
+        st.write("Start a scrape to see where its time goes.")
+
+with st.sidebar.expander("Download Database"):
+    st.write("Download the entire job database. The file is built when you click, and reused until the data changes.")
+    export_format = st.selectbox("Format", exports.available_formats(), format_func=lambda fmt: exports.EXPORT_FORMATS[fmt][0], key="export_format")
+    st.download_button(
+        label=f"📄 Download as {exports.EXPORT_FORMATS[export_format][0]}",
+        data=lambda fmt=export_format: exports.export_bytes(store, fmt),
+        file_name=f"job_database.{export_format}",
+        mime=exports.EXPORT_FORMATS[export_format][1],
+        on_click='ignore'
+    )
 
 with st.sidebar.expander("Upload to Database"):
     st.write("Upload an Excel or CSV file with new job entries.")
     uploaded_file = st.file_uploader("Choose a file", type=['xlsx', 'xls', 'csv'])
     if uploaded_file:
         try:
-            file_extension = uploaded_file.name.split('.')[-1].lower()
-            if file_extension == 'csv':
-                upload_df = pd.read_csv(uploaded_file)
+            # Read and saved chunk by chunk; a file imported before is recognised by its hash and skipped
+            import_progress = st.progress(0.0, text="Importing...")
+            result = bulk_import.import_file(
+                store, uploaded_file, uploaded_file.name,
+                on_progress=lambda fraction, rows, added: import_progress.progress(fraction, text=f"{rows} rows read, {added} new jobs added...")
+            )
+            import_progress.empty()
+            if result['status'] == 'duplicate':
+                st.info(f"This file was already imported ({result['added']} new job entries were added then).")
             else:
-                upload_df = pd.read_excel(uploaded_file)
-
-            num_added = db.add_jobs_df(worksheet, upload_df) # Pass worksheet
-            st.success(f"File processed! Added {num_added} new job entries.")
-            time.sleep(2)
-            st.rerun()
+                st.success(f"File processed! Read {result['rows']} rows and added {result['added']} new job entries.")
+                if result['invalid']:
+                    st.warning(f"Skipped {result['invalid']} rows without a company or role.")
         except Exception as e:
             st.error(f"An error occurred while processing the file: {e}")
+
+# Warm up the scraper only after the page has been drawn
+if db._get_setting("PREWARM_BROWSER", False):
+    start_prewarm()
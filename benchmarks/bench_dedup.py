@@ -0,0 +1,85 @@
+"""Cost of adding a batch of scraped jobs to a sheet that already holds 100k rows: the old add_jobs_df
+(download the whole sheet, concatenate Company+Role+Location, isin) against the fingerprint index,
+warm and right after a restart. Runs offline against benchmarks.fake_sheet:
+
+    python -m benchmarks.bench_dedup [--existing 100000] [--batch 200]
+"""
+import argparse
+import tempfile
+
+import pandas as pd
+
+import database as db
+from benchmarks.common import best_of, print_table
+from benchmarks.fake_sheet import HEADER, FakeWorksheet, make_jobs
+
+def legacy_add_jobs_df(worksheet, new_jobs_df):
+    """The add_jobs_df the fingerprint index replaced."""
+    values = worksheet.get_all_values()
+    existing = pd.DataFrame(values[1:], columns=values[0])
+    new_ids = new_jobs_df['Company'].astype(str) + new_jobs_df['Role'].astype(str) + new_jobs_df['Location'].astype(str)
+    existing_ids = existing['Company'].astype(str) + existing['Role'].astype(str) + existing['Location'].astype(str)
+    truly_new = new_jobs_df[~new_ids.isin(existing_ids)]
+    if len(truly_new):
+        worksheet.append_rows(truly_new[worksheet.row_values(1)].fillna('').values.tolist(), value_input_option='USER_ENTERED')
+    return len(truly_new)
+
+def make_batch(existing_rows, size, seed):
+    """A scrape batch: a quarter exact repeats, a quarter repeats spelled differently, half new jobs."""
+    exact = [list(row) for row in existing_rows[:size // 4]]
+    respelled = [[row[0].upper() + ' Pvt Ltd', row[1], row[2].replace('Bangalore', 'Bengaluru')] + row[3:]
+                 for row in existing_rows[size // 4:size // 2]]
+    fresh = make_jobs(size - len(exact) - len(respelled), seed=seed, prefix=f'New {seed}')
+    return pd.DataFrame(exact + respelled + fresh, columns=HEADER)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--existing', type=int, default=100000)
+    parser.add_argument('--batch', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    existing = make_jobs(args.existing)
+    expected_new = args.batch - args.batch // 2
+    rows = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        db.CACHE_DIR = cache_dir
+        batches = iter(range(1, 10 ** 6))
+
+        def legacy():
+            sheet = FakeWorksheet([HEADER] + existing)
+            return sheet, legacy_add_jobs_df(sheet, make_batch(existing, args.batch, next(batches)))
+        seconds, (sheet, added) = best_of(legacy, args.repeat)
+        rows.append({'dedup': 'old: full download + isin', 'ms per batch': round(seconds * 1000, 1), 'added': added,
+                     'expected': expected_new, 'rows downloaded': args.existing * sheet.calls['get_all_values']})
+
+        sheet = FakeWorksheet([HEADER] + existing, id=1)
+        first, _ = best_of(lambda: db.add_jobs_df(sheet, make_batch(existing, args.batch, next(batches))), 1)
+        downloaded = args.existing * sheet.calls['get_all_values']
+        sheet.calls.clear()
+
+        def warm():
+            # Past the mirror's refresh interval, so each batch also pays for the delta fetch
+            db.get_sheet_mirror(sheet)._checked_at = None
+            return db.add_jobs_df(sheet, make_batch(existing, args.batch, next(batches)))
+        seconds, added = best_of(warm, args.repeat)
+        rows.append({'dedup': 'fingerprint index, warm', 'ms per batch': round(seconds * 1000, 1), 'added': added,
+                     'expected': expected_new, 'rows downloaded': sheet.calls['get_all_values']})
+
+        restarts = []
+
+        def restarted():
+            # A new worksheet object for the same sheet reloads the mirror and index from the cache files
+            restarted_sheet = FakeWorksheet(id=1)
+            restarted_sheet.values = sheet.values
+            restarts.append(restarted_sheet)
+            return db.add_jobs_df(restarted_sheet, make_batch(existing, args.batch, next(batches)))
+        seconds, added = best_of(restarted, args.repeat)
+        rows.append({'dedup': 'fingerprint index, after restart', 'ms per batch': round(seconds * 1000, 1), 'added': added,
+                     'expected': expected_new, 'rows downloaded': sum(len(sheet.values) * s.calls['get_all_values'] for s in restarts)})
+        rows.append({'dedup': 'fingerprint index, first run ever', 'ms per batch': round(first * 1000, 1), 'added': '',
+                     'expected': '', 'rows downloaded': downloaded})
+    print_table(rows)
+
+if __name__ == '__main__':
+    main()
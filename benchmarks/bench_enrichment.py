@@ -0,0 +1,100 @@
+"""Enrichment of synthetic raw LinkedIn jobs (experience, location, posted date) at 10k and 100k rows:
+the old per-row helpers, today's single-job helpers, and the column-wise enrich_jobs_df.
+
+    python -m benchmarks.bench_enrichment [--rows 10000 100000]
+"""
+import argparse
+import random
+import re
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+import scraper as sc
+from benchmarks.common import best_of, print_table
+
+DATES = ['2026-03-01', '2026-02-20', '2026-01-28', '3d', '1w', '2mo', 'yesterday', '5 days ago', '2 weeks ago']
+EXPERIENCE = ['3 to 5 years of experience', '5-7 years', '2+ years', 'at least 4 years', '']
+WORK_MODE = ['This role is fully remote.', 'Hybrid, three days in office.', 'Work from our office.', '']
+FILLER = ('you will own the roadmap work with design data and operations ship features customers love '
+          'experience with python sql and cloud platforms is a plus').split()
+
+# --- The per-row helpers enrichment replaced (patterns compiled on every call, today read per row) ---
+def legacy_convert_date(text):
+    if text is None: return None
+    text = str(text).lower().strip()
+    today = datetime.today()
+    if re.search(r'^\d{4}-\d{2}-\d{2}', text):
+        try: return datetime.strptime(text.split('t')[0], '%Y-%m-%d').strftime('%d-%m-%Y')
+        except ValueError: pass
+    if (m := re.search(r'^(\d+)h$', text)): return today.strftime('%d-%m-%Y')
+    if (m := re.search(r'^(\d+)d$', text)): return (today - timedelta(days=int(m.group(1)))).strftime('%d-%m-%Y')
+    if (m := re.search(r'^(\d+)w$', text)): return (today - timedelta(weeks=int(m.group(1)))).strftime('%d-%m-%Y')
+    if (m := re.search(r'^(\d+)mo$', text)): return (today - timedelta(days=int(m.group(1)) * 30)).strftime('%d-%m-%Y')
+    if "yesterday" in text: return (today - timedelta(days=1)).strftime('%d-%m-%Y')
+    if (m := re.search(r'(\d+)\s+days?', text)): return (today - timedelta(days=int(m.group(1)))).strftime('%d-%m-%Y')
+    if (m := re.search(r'(\d+)\s+weeks?', text)): return (today - timedelta(weeks=int(m.group(1)))).strftime('%d-%m-%Y')
+    if (m := re.search(r'(\d+)\s+months?', text)): return (today - timedelta(days=int(m.group(1)) * 30)).strftime('%d-%m-%Y')
+    return today.strftime('%d-%m-%Y')
+
+def legacy_extract_experience(description):
+    if not description: return ""
+    desc_lower = description.lower()
+    for pattern in [r'(\d+)\+?\s*to\s*(\d+)\s*years', r'(\d+)\s*-\s*(\d+)\s*years', r'(\d+)\+?\s*years?']:
+        match = re.search(pattern, desc_lower)
+        if match:
+            if len(match.groups()) == 2 and match.group(2):
+                return f"{match.group(1)}-{match.group(2)} years"
+            return f"{match.group(1)}+ years"
+    return ""
+
+def legacy_extract_location(description, location):
+    if not description: description = ""
+    text = (description + " " + location).lower()
+    if any(k in text for k in ['remote', 'work from home', 'wfh']): return "Remote"
+    if 'hybrid' in text: return f"Hybrid ({location})"
+    return location
+
+def synthetic_raw_jobs(n, words=400, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        text = [rng.choice(FILLER) for _ in range(words)]
+        text.insert(rng.randrange(len(text)), rng.choice(EXPERIENCE))
+        text.append(rng.choice(WORK_MODE))
+        rows.append({'company': f"Company {i % 500}", 'title': 'Product Manager', 'description': ' '.join(text),
+                     'location': rng.choice(sc.INDIAN_CITIES), 'date': rng.choice(DATES)})
+    return pd.DataFrame(rows)
+
+def per_row(raw, convert, experience, location):
+    return [{'Company': r['company'], 'Role': r['title'], 'Location': location(r['description'], r['location']),
+             'Experience': experience(r['description']), 'Posted Date': convert(r['date']), 'Source Portal': 'LinkedIn'}
+            for r in raw.to_dict('records')]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+
+    today = date.today()
+    rows = []
+    for n in args.rows:
+        raw = synthetic_raw_jobs(n)
+        runs = [
+            ('old per-row helpers', lambda: per_row(raw, legacy_convert_date, legacy_extract_experience, legacy_extract_location)),
+            ('single-job helpers', lambda: per_row(raw, lambda d: sc.convert_date(d, today), sc.extract_experience_from_description,
+                                                   sc.extract_detailed_location)),
+            ('enrich_jobs_df', lambda: sc.enrich_jobs_df(raw, 'LinkedIn', today)),
+        ]
+        base = None
+        for name, run in runs:
+            sc._parse_date_text.cache_clear()
+            seconds, _ = best_of(run, args.repeat)
+            base = base or seconds
+            rows.append({'rows': n, 'path': name, 'seconds': f"{seconds:.2f}", 'us per row': f"{seconds / n * 1e6:.1f}",
+                         'speed-up': f"{base / seconds:.1f}x"})
+    print_table(rows)
+
+if __name__ == '__main__':
+    main()
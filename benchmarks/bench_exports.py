@@ -0,0 +1,107 @@
+"""Cost of the "Download Database" expander on a 100k-row SQLite store: the old rerun path (read every job and
+build an .xlsx in memory on every rerun) against exports.export_path, which reads SQLite in chunks and writes
+straight to disk, and a repeat download of the cached file. Runs offline:
+
+    python -m benchmarks.bench_exports [--rows 100000] [--formats xlsx csv parquet]
+
+Each case runs in a fresh process and reports its peak RSS above the RSS it started from, read from /proc on
+Linux. tracemalloc would miss the pyarrow buffers behind pandas string columns and slows the xlsx writer several
+times over, so it is only the fallback elsewhere.
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+import database as db
+import exports
+from benchmarks.common import peak_memory, print_table
+from benchmarks.fake_sheet import HEADER, make_jobs
+
+def legacy_rerun(store):
+    """What every rerun of the app did before exports: the whole table as a DataFrame, then an in-memory .xlsx."""
+    all_jobs_df = store.get_all_jobs_df()
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        all_jobs_df.to_excel(writer, index=False, sheet_name='Jobs')
+    return output.getvalue()
+
+def whole_frame_export(store, fmt, export_dir):
+    """The export writers fed one DataFrame of every job, as they were before SQLite was read in chunks."""
+    path = os.path.join(export_dir, f"whole.{fmt}")
+    exports.WRITERS[fmt]([store.get_all_jobs_df()], path)
+    return path
+
+def cached_download(store, fmt, export_dir):
+    """export_bytes with the export already built: the repeat download of unchanged data."""
+    with open(exports.export_path(store, fmt, export_dir), 'rb') as f:
+        return f.read()
+
+CASES = {
+    'old rerun (every rerun)': lambda store, fmt, export_dir: legacy_rerun(store),
+    'export, whole DataFrame': whole_frame_export,
+    'export, chunked read': lambda store, fmt, export_dir: exports.export_path(store, fmt, export_dir),
+    'repeat download (cached)': cached_download,
+}
+
+def _memory_mb():
+    """(current RSS, peak RSS) of this process in MB, from /proc/self/status."""
+    with open('/proc/self/status') as f:
+        fields = dict(line.split(':', 1) for line in f)
+    return int(fields['VmRSS'].split()[0]) / 1024, int(fields['VmHWM'].split()[0]) / 1024
+
+def _reset_peak_rss():
+    # Writing 5 to clear_refs resets VmHWM to the current RSS (Linux 4.0+)
+    with open('/proc/self/clear_refs', 'w') as f:
+        f.write('5')
+
+def run_case(case, fmt, db_path, export_dir, results):
+    store = db.SQLiteStore(db_path)
+    if case == 'repeat download (cached)':
+        exports.export_path(store, fmt, export_dir)
+    try:
+        _reset_peak_rss()
+        before, _ = _memory_mb()
+    except OSError:
+        seconds, peak, _ = peak_memory(lambda: CASES[case](store, fmt, export_dir))
+        results.put({'seconds': seconds, 'peak_mb': peak / 2 ** 20})
+        return
+    started = time.perf_counter()
+    CASES[case](store, fmt, export_dir)
+    seconds = time.perf_counter() - started
+    results.put({'seconds': seconds, 'peak_mb': _memory_mb()[1] - before})
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--formats', nargs='+', default=exports.available_formats())
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'jobs.db')
+        started = time.perf_counter()
+        db.SQLiteStore(db_path).add_jobs_df(pd.DataFrame(make_jobs(args.rows), columns=HEADER))
+        print(f"Loaded {args.rows} jobs into SQLite in {time.perf_counter() - started:.1f}s")
+        for fmt in args.formats:
+            for case in CASES:
+                if case.startswith('old') and fmt != 'xlsx':
+                    continue
+                export_dir = tempfile.mkdtemp(dir=tmp)
+                results = context.Queue()
+                worker = context.Process(target=run_case, args=(case, fmt, db_path, export_dir, results))
+                worker.start()
+                result = results.get()
+                worker.join()
+                rows.append({'format': fmt, 'path': case, 'seconds': round(result['seconds'], 2),
+                             'peak memory MB': round(result['peak_mb'], 1)})
+    print_table(rows)
+    print("Reruns that do not download do no export work at all now; the old path paid its cost on every rerun.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Wall-clock of an IIMJobs scrape: one browser per category, one after another (the path the shared
+browser replaced), against one shared browser with a pool of pages and heavy requests blocked.
+
+Runs offline against benchmarks.fixture_site and needs Playwright's Chromium:
+
+    python -m benchmarks.bench_iimjobs_browser [--categories 8] [--concurrency 4] [--scrolls 2]
+"""
+import argparse
+import time
+
+from playwright.sync_api import sync_playwright
+
+import scraper as sc
+from iimjobs_parser import parse_cards_bs4
+from benchmarks.common import print_table, require_chromium
+from benchmarks.fixture_site import FixtureSite
+
+def sequential_scrape(categories, scroll_times, scroll_sleep):
+    """The old engine: a fresh Chromium per category, fixed sleeps between scrolls, BeautifulSoup parsing."""
+    jobs = []
+    for url, _ in categories:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            page = browser.new_page()
+            page.goto(url, timeout=60000)
+            for _ in range(scroll_times):
+                page.evaluate("window.scrollBy(0, document.body.scrollHeight);")
+                time.sleep(scroll_sleep)
+            jobs.extend(sc.iimjobs_card_to_job(card) for card in parse_cards_bs4(page.content()))
+            browser.close()
+    return jobs
+
+def shared_scrape(categories, scroll_times, concurrency):
+    return sc.scrape_iimjobs_categories(categories, scroll_times=scroll_times, max_concurrency=concurrency, snapshots=None)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--categories', type=int, default=8)
+    parser.add_argument('--cards', type=int, default=60)
+    parser.add_argument('--scrolls', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, default=sc.IIM_MAX_CONCURRENCY)
+    parser.add_argument('--load-delay', type=float, default=0.3, help="Seconds the fixture takes to answer a scroll")
+    parser.add_argument('--scroll-sleep', type=float, default=2.0, help="Fixed sleep per scroll in the sequential path")
+    args = parser.parse_args()
+    require_chromium()
+
+    with FixtureSite(categories=args.categories, cards=args.cards, load_delay=args.load_delay) as site:
+        rows = []
+        for name, run in (
+            ('sequential, browser per category', lambda: sequential_scrape(site.categories, args.scrolls, args.scroll_sleep)),
+            (f'shared browser, {args.concurrency} pages', lambda: shared_scrape(site.categories, args.scrolls, args.concurrency)),
+        ):
+            site.requests.clear()
+            started = time.perf_counter()
+            jobs = run()
+            rows.append({'engine': name, 'seconds': round(time.perf_counter() - started, 2), 'jobs': len(jobs),
+                         'images loaded': site.requests['image'], 'scroll loads': site.requests['api']})
+    for row in rows:
+        row['speed-up'] = f"{rows[0]['seconds'] / max(row['seconds'], 1e-9):.1f}x"
+    print_table(rows)
+
+if __name__ == '__main__':
+    main()
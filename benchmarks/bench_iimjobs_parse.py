@@ -0,0 +1,64 @@
+"""Parse time of an IIMJobs listing page: the old select()-per-field BeautifulSoup loop, the one-pass
+BeautifulSoup fallback and the lxml parser, on the saved fixture page and on generated pages.
+Every parser's job rows are checked field for field against the old loop's.
+
+    python -m benchmarks.bench_iimjobs_parse [--cards 60 500 2000]
+"""
+import argparse
+import os
+
+from bs4 import BeautifulSoup
+
+import scraper as sc
+from iimjobs_parser import parse_cards_bs4, parse_cards_lxml
+from benchmarks.common import best_of, print_table
+from benchmarks.fixture_site import FixtureSite
+
+SAVED_PAGE = os.path.join(os.path.dirname(__file__), os.pardir, 'tests', 'fixtures', 'iimjobs_listing.html')
+
+def legacy_parse(html):
+    """The loop scrape_iimjobs_page used: a :has() selector, then select_one twice per field."""
+    jobs = []
+    soup = BeautifulSoup(html, "html.parser")
+    for card in soup.select('div.MuiPaper-root:has(p[data-testid="job_title"])'):
+        title_tag = card.select_one('p[data-testid="job_title"]')
+        full_title = title_tag.get_text(strip=True) if title_tag else ''
+        company, role = (parts[0].strip(), parts[1].strip()) if " - " in full_title and len(parts := full_title.split(" - ", 1)) >= 2 else (None, full_title)
+        jobs.append({
+            'Company': company, 'Role': role,
+            'Location': card.select_one('p[data-testid="job_location"]').get_text(strip=True) if card.select_one('p[data-testid="job_location"]') else '',
+            'Experience': card.select_one('span[data-testid="job_experience"]').get_text(strip=True) if card.select_one('span[data-testid="job_experience"]') else '',
+            'Posted Date': sc.convert_date(card.select_one('span[data-testid="date_posted"]').get_text(strip=True) if card.select_one('span[data-testid="date_posted"]') else ''),
+            'Source Portal': 'IIMJobs'
+        })
+    return jobs
+
+def pages(card_counts):
+    with open(SAVED_PAGE, encoding='utf-8') as f:
+        yield 'saved listing', f.read()
+    for count in card_counts:
+        site = FixtureSite(categories=1, cards=count, first_batch=count)
+        yield f"fixture, {count} cards", site.page(next(iter(site.slugs)))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--cards', type=int, nargs='+', default=[60, 500, 2000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for name, html in pages(args.cards):
+        legacy_seconds, legacy_jobs = best_of(lambda: legacy_parse(html), args.repeat)
+        row = {'page': name, 'old ms': round(legacy_seconds * 1000, 1), 'old jobs': len(legacy_jobs)}
+        for label, parse in (('bs4', parse_cards_bs4), ('lxml', parse_cards_lxml)):
+            seconds, cards = best_of(lambda: parse(html), args.repeat)
+            jobs = [sc.iimjobs_card_to_job(card) for card in cards]
+            row[f'{label} ms'] = round(seconds * 1000, 1)
+            row[f'{label} speed-up'] = f"{legacy_seconds / max(seconds, 1e-9):.0f}x"
+            row[f'{label} matches old'] = 'yes' if jobs == legacy_jobs else f"no ({len(jobs)} jobs)"
+        rows.append(row)
+    print_table(rows)
+    print("The old loop also returned an outer paper wrapping a card as a second job; the saved page has one such card.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""End-to-end broad scrape, offline: LinkedIn from a fake scraper, IIMJobs from benchmarks.fixture_site, saved
+into a GSheetStore on a fake worksheet that already holds jobs, all through the JobRunner the app uses.
+Prints the run report's stage table and counters, and can save the report JSON to compare runs over time:
+
+    python -m benchmarks.bench_pipeline [--linkedin-limit 100] [--existing 20000] [--report run.json]
+
+The IIMJobs stage needs Playwright's Chromium; without it that stage is skipped and the rest still runs.
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from contextlib import ExitStack
+from unittest import mock
+
+import database as db
+import scraper as sc
+import setup
+from job_runner import JobRunner
+from benchmarks.common import print_table
+from benchmarks.fake_linkedin import FakeLinkedinScraper
+from benchmarks.fake_sheet import HEADER, FakeWorksheet, make_jobs
+from benchmarks.fixture_site import FixtureSite
+
+def run_pipeline(args, categories):
+    """Runs one broad scrape job to completion; returns (job, worksheet)."""
+    sheet = FakeWorksheet([HEADER] + make_jobs(args.existing))
+    store = db.GSheetStore(sheet)
+    # Load the mirror and indexes first, as a running app would have
+    store.get_all_jobs_df()
+    runner = JobRunner(checkpoint_dir=None)
+    fake = lambda: FakeLinkedinScraper(jobs_per_query=args.jobs_per_query, delay=args.job_delay)
+    with mock.patch.object(sc, '_linkedin_scraper_factory', lambda snapshots, replay: fake), \
+         mock.patch.object(sc, 'IIM_CATEGORIES', categories):
+        job = runner.submit('broad', {'bench': time.time()},
+                            lambda job: sc.iter_broad_jobs(args.linkedin_limit, args.scrolls, progress=True, watermarks=None),
+                            store.add_jobs_df)
+        while not job.finished:
+            time.sleep(0.05)
+    return job, sheet
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--linkedin-limit', type=int, default=100)
+    parser.add_argument('--jobs-per-query', type=int, default=60)
+    parser.add_argument('--job-delay', type=float, default=0.002, help="Seconds the fake LinkedIn scraper takes per job")
+    parser.add_argument('--categories', type=int, default=8)
+    parser.add_argument('--cards', type=int, default=60)
+    parser.add_argument('--scrolls', type=int, default=2)
+    parser.add_argument('--existing', type=int, default=20000, help="Jobs already in the fake sheet")
+    parser.add_argument('--report', help="Write the run report JSON here")
+    args = parser.parse_args()
+    random.seed(0)
+
+    report_path = os.path.abspath(args.report) if args.report else None
+    with ExitStack() as stack:
+        # Caches, query stats and snapshots all live under the working directory; keep them out of the repo's
+        os.chdir(stack.enter_context(tempfile.TemporaryDirectory()))
+        if setup.chromium_installed():
+            site = stack.enter_context(FixtureSite(categories=args.categories, cards=args.cards))
+            categories = site.categories
+        else:
+            print("Chromium for Playwright is not installed; skipping the IIMJobs stage.")
+            categories = []
+        job, sheet = run_pipeline(args, categories)
+
+    progress, report = job.progress(), job.report.to_dict()
+    print(f"{progress['status']} in {report['seconds']:.2f}s: {progress['jobs_found']} jobs found, {progress['jobs_added']} added"
+          + (f" ({progress['error']})" if progress['error'] else ''))
+    print_table(job.report.stage_table())
+    print()
+    print_table([{'counter': name, 'value': value} for name, value in sorted(report['counters'].items())])
+    print(f"\nSheet calls: {dict(sheet.calls)}")
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1, default=str)
+        print(f"Report written to {report_path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Query latency of search_jobs on a 100k+ row sheet: the old full scan (str.contains on Role and Location,
+pd.to_datetime on every query) against the search index. Runs offline against benchmarks.fake_sheet:
+
+    python -m benchmarks.bench_search [--rows 100000 300000]
+"""
+import argparse
+import tempfile
+from datetime import date
+
+import pandas as pd
+
+import database as db
+from benchmarks.common import best_of, print_table
+from benchmarks.fake_sheet import HEADER, FakeWorksheet, make_jobs
+
+QUERIES = [
+    ('role', {'role': 'product', 'location': ''}),
+    ('role + location', {'role': 'analyst', 'location': 'mumbai'}),
+    ('another role + location', {'role': 'counsel', 'location': 'pune'}),
+    ('date range', {'role': '', 'location': '', 'start_date': date(2025, 3, 1), 'end_date': date(2025, 3, 31)}),
+    ('everything', {'role': 'manager', 'location': 'bangalore', 'start_date': date(2025, 1, 1), 'end_date': date(2025, 6, 30)}),
+]
+
+def legacy_search_jobs(df, role, location, start_date=None, end_date=None):
+    """The search_jobs the index replaced, given the already-downloaded sheet."""
+    if role:
+        df = df[df['Role'].str.contains(role, case=False, na=False)]
+    if location:
+        df = df[df['Location'].str.contains(location, case=False, na=False)]
+    if start_date and end_date and 'Posted Date' in df.columns:
+        df = df.copy()
+        df['Posted Date'] = pd.to_datetime(df['Posted Date'], errors='coerce')
+        df = df.dropna(subset=['Posted Date'])
+        mask = (df['Posted Date'] >= pd.to_datetime(start_date)) & (df['Posted Date'] <= pd.to_datetime(end_date))
+        df = df.loc[mask]
+    return df
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100000, 300000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        db.CACHE_DIR = cache_dir
+        for i, n in enumerate(args.rows):
+            values = [HEADER] + make_jobs(n)
+            sheet = FakeWorksheet(values, id=i)
+            build, _ = best_of(lambda: db.search_jobs(sheet, '', ''), 1)
+            rows.append({'rows': n, 'query': 'first search (builds the index)', 'old scan ms': '', 'index ms': round(build * 1000, 1),
+                         'speed-up': '', 'old hits': '', 'index hits': ''})
+            downloaded = pd.DataFrame(values[1:], columns=HEADER)
+            for name, query in QUERIES:
+                old_seconds, old = best_of(lambda: legacy_search_jobs(downloaded, **query), args.repeat)
+                new_seconds, new = best_of(lambda: db.search_jobs(sheet, **query), args.repeat)
+                rows.append({'rows': n, 'query': name, 'old scan ms': round(old_seconds * 1000, 1), 'index ms': round(new_seconds * 1000, 1),
+                             'speed-up': f"{old_seconds / max(new_seconds, 1e-9):.0f}x", 'old hits': len(old), 'index hits': len(new)})
+    print_table(rows)
+    print("The old scan let pd.to_datetime guess the date format per query, so its date hits can differ; the index reads dd-mm-YYYY.")
+
+if __name__ == '__main__':
+    main()
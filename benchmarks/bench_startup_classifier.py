@@ -0,0 +1,68 @@
+"""Startup classification of synthetic LinkedIn-length descriptions: the old substring loops against the
+whole-word matcher, one job at a time (is_startup_company) and column-wise (classify_startups).
+
+    python -m benchmarks.bench_startup_classifier [--jobs 10000] [--words 450]
+"""
+import argparse
+import random
+
+import pandas as pd
+
+from scraper import STARTUP_INDICATORS, EXCLUDE_LARGE_COMPANIES, is_startup_company, classify_startups
+from benchmarks.common import best_of, print_table
+
+FILLER = ('we are looking for a product minded engineer to join our team and own the roadmap for payments '
+          'you will work with design data and operations to ship features customers love experience with '
+          'python sql and cloud platforms is a plus strong communication skills and ownership are essential').split()
+COMPANIES = ['Kiranapay', 'Orbitly Labs', 'Stackwise', 'Quillbyte', 'Nimbus Health', 'Infosys', 'Heyday Foods', 'Tata Digital']
+
+def legacy_is_startup_company(company_name, description=""):
+    """is_startup_company before the whole-word matcher: substring loops over both lists."""
+    if not company_name: return False
+    company_lower = company_name.lower()
+    desc_lower = description.lower() if description else ""
+    for large_company in EXCLUDE_LARGE_COMPANIES:
+        if large_company in company_lower: return False
+    for indicator in STARTUP_INDICATORS:
+        if indicator in company_lower or indicator in desc_lower: return True
+    return False
+
+def synthetic_jobs(n, words, seed=0):
+    """n jobs whose descriptions are about `words` words long; roughly a fifth mention a startup indicator."""
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(n):
+        text = [rng.choice(FILLER) for _ in range(words)]
+        if rng.random() < 0.2:
+            text.insert(rng.randrange(len(text)), rng.choice(STARTUP_INDICATORS))
+        jobs.append({'Company': rng.choice(COMPANIES), 'Description': ' '.join(text)})
+    return pd.DataFrame(jobs)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--jobs', type=int, default=10000)
+    parser.add_argument('--words', type=int, default=450, help="Description length; LinkedIn's are typically 300-600 words")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = synthetic_jobs(args.jobs, args.words)
+    pairs = list(zip(df['Company'], df['Description']))
+    print(f"{len(df)} jobs, {int(df['Description'].str.len().mean())} characters per description on average")
+    runs = [
+        ('substring loops (old)', lambda: [legacy_is_startup_company(c, d) for c, d in pairs]),
+        ('whole words, is_startup_company', lambda: [is_startup_company(c, d) for c, d in pairs]),
+        ('whole words, classify_startups', lambda: classify_startups(df).tolist()),
+    ]
+    rows, legacy = [], None
+    for name, run in runs:
+        seconds, result = best_of(run, args.repeat)
+        legacy = legacy if legacy is not None else result
+        rows.append({'classifier': name, 'seconds': f"{seconds:.3f}", 'us per job': f"{seconds / len(df) * 1e6:.1f}",
+                     'startups': sum(result), 'differs from old': sum(a != b for a, b in zip(result, legacy))})
+    base = float(rows[0]['seconds'])
+    for row in rows:
+        row['speed-up'] = f"{base / max(float(row['seconds']), 1e-9):.1f}x"
+    print_table(rows)
+
+if __name__ == '__main__':
+    main()
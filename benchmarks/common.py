@@ -0,0 +1,43 @@
+"""Small helpers shared by the benchmark scripts."""
+import sys
+import time
+import tracemalloc
+
+def best_of(fn, repeat=3):
+    """Runs fn repeat times; returns (fastest wall-clock seconds, result of the last run)."""
+    best, result = None, None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def peak_memory(fn):
+    """Runs fn once under tracemalloc; returns (seconds, peak bytes allocated, result)."""
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak, result
+
+def print_table(rows):
+    """Prints a list of dicts as an aligned text table, columns in the order of the first row."""
+    if not rows:
+        return
+    columns = list(rows[0])
+    cells = [[str(row.get(col, '')) for col in columns] for row in rows]
+    widths = [max(len(col), *(len(r[i]) for r in cells)) for i, col in enumerate(columns)]
+    print('  '.join(col.ljust(w) for col, w in zip(columns, widths)))
+    for r in cells:
+        print('  '.join(cell.ljust(w) for cell, w in zip(r, widths)))
+
+def require_chromium():
+    """Exits with a hint when the Chromium build Playwright needs is not installed."""
+    from setup import chromium_installed
+    if not chromium_installed():
+        sys.exit("Chromium for Playwright is not installed; run `python -m playwright install chromium` first.")
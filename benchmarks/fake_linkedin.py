@@ -0,0 +1,52 @@
+"""Stand-in for linkedin_jobs_scraper.LinkedinScraper that emits made-up jobs, for offline benchmarks.
+
+Like the real scraper it calls back from a thread of its own, one job at a time, up to each query's limit.
+"""
+import random
+import threading
+import time
+import zlib
+
+from linkedin_jobs_scraper.events import EventData, Events
+
+from benchmarks.fixture_site import COMPANIES
+
+STARTUP_BLURBS = ['We are a seed-funded startup building', 'Our Series A fintech is growing', 'Join an early-stage team working on']
+CORPORATE_BLURBS = ['A global leader in IT services with offices in', 'Our Fortune 500 client is hiring for']
+FILLER = ('you will own the roadmap and work with design data and operations to ship features customers love '
+          'experience with python sql and cloud platforms is a plus').split()
+
+class FakeLinkedinScraper:
+    """Emits up to `jobs_per_query` jobs per query (capped by the query's limit), `delay` seconds apart."""
+
+    def __init__(self, jobs_per_query=60, delay=0.0, words=300):
+        self.jobs_per_query = jobs_per_query
+        self.delay = delay
+        self.words = words
+        self.callbacks = {}
+
+    def on(self, event, callback):
+        self.callbacks[event] = callback
+
+    def run(self, queries):
+        for query in queries:
+            worker = threading.Thread(target=self._emit, args=(query,), name="fake-linkedin")
+            worker.start()
+            worker.join()
+
+    def _emit(self, query):
+        callback = self.callbacks.get(Events.DATA)
+        location = (query.options.locations or ['Worldwide'])[0]
+        rng = random.Random(f"{query.query}|{location}")
+        for i in range(min(self.jobs_per_query, query.options.limit or self.jobs_per_query)):
+            if self.delay:
+                time.sleep(self.delay)
+            startup = rng.random() < 0.6
+            blurb = rng.choice(STARTUP_BLURBS if startup else CORPORATE_BLURBS)
+            description = ' '.join([blurb, location + '.', f"{rng.randint(1, 5)} to {rng.randint(6, 10)} years.",
+                                    rng.choice(['Fully remote.', 'Hybrid.', ''])] + rng.choices(FILLER, k=self.words))
+            callback(EventData(
+                query=query.query, location=location, job_id=f"{zlib.crc32(f'{query.query}|{location}'.encode()) % 10 ** 6}{i:04d}",
+                title=f"{query.query.split()[0].title()} Manager {i}", company=f"{rng.choice(COMPANIES)} {i}",
+                description=description, date=f"2026-03-{rng.randint(1, 28):02d}"
+            ))
@@ -0,0 +1,63 @@
+"""In-memory stand-in for the gspread worksheet behind the "All Jobs" tab, for offline benchmarks and tests.
+
+FakeWorksheet answers the calls database.py makes (batch_get, get_all_values, row_values, append_rows),
+counts them, and can be told to fail the next append_rows calls with given exceptions.
+"""
+import random
+import re
+from collections import Counter
+
+from benchmarks.fixture_site import COMPANIES, ROLES, CITIES
+
+HEADER = ['Company', 'Role', 'Location', 'Experience', 'Posted Date', 'Source Portal']
+LOCATIONS = CITIES + ['Remote', 'Bengaluru', 'Hybrid (Pune)']
+
+def make_jobs(count, seed=0, prefix='Co'):
+    """Deterministic sheet rows (lists in HEADER order) for `count` distinct jobs."""
+    rng = random.Random(seed)
+    return [[
+        f"{prefix} {i} {rng.choice(COMPANIES)}", rng.choice(ROLES), rng.choice(LOCATIONS),
+        f"{rng.randint(0, 8)}-{rng.randint(9, 15)} years",
+        f"{rng.randint(1, 28):02d}-{rng.randint(1, 12):02d}-{rng.choice([2024, 2025, 2026])}",
+        rng.choice(['LinkedIn', 'IIMJobs', 'File Upload'])
+    ] for i in range(count)]
+
+class FakeWorksheet:
+    """A worksheet holding `values` (header row first); `calls` counts API calls by method name."""
+
+    def __init__(self, values=None, id=0, spreadsheet_id='fake-sheet'):
+        self.values = [list(row) for row in (values if values is not None else [HEADER])]
+        self.id = id
+        self.spreadsheet_id = spreadsheet_id
+        self.calls = Counter()
+        self.failures = []
+
+    def fail_next(self, *errors):
+        """Makes the next append_rows calls raise these exceptions, one per call (None lets a call through)."""
+        self.failures.extend(errors)
+
+    def batch_get(self, ranges):
+        self.calls['batch_get'] += 1
+        return [self._range(a1) for a1 in ranges]
+
+    def get_all_values(self):
+        self.calls['get_all_values'] += 1
+        return [list(row) for row in self.values]
+
+    def row_values(self, row):
+        self.calls['row_values'] += 1
+        return list(self.values[row - 1]) if len(self.values) >= row else []
+
+    def append_rows(self, rows, value_input_option=None):
+        self.calls['append_rows'] += 1
+        if self.failures:
+            error = self.failures.pop(0)
+            if error is not None:
+                raise error
+        self.values.extend([str(v) for v in row] for row in rows)
+
+    def _range(self, a1):
+        if a1 == '1:1':
+            return [list(self.values[0])] if self.values else []
+        start = int(re.match(r'A(\d+):', a1).group(1))
+        return [list(row) for row in self.values[start - 1:]]
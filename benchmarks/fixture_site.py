@@ -0,0 +1,170 @@
+"""Local stand-in for IIMJobs category listings, served over HTTP for offline benchmarks and tests.
+
+Each category page renders its first cards in the HTML and fetches more from /api/<slug> when the
+window is scrolled, after a configurable delay, like the real infinite-scroll listings. Every card
+carries a logo image that is also served slowly, so blocking images makes a measurable difference.
+"""
+import re
+import json
+import random
+import threading
+import time
+from collections import Counter
+from html import escape
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+CATEGORY_NAMES = ['Banking & Finance', 'Sales & Marketing', 'Consulting', 'HR', 'IT & Systems', 'SCM & Operations', 'Legal', 'BPO']
+COMPANIES = ['Zenfold Capital', 'Kiranapay', 'Orbitly Labs', 'Tata Digital', 'Stackwise', 'Farmlink Agritech',
+             'Accenture', 'Quillbyte', 'Nimbus Health', 'Ledgerline Fintech']
+ROLES = ['Product Manager', 'Senior Analyst - Credit Risk', 'Growth Marketing Lead', 'Founder\'s Office Associate',
+         'HR Business Partner', 'Supply Chain Manager', 'Legal Counsel', 'Data Engineer']
+CITIES = ['Bangalore', 'Mumbai', 'Gurgaon/Gurugram', 'Delhi NCR', 'Pune', 'Hyderabad', 'Chennai']
+POSTED = ['Posted today', '1 day ago', '2 days ago', '5 days ago', '1 week ago', '3 weeks ago']
+LOGO_PNG = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+    '1f15c4890000000d49444154789c6360000002000100e221bc330000000049454e44ae426082'
+)
+
+def make_cards(slug, count, seed=0):
+    """Deterministic raw cards for a category, newest first, with the fields iimjobs_parser returns."""
+    rng = random.Random(f"{slug}-{seed}")
+    base_id = 1000000 + 10000 * (sum(map(ord, slug)) % 500)
+    cards = []
+    for i in range(count):
+        company, role = rng.choice(COMPANIES), rng.choice(ROLES)
+        job_id = str(base_id + count - i)
+        href = f"/j/{slug}-{role.lower().replace(' ', '-').replace(chr(39), '')}-{job_id}.html"
+        cards.append({
+            'title': f"{company} - {role}", 'location': rng.choice(CITIES),
+            'experience': f"{rng.randint(0, 6)} - {rng.randint(7, 15)} yrs",
+            'posted': POSTED[min(len(POSTED) - 1, i * len(POSTED) // max(1, count))],
+            'href': href, 'job_id': job_id
+        })
+    return cards
+
+def card_html(card):
+    """One job card in the markup IIMJobs renders (MUI paper, fields tagged with data-testid)."""
+    return (
+        '<div class="MuiPaper-root MuiPaper-elevation MuiPaper-rounded MuiPaper-elevation1 MuiCard-root css-1u5ei8k">'
+        f'<a class="css-3x7eps" href="{escape(card["href"])}">'
+        '<div class="MuiBox-root css-1k9ek97">'
+        f'<img class="css-logo" src="/logo/{escape(card["job_id"])}.png" alt="" width="48" height="48">'
+        f'<p class="MuiTypography-root MuiTypography-body1 css-1kq8fo8" data-testid="job_title">{escape(card["title"])}</p>'
+        '<div class="MuiBox-root css-70qvj9">'
+        f'<span class="MuiTypography-root css-1hw9yfs" data-testid="job_experience">{escape(card["experience"])}</span>'
+        f'<p class="MuiTypography-root MuiTypography-body2 css-15w6cn0" data-testid="job_location"> {escape(card["location"])} </p>'
+        '</div>'
+        f'<span class="MuiTypography-root MuiTypography-caption css-ozqkjr" data-testid="date_posted">{escape(card["posted"])}</span>'
+        '</div></a></div>'
+    )
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title} Jobs</title>
+<style>.MuiPaper-root {{ min-height: 220px; margin: 12px; border: 1px solid #ddd; }}</style>
+</head><body>
+<div class="MuiPaper-root css-header"><h1>{title} Jobs</h1></div>
+<div id="jobs">{cards}</div>
+<script>
+const slug = {slug}, total = {total}, batch = {batch};
+let offset = {first}, loading = false;
+window.addEventListener('scroll', async () => {{
+    if (loading || offset >= total) return;
+    loading = true;
+    const response = await fetch(`/api/${{slug}}?offset=${{offset}}`);
+    document.getElementById('jobs').insertAdjacentHTML('beforeend', await response.text());
+    offset += batch;
+    loading = false;
+}});
+</script>
+</body></html>
+"""
+
+class FixtureSite:
+    """Threaded HTTP server with `categories` listings of `cards` jobs each; use as a context manager.
+
+    first_batch cards are in the page itself, then each scroll loads batch_size more after load_delay
+    seconds. Logos take image_delay seconds each. requests counts what was served, by kind.
+    """
+
+    def __init__(self, categories=8, cards=60, first_batch=20, batch_size=20, load_delay=0.3, image_delay=0.05, seed=0):
+        self.first_batch = first_batch
+        self.batch_size = batch_size
+        self.load_delay = load_delay
+        self.image_delay = image_delay
+        names = [CATEGORY_NAMES[i % len(CATEGORY_NAMES)] + (f" {i // len(CATEGORY_NAMES) + 1}" if i >= len(CATEGORY_NAMES) else '')
+                 for i in range(categories)]
+        self.slugs = {self._slug(name): name for name in names}
+        self.listings = {slug: make_cards(slug, cards, seed) for slug in self.slugs}
+        self.requests = Counter()
+        self.lock = threading.Lock()
+        self.server = None
+
+    @staticmethod
+    def _slug(name):
+        return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-') + '-jobs'
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def categories(self):
+        """(url, category) pairs in the shape of scraper.IIM_CATEGORIES."""
+        return [(f"{self.base_url}/c/{slug}", name) for slug, name in self.slugs.items()]
+
+    def page(self, slug):
+        cards = self.listings[slug]
+        return PAGE_TEMPLATE.format(
+            title=escape(self.slugs[slug]), cards=''.join(card_html(c) for c in cards[:self.first_batch]),
+            slug=json.dumps(slug), total=len(cards), batch=self.batch_size, first=self.first_batch
+        )
+
+    def batch(self, slug, offset):
+        return ''.join(card_html(c) for c in self.listings[slug][offset:offset + self.batch_size])
+
+    def __enter__(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                parts = url.path.strip('/').split('/')
+                if len(parts) == 2 and parts[0] == 'c' and parts[1] in site.listings:
+                    site._count('page')
+                    self._send(site.page(parts[1]).encode('utf-8'), 'text/html; charset=utf-8')
+                elif len(parts) == 2 and parts[0] == 'api' and parts[1] in site.listings:
+                    site._count('api')
+                    time.sleep(site.load_delay)
+                    offset = int(parse_qs(url.query).get('offset', ['0'])[0])
+                    self._send(site.batch(parts[1], offset).encode('utf-8'), 'text/html; charset=utf-8')
+                elif len(parts) == 2 and parts[0] == 'logo':
+                    site._count('image')
+                    time.sleep(site.image_delay)
+                    self._send(LOGO_PNG, 'image/png')
+                else:
+                    self.send_error(404)
+
+            def _send(self, body, content_type):
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="fixture-site", daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _count(self, kind):
+        with self.lock:
+            self.requests[kind] += 1
@@ -0,0 +1,149 @@
+import os
+import json
+import time
+import hashlib
+import threading
+import pandas as pd
+
+from database import JOB_COLUMNS, _title_columns
+from instrumentation import span, count
+
+IMPORT_CHUNK_ROWS = 5000
+IMPORT_LEDGER_PATH = os.path.join('.cache', 'import_ledger.json')
+REQUIRED_COLUMNS = ['Company', 'Role']
+# Common header spellings in uploaded files, after title-casing
+COLUMN_ALIASES = {
+    'Company Name': 'Company', 'Title': 'Role', 'Job Title': 'Role', 'Position': 'Role',
+    'City': 'Location', 'Posted': 'Posted Date', 'Date Posted': 'Posted Date', 'Date': 'Posted Date',
+    'Source': 'Source Portal', 'Portal': 'Source Portal'
+}
+
+class ImportLedger:
+    """Digests of files already imported into a store, so uploading the same file again does nothing."""
+
+    def __init__(self, path=IMPORT_LEDGER_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except Exception as e:
+                print(f"Ignoring unreadable import ledger at {path}: {e}")
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def record(self, key, entry):
+        with self.lock:
+            self.entries[key] = entry
+            if not self.path:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                tmp_path = self.path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.entries, f, indent=1)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                print(f"Failed to save import ledger to {self.path}: {e}")
+
+def file_digest(fileobj, block_size=1 << 20):
+    """SHA-256 of a binary file object, read in blocks; leaves it rewound."""
+    fileobj.seek(0)
+    digest = hashlib.sha256()
+    while block := fileobj.read(block_size):
+        digest.update(block)
+    fileobj.seek(0)
+    return digest.hexdigest()
+
+def _file_size(fileobj):
+    position = fileobj.seek(0, os.SEEK_END)
+    fileobj.seek(0)
+    return position
+
+def iter_csv_chunks(fileobj, chunk_rows=IMPORT_CHUNK_ROWS):
+    """Yields (DataFrame, fraction read) for a CSV, chunk_rows rows at a time."""
+    size = _file_size(fileobj) or 1
+    for chunk in pd.read_csv(fileobj, chunksize=chunk_rows, dtype=str, keep_default_na=False):
+        yield chunk, min(1.0, fileobj.tell() / size)
+
+def iter_excel_chunks(fileobj, chunk_rows=IMPORT_CHUNK_ROWS):
+    """Yields (DataFrame, fraction read) for the first sheet of an .xlsx, streaming rows in read-only mode."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        total = max(1, (sheet.max_row or 1) - 1)
+        rows = sheet.iter_rows(values_only=True)
+        header = [str(v) if v is not None else '' for v in next(rows, ())]
+        batch, done = [], 0
+        for row in rows:
+            values = ['' if v is None else v for v in row[:len(header)]]
+            batch.append(values + [''] * (len(header) - len(values)))
+            if len(batch) >= chunk_rows:
+                done += len(batch)
+                yield pd.DataFrame(batch, columns=header), min(1.0, done / total)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header), 1.0
+    finally:
+        workbook.close()
+
+def iter_file_chunks(fileobj, name, chunk_rows=IMPORT_CHUNK_ROWS):
+    extension = name.rsplit('.', 1)[-1].lower()
+    if extension == 'csv':
+        return iter_csv_chunks(fileobj, chunk_rows)
+    if extension == 'xlsx':
+        return iter_excel_chunks(fileobj, chunk_rows)
+    # Legacy .xls has no streaming reader; it is read whole and split
+    df = pd.read_excel(fileobj, dtype=str)
+    return ((df.iloc[start:start + chunk_rows], min(1.0, (start + chunk_rows) / max(1, len(df)))) for start in range(0, len(df), chunk_rows))
+
+def normalize_chunk(df):
+    """Renames known headers, checks the required ones are there and returns (job rows, rows dropped as invalid)."""
+    df = df.copy()
+    df.columns = [COLUMN_ALIASES.get(col, col) for col in _title_columns(df.columns)]
+    df = df.loc[:, ~df.columns.duplicated()]
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"The file is missing the column(s): {', '.join(missing)}")
+    for col in JOB_COLUMNS:
+        if col not in df.columns:
+            df[col] = ''
+    df = df[JOB_COLUMNS].fillna('').astype(str).apply(lambda col: col.str.strip())
+    valid = (df['Company'] != '') & (df['Role'] != '')
+    return df[valid].reset_index(drop=True), int((~valid).sum())
+
+def import_file(store, fileobj, name, ledger=None, on_progress=None, chunk_rows=IMPORT_CHUNK_ROWS):
+    """Streams an uploaded CSV/Excel file into the store chunk by chunk.
+
+    Returns {'status': 'imported' | 'duplicate', 'rows', 'added', 'invalid'}. A file whose contents were
+    imported into this kind of store before is skipped. on_progress(fraction, rows, added) follows each chunk.
+    If a chunk cannot be saved the store's StorageError propagates and the file is not recorded, so uploading
+    it again retries the whole file; chunks saved before the failure are deduplicated then.
+    """
+    ledger = ledger if ledger is not None else ImportLedger()
+    key = f"{type(store).__name__}:{file_digest(fileobj)}"
+    previous = ledger.get(key)
+    if previous:
+        return {'status': 'duplicate', **{k: previous[k] for k in ('rows', 'added', 'invalid')}}
+
+    rows = added = invalid = 0
+    for chunk, fraction in iter_file_chunks(fileobj, name, chunk_rows):
+        with span('import.chunk', rows=len(chunk)):
+            jobs_df, dropped = normalize_chunk(chunk)
+            rows += len(chunk)
+            invalid += dropped
+            if not jobs_df.empty:
+                added += store.add_jobs_df(jobs_df)
+        count('import.rows', len(chunk))
+        count('import.invalid', dropped)
+        if on_progress:
+            on_progress(fraction, rows, added)
+
+    result = {'rows': rows, 'added': added, 'invalid': invalid}
+    ledger.record(key, {'name': name, 'imported_at': time.time(), **result})
+    return {'status': 'imported', **result}
@@ -2,6 +2,35 @@ import streamlit as st
 import pandas as pd
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
+import os
+import json
+import re
+import hashlib
+import time
+import sqlite3
+import threading
+import queue
+import random
+import numpy as np
+from collections import defaultdict
+from contextlib import closing
+
+from instrumentation import span, count
+
+CACHE_DIR = '.cache'
+MIRROR_REFRESH_SECONDS = 30
+# Columns that identify a job; used to check the mirror and the sheet still line up.
+KEY_COLUMNS = ['Company', 'Role', 'Location']
+
+class StorageError(Exception):
+    """A store could not save jobs. Raised instead of returning 0, which would read as "nothing new"."""
+
+def _get_setting(name, default):
+    """Reads an optional key from st.secrets, falling back when it (or the secrets file) is missing."""
+    try:
+        return st.secrets.get(name, default)
+    except Exception:
+        return default
 
 # --- GOOGLE SHEETS CONNECTION ---
 @st.cache_resource
@@ -29,16 +58,512 @@ def connect_to_gsheet():
         st.error(f"Failed to connect to Google Sheets: {e}")
         return None
 
+def _title_columns(columns):
+    return [str(col).title().replace('_', ' ') for col in columns]
+
+# --- LOCAL SHEET MIRROR ---
+class SheetMirror:
+    """Local copy of the "All Jobs" tab, persisted to SQLite and refreshed by fetching only new rows."""
+
+    def __init__(self, worksheet, path=None, refresh_seconds=MIRROR_REFRESH_SECONDS):
+        self.worksheet = worksheet
+        self.path = path
+        self.refresh_seconds = refresh_seconds
+        self.header = []
+        self.rows = []
+        self.lock = threading.RLock()
+        self.resyncs = 0
+        self._checked_at = None
+        self._load()
+
+    @property
+    def row_count(self):
+        return len(self.rows)
+
+    def refresh(self, force=False):
+        """Brings the mirror up to date: one batch_get for the header and the rows past the last known one."""
+        with self.lock:
+            if not force and self._checked_at is not None and time.monotonic() - self._checked_at < self.refresh_seconds:
+                return
+            # Re-read the last known row too, so an edited or shrunk sheet shows up as a conflict.
+            start = self.row_count + 1 if self.rows else 2
+            with span('sheet.batch_get'):
+                header_range, tail = self.worksheet.batch_get(['1:1', f'A{start}:ZZ'])
+            header = header_range[0] if header_range else []
+            if header != self.header:
+                self._resync()
+            elif self.rows:
+                if not tail or not self._same_job(self._pad(tail[0]), self.rows[-1]):
+                    self._resync()
+                elif len(tail) > 1:
+                    self._extend([self._pad(row) for row in tail[1:]])
+            elif tail:
+                self._extend([self._pad(row) for row in tail])
+            self._checked_at = time.monotonic()
+
+    def data_version(self):
+        """Changes whenever the mirrored rows do: the row count plus a hash of the header and the last row."""
+        with self.lock:
+            tail = '\x1f'.join(self.header + (self.rows[-1] if self.rows else []))
+            return f"{self.row_count}-{hashlib.blake2b(tail.encode('utf-8'), digest_size=8).hexdigest()}"
+
+    def append_local(self, rows):
+        """Write-through for rows this process has just appended to the sheet."""
+        with self.lock:
+            self._extend([self._pad([str(v) for v in row]) for row in rows])
+
+    def to_df(self):
+        with self.lock:
+            return pd.DataFrame(self.rows, columns=self.header) if self.rows else pd.DataFrame()
+
+    def _resync(self):
+        with span('sheet.get_all_values'):
+            values = self.worksheet.get_all_values()
+        self.header = values[0] if values else []
+        self.rows = [self._pad(row) for row in values[1:]]
+        self.resyncs += 1
+        print(f"Full resync of sheet mirror ({self.row_count} rows).")
+        self._persist()
+
+    def _extend(self, rows):
+        start = self.row_count
+        self.rows.extend(rows)
+        self._persist(rows, start)
+
+    def _pad(self, row):
+        return list(row[:len(self.header)]) + [''] * (len(self.header) - len(row))
+
+    def _same_job(self, a, b):
+        keys = [self.header.index(col) for col in KEY_COLUMNS if col in self.header]
+        return [a[i] for i in keys] == [b[i] for i in keys] if keys else a == b
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with closing(sqlite3.connect(self.path)) as conn:
+                header = conn.execute("SELECT header FROM mirror_meta").fetchone()
+                rows = conn.execute("SELECT data FROM mirror_rows ORDER BY row_number").fetchall()
+            self.header = json.loads(header[0]) if header else []
+            self.rows = [json.loads(row[0]) for row in rows]
+        except Exception as e:
+            print(f"Ignoring unreadable sheet mirror at {self.path}: {e}")
+            self.header, self.rows = [], []
+
+    def _persist(self, rows=None, start=0):
+        """Rewrites the mirror file, or with rows given, appends just those rows."""
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with closing(sqlite3.connect(self.path)) as conn, conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS mirror_meta (header TEXT)")
+                conn.execute("CREATE TABLE IF NOT EXISTS mirror_rows (row_number INTEGER PRIMARY KEY, data TEXT)")
+                if rows is None:
+                    conn.execute("DELETE FROM mirror_meta")
+                    conn.execute("DELETE FROM mirror_rows")
+                    conn.execute("INSERT INTO mirror_meta VALUES (?)", (json.dumps(self.header),))
+                    rows = self.rows
+                conn.executemany("INSERT INTO mirror_rows VALUES (?, ?)", ((start + i, json.dumps(row)) for i, row in enumerate(rows)))
+        except Exception as e:
+            print(f"Failed to persist sheet mirror to {self.path}: {e}")
+
+# --- JOB FINGERPRINTS ---
+COMPANY_SUFFIXES = ['private', 'pvt', 'limited', 'ltd', 'llp', 'llc', 'inc', 'corp', 'corporation', 'co']
+CITY_ALIASES = {
+    'bengaluru': 'bangalore', 'gurugram': 'gurgaon', 'bombay': 'mumbai', 'new delhi': 'delhi',
+    'madras': 'chennai', 'calcutta': 'kolkata', 'cochin': 'kochi', 'poona': 'pune',
+    'trivandrum': 'thiruvananthapuram', 'mysuru': 'mysore', 'navi mumbai': 'mumbai'
+}
+COMPANY_SUFFIX_PATTERN = re.compile(r'(?:\s(?:' + '|'.join(COMPANY_SUFFIXES) + r'))+$')
+CITY_ALIAS_PATTERN = re.compile(r'\b(?:' + '|'.join(sorted(CITY_ALIASES, key=len, reverse=True)) + r')\b')
+
+def _normalize_text(values):
+    """Case-folds, turns punctuation into spaces and collapses whitespace for a Series of strings."""
+    return values.fillna('').astype(str).str.casefold().str.replace(r'[\W_]+', ' ', regex=True).str.strip()
+
+def job_fingerprints(df):
+    """Returns a Series of 16-hex-digit fingerprints of Company, Role and Location, aligned to df."""
+    empty = pd.Series('', index=df.index)
+    company = _normalize_text(df.get('Company', empty)).str.replace(COMPANY_SUFFIX_PATTERN, '', regex=True)
+    role = _normalize_text(df.get('Role', empty))
+    location = _normalize_text(df.get('Location', empty)).str.replace(CITY_ALIAS_PATTERN, lambda m: CITY_ALIASES[m.group(0)], regex=True)
+    keys = company + '|' + role + '|' + location
+    return pd.Series([hashlib.blake2b(k.encode(), digest_size=8).hexdigest() for k in keys], index=df.index, dtype=object)
+
+class _MirrorIndex:
+    """Base for indexes derived from the mirror's rows; keeps up with appends and rebuilds after a resync."""
+
+    def __init__(self):
+        self.row_count = 0
+        self.mirror_resyncs = 0
+        self.lock = threading.RLock()
+
+    def sync(self, mirror):
+        """Indexes rows the mirror has gained since the last sync; rebuilds after a resync or if rows went missing."""
+        with mirror.lock, self.lock:
+            if mirror.resyncs != self.mirror_resyncs or self.row_count > mirror.row_count:
+                self.reset()
+                self.mirror_resyncs = mirror.resyncs
+            if self.row_count < mirror.row_count:
+                self.index_rows(pd.DataFrame(mirror.rows[self.row_count:], columns=_title_columns(mirror.header)))
+
+    def reset(self):
+        raise NotImplementedError
+
+    def index_rows(self, rows_df):
+        raise NotImplementedError
+
+class FingerprintIndex(_MirrorIndex):
+    """Set of fingerprints for every row in the sheet, persisted as one line per row so it can be appended to."""
+
+    def __init__(self, path=None):
+        super().__init__()
+        self.path = path
+        self.fingerprints = set()
+        self._load()
+
+    def __contains__(self, fingerprint):
+        return fingerprint in self.fingerprints
+
+    def reset(self):
+        self.fingerprints, self.row_count = set(), 0
+        self._persist(rewrite=True)
+
+    def index_rows(self, rows_df):
+        self.add(job_fingerprints(rows_df).tolist())
+
+    def add(self, fingerprints):
+        with self.lock:
+            self.fingerprints.update(fingerprints)
+            self.row_count += len(fingerprints)
+            self._persist(fingerprints)
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                lines = f.read().split()
+            self.fingerprints, self.row_count = set(lines), len(lines)
+        except Exception as e:
+            print(f"Ignoring unreadable fingerprint index at {self.path}: {e}")
+
+    def _persist(self, fingerprints=(), rewrite=False):
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'w' if rewrite else 'a', encoding='utf-8') as f:
+                f.writelines(fp + '\n' for fp in fingerprints)
+        except Exception as e:
+            print(f"Failed to persist fingerprint index to {self.path}: {e}")
+
+class JobSearchIndex(_MirrorIndex):
+    """In-memory index for search_jobs: trigrams over distinct Role/Location values and a sorted date column."""
+
+    FIELDS = ['Role', 'Location']
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def reset(self):
+        self.row_count = 0
+        # Per field: distinct lower-cased values and their ids, the rows holding each value, trigram -> value ids
+        self.value_ids = {field: {} for field in self.FIELDS}
+        self.values = {field: [] for field in self.FIELDS}
+        self.value_rows = {field: [] for field in self.FIELDS}
+        self.grams = {field: defaultdict(set) for field in self.FIELDS}
+        self.dates = np.array([], dtype='datetime64[D]')
+        self.date_rows = np.array([], dtype=np.int64)
+
+    def index_rows(self, rows_df):
+        positions = range(self.row_count, self.row_count + len(rows_df))
+        for field in self.FIELDS:
+            values = rows_df[field].fillna('').astype(str).str.lower() if field in rows_df.columns else [''] * len(rows_df)
+            for pos, value in zip(positions, values):
+                value_id = self.value_ids[field].get(value)
+                if value_id is None:
+                    value_id = self.value_ids[field][value] = len(self.values[field])
+                    self.values[field].append(value)
+                    self.value_rows[field].append([])
+                    for gram in self._trigrams(value):
+                        self.grams[field][gram].add(value_id)
+                self.value_rows[field][value_id].append(pos)
+        if 'Posted Date' in rows_df.columns:
+            dates = parse_posted_dates(rows_df['Posted Date']).to_numpy(dtype='datetime64[D]')
+            valid = ~np.isnat(dates)
+            new_dates, new_rows = dates[valid], np.asarray(positions, dtype=np.int64)[valid]
+            order = np.argsort(new_dates, kind='stable')
+            at = np.searchsorted(self.dates, new_dates[order], side='right')
+            self.dates = np.insert(self.dates, at, new_dates[order])
+            self.date_rows = np.insert(self.date_rows, at, new_rows[order])
+        self.row_count += len(rows_df)
+
+    def query(self, role=None, location=None, start_date=None, end_date=None):
+        """Returns the sorted row positions matching every given filter (case-insensitive substring, inclusive dates)."""
+        with self.lock:
+            matches = None
+            for field, text in (('Role', role), ('Location', location)):
+                if text:
+                    rows = self._match_field(field, text.lower())
+                    matches = rows if matches is None else matches & rows
+            if start_date and end_date:
+                lo = np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start_date).date(), 'D'), side='left')
+                hi = np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end_date).date(), 'D'), side='right')
+                rows = set(self.date_rows[lo:hi].tolist())
+                matches = rows if matches is None else matches & rows
+            return sorted(matches) if matches is not None else list(range(self.row_count))
+
+    def _match_field(self, field, text):
+        grams = self._trigrams(text)
+        if grams:
+            candidates = set.intersection(*(self.grams[field].get(gram, set()) for gram in grams))
+        else:
+            candidates = self.value_ids[field].values()
+        values = self.values[field]
+        return {pos for value_id in candidates if text in values[value_id] for pos in self.value_rows[field][value_id]}
+
+    @staticmethod
+    def _trigrams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def parse_posted_dates(dates):
+    """Parses 'Posted Date' strings as written by convert_date (dd-mm-YYYY), falling back to day-first parsing."""
+    parsed = pd.to_datetime(dates, format='%d-%m-%Y', errors='coerce')
+    unparsed = parsed.isna() & dates.fillna('').astype(str).ne('')
+    if unparsed.any():
+        parsed[unparsed] = pd.to_datetime(dates[unparsed], dayfirst=True, errors='coerce', format='mixed')
+    return parsed
+
+# --- SHEET WRITER ---
+WRITE_CHUNK_SIZE = 500
+WRITE_MAX_RETRIES = 5
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+def _is_retryable(error):
+    """True for quota (429) and server-side (5xx) API errors."""
+    # The HTTP status comes first: gspread sets APIError.code to -1 when the body is not JSON (e.g. a 502 page)
+    code = getattr(getattr(error, 'response', None), 'status_code', None)
+    if code is None:
+        code = getattr(error, 'code', None)
+    return code in RETRYABLE_STATUS_CODES
+
+class SheetWriter:
+    """Appends rows to a worksheet in chunks, retrying quota and server errors with exponential backoff.
+
+    Every batch is spooled to disk before it is sent and the spool file only shrinks as chunks land,
+    so rows survive a crash or an exhausted retry budget. submit() returns immediately and leaves the
+    batch to a background thread; write() sends it before returning.
+    """
+
+    def __init__(self, worksheet, chunk_size=WRITE_CHUNK_SIZE, max_retries=WRITE_MAX_RETRIES, base_delay=1.0,
+                 max_delay=32.0, spool_dir=None, lock=None, on_flushed=None, sleep=time.sleep):
+        self.worksheet = worksheet
+        self.chunk_size = max(1, int(chunk_size))
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.spool_dir = spool_dir
+        self.lock = lock or threading.RLock()
+        self.on_flushed = on_flushed
+        self.sleep = sleep
+        self.pending_keys = set()
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._seq = 0
+
+    def write(self, rows, keys=()):
+        """Sends rows now; raises after the retry budget is spent, leaving the unsent rows spooled."""
+        self._send(self._spool(rows, keys))
+
+    def submit(self, rows, keys=()):
+        """Spools rows and hands them to the background flusher. keys stay in pending_keys until they land."""
+        batch = self._spool(rows, keys)
+        self.pending_keys.update(keys)
+        self._queue.put(batch)
+        self._ensure_thread()
+
+    def flush(self):
+        """Blocks until every submitted batch has been written (or given up on for this round)."""
+        self._queue.join()
+
+    def spooled_batches(self):
+        """Batches left on disk by an earlier run, as (path, rows, keys)."""
+        if not self.spool_dir or not os.path.isdir(self.spool_dir):
+            return []
+        batches = []
+        for name in sorted(os.listdir(self.spool_dir)):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.spool_dir, name)
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+                batches.append((path, data['rows'], data['keys']))
+            except Exception as e:
+                print(f"Skipping unreadable spool file {path}: {e}")
+        return batches
+
+    def _spool(self, rows, keys):
+        batch = {'path': None, 'rows': [list(row) for row in rows], 'keys': list(keys)}
+        if self.spool_dir:
+            os.makedirs(self.spool_dir, exist_ok=True)
+            with self._thread_lock:
+                self._seq += 1
+                batch['path'] = os.path.join(self.spool_dir, f"batch_{time.time_ns()}_{self._seq}.json")
+            self._rewrite_spool(batch)
+        return batch
+
+    def _rewrite_spool(self, batch):
+        if not batch['path']:
+            return
+        if not batch['rows']:
+            if os.path.exists(batch['path']):
+                os.remove(batch['path'])
+            return
+        tmp_path = batch['path'] + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'rows': batch['rows'], 'keys': batch['keys']}, f)
+        os.replace(tmp_path, batch['path'])
+
+    def _send(self, batch):
+        while batch['rows']:
+            chunk = batch['rows'][:self.chunk_size]
+            self._append_with_retry(chunk)
+            chunk_keys = batch['keys'][:len(chunk)]
+            batch['rows'], batch['keys'] = batch['rows'][len(chunk):], batch['keys'][len(chunk):]
+            self._rewrite_spool(batch)
+            self.pending_keys.difference_update(chunk_keys)
+
+    def _append_with_retry(self, chunk):
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self.lock:
+                    with span('sheet.append_rows', rows=len(chunk), attempt=attempt):
+                        self.worksheet.append_rows(chunk, value_input_option='USER_ENTERED')
+                    if self.on_flushed:
+                        self.on_flushed(chunk)
+                count('jobs.written', len(chunk))
+                return
+            except Exception as e:
+                if not _is_retryable(e) or attempt == self.max_retries:
+                    raise
+                count('sheet.retries')
+                # Full jitter: sleep a random amount up to the capped exponential delay
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                print(f"Sheets API error ({e}); retrying chunk of {len(chunk)} rows in {delay:.1f}s.")
+                self.sleep(delay)
+
+    def _ensure_thread(self):
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="sheet-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            try:
+                self._send(batch)
+                print("Write-behind batch flushed to Google Sheet.")
+            except Exception as e:
+                # Rows stay spooled either way; the next start picks them up again
+                print(f"Write-behind batch failed, {len(batch['rows'])} rows kept in spool: {e}")
+                if _is_retryable(e):
+                    threading.Timer(self.max_delay, self._requeue, args=(batch,)).start()
+                else:
+                    # Retrying a bad row or a full sheet cannot help, and its jobs must not keep reading as duplicates
+                    self.pending_keys.difference_update(batch['keys'])
+            finally:
+                self._queue.task_done()
+
+    def _requeue(self, batch):
+        self._queue.put(batch)
+        self._ensure_thread()
+
+_mirrors = {}
+_indexes = {}
+_search_indexes = {}
+_writers = {}
+_registry_lock = threading.Lock()
+
+def _cache_path(worksheet, prefix, extension):
+    cache_dir = _get_setting("CACHE_DIR", CACHE_DIR)
+    if not cache_dir:
+        return None
+    name = f"{getattr(worksheet, 'spreadsheet_id', 'sheet')}_{getattr(worksheet, 'id', 0)}"
+    return os.path.join(cache_dir, f"{prefix}_{name}" + (f".{extension}" if extension else ''))
+
+def get_sheet_mirror(worksheet):
+    """Returns the process-wide mirror for a worksheet, creating it on first use."""
+    with _registry_lock:
+        entry = _mirrors.get(id(worksheet))
+        if entry is None or entry.worksheet is not worksheet:
+            entry = _mirrors[id(worksheet)] = SheetMirror(
+                worksheet, _cache_path(worksheet, 'mirror', 'sqlite'),
+                _get_setting("MIRROR_REFRESH_SECONDS", MIRROR_REFRESH_SECONDS)
+            )
+            index = _indexes[id(worksheet)] = FingerprintIndex(_cache_path(worksheet, 'fingerprints', 'txt'))
+            _search_indexes[id(worksheet)] = JobSearchIndex()
+
+            def on_flushed(rows, mirror=entry, index=index):
+                mirror.append_local(rows)
+                index.sync(mirror)
+
+            _writers[id(worksheet)] = SheetWriter(
+                worksheet, chunk_size=_get_setting("SHEETS_WRITE_CHUNK_SIZE", WRITE_CHUNK_SIZE),
+                spool_dir=_cache_path(worksheet, 'spool', None), lock=entry.lock, on_flushed=on_flushed
+            )
+        return entry
+
+def get_fingerprint_index(worksheet):
+    """Returns the dedup index that belongs to the worksheet's mirror."""
+    get_sheet_mirror(worksheet)
+    return _indexes[id(worksheet)]
+
+def get_sheet_writer(worksheet):
+    """Returns the writer that appends to the worksheet and keeps its mirror and indexes in step."""
+    get_sheet_mirror(worksheet)
+    return _writers[id(worksheet)]
+
+def recover_spooled_jobs(worksheet):
+    """Re-sends batches a previous run spooled but never finished writing, skipping rows that did land."""
+    writer = get_sheet_writer(worksheet)
+    batches = writer.spooled_batches()
+    if not batches:
+        return 0
+    mirror, index = get_sheet_mirror(worksheet), get_fingerprint_index(worksheet)
+    mirror.refresh(force=True)
+    index.sync(mirror)
+    recovered = 0
+    for path, rows, keys in batches:
+        unsent = [(row, key) for row, key in zip(rows, keys) if key not in index]
+        if unsent:
+            writer.submit([row for row, _ in unsent], [key for _, key in unsent])
+            recovered += len(unsent)
+        os.remove(path)
+    print(f"Recovered {recovered} spooled rows for Google Sheet.")
+    return recovered
+
+def get_search_index(worksheet):
+    """Returns the search index that belongs to the worksheet's mirror."""
+    get_sheet_mirror(worksheet)
+    return _search_indexes[id(worksheet)]
+
 def get_all_jobs_df(worksheet):
-    """Fetches all records from the worksheet and returns a pandas DataFrame."""
+    """Returns all jobs as a pandas DataFrame, served from the local mirror of the worksheet."""
     if worksheet is None:
         return pd.DataFrame()
     try:
-        data = worksheet.get_all_records()
-        df = pd.DataFrame.from_records(data)
+        mirror = get_sheet_mirror(worksheet)
+        mirror.refresh()
+        df = mirror.to_df()
         # Ensure standard column names for consistency
         if not df.empty:
-            df.columns = [col.title().replace('_', ' ') for col in df.columns]
+            df.columns = _title_columns(df.columns)
         return df
     except Exception as e:
         st.error(f"Failed to read data from Google Sheet: {e}")
@@ -50,28 +575,32 @@ def add_jobs_df(worksheet, new_jobs_df):
         return 0
 
     # Standardize column names of the new data to match the sheet
-    new_jobs_df.columns = [str(col).title().replace('_', ' ') for col in new_jobs_df.columns]
-    
-    existing_jobs_df = get_all_jobs_df(worksheet)
+    new_jobs_df.columns = _title_columns(new_jobs_df.columns)
     
-    if not existing_jobs_df.empty:
-        # Create a unique ID for each job to check for duplicates
-        new_jobs_df['unique_id'] = new_jobs_df['Company'].astype(str) + new_jobs_df['Role'].astype(str) + new_jobs_df['Location'].astype(str)
-        existing_jobs_df['unique_id'] = existing_jobs_df['Company'].astype(str) + existing_jobs_df['Role'].astype(str) + existing_jobs_df['Location'].astype(str)
-        
-        # Filter out jobs that already exist in the sheet
-        truly_new_jobs_df = new_jobs_df[~new_jobs_df['unique_id'].isin(existing_jobs_df['unique_id'])]
-        truly_new_jobs_df = truly_new_jobs_df.drop(columns=['unique_id'])
-    else:
-        # If the sheet is empty, all scraped jobs are new
-        truly_new_jobs_df = new_jobs_df
+    try:
+        mirror = get_sheet_mirror(worksheet)
+        index = get_fingerprint_index(worksheet)
+        mirror.refresh()
+        index.sync(mirror)
+    except Exception as e:
+        raise StorageError(f"Failed to read data from Google Sheet: {e}") from e
+
+    # Drop jobs already in the sheet or still queued for it, and repeats within this batch
+    with span('dedup', rows=len(new_jobs_df)):
+        pending = get_sheet_writer(worksheet).pending_keys
+        fingerprints = job_fingerprints(new_jobs_df)
+        is_new = ~fingerprints.map(lambda fp: fp in index or fp in pending).astype(bool) & ~fingerprints.duplicated()
+        truly_new_jobs_df = new_jobs_df[is_new]
+        new_fingerprints = fingerprints[is_new].tolist()
 
     num_new_jobs = len(truly_new_jobs_df)
+    count('jobs.received', len(new_jobs_df))
+    count('jobs.deduped', len(new_jobs_df) - num_new_jobs)
     
     if num_new_jobs > 0:
         try:
             # Ensure the order of columns matches the sheet's header before appending
-            header = worksheet.row_values(1)
+            header = mirror.header
             # Fill missing columns with empty strings
             for col in header:
                 if col not in truly_new_jobs_df.columns:
@@ -80,37 +609,204 @@ def add_jobs_df(worksheet, new_jobs_df):
             truly_new_jobs_df = truly_new_jobs_df[header]
             
             rows_to_append = truly_new_jobs_df.fillna('').values.tolist()
-            worksheet.append_rows(rows_to_append, value_input_option='USER_ENTERED')
-            print(f"Successfully added {num_new_jobs} new rows to Google Sheet.")
+            writer = get_sheet_writer(worksheet)
+            if _get_setting("SHEETS_WRITE_BEHIND", False):
+                writer.submit(rows_to_append, new_fingerprints)
+                print(f"Queued {num_new_jobs} new rows for Google Sheet.")
+            else:
+                writer.write(rows_to_append, new_fingerprints)
+                print(f"Successfully added {num_new_jobs} new rows to Google Sheet.")
         except Exception as e:
-            st.error(f"Failed to write to Google Sheet: {e}")
-            return 0
+            raise StorageError(f"Failed to write to Google Sheet: {e}") from e
             
     return num_new_jobs
 
 def search_jobs(worksheet, role, location, start_date=None, end_date=None):
     """Searches the worksheet data by role, location, and date."""
-    df = get_all_jobs_df(worksheet)
-    if df.empty:
+    if worksheet is None:
+        return pd.DataFrame()
+    try:
+        mirror = get_sheet_mirror(worksheet)
+        index = get_search_index(worksheet)
+        mirror.refresh()
+        index.sync(mirror)
+        with mirror.lock:
+            if 'Posted Date' not in _title_columns(mirror.header):
+                start_date = end_date = None
+            positions = index.query(role, location, start_date, end_date)
+            df = pd.DataFrame([mirror.rows[i] for i in positions], columns=_title_columns(mirror.header))
+    except Exception as e:
+        st.error(f"Failed to read data from Google Sheet: {e}")
         return pd.DataFrame()
+    return df if not df.empty else pd.DataFrame()
 
-    # Filter by role and location (case-insensitive search)
-    if role:
-        df = df[df['Role'].str.contains(role, case=False, na=False)]
-    if location:
-        df = df[df['Location'].str.contains(location, case=False, na=False)]
-        
-    # Filter by date range if provided
-    if start_date and end_date and 'Posted Date' in df.columns:
-        # Convert 'Posted Date' to datetime objects, handling different formats and errors
-        df['Posted Date'] = pd.to_datetime(df['Posted Date'], errors='coerce')
-        df = df.dropna(subset=['Posted Date']) # Remove rows where date conversion failed
-        
-        # Ensure comparison dates are timezone-naive
-        start_datetime_naive = pd.to_datetime(start_date).tz_localize(None)
-        end_datetime_naive = pd.to_datetime(end_date).tz_localize(None)
+# --- STORAGE BACKENDS ---
+JOB_COLUMNS = ['Company', 'Role', 'Location', 'Experience', 'Posted Date', 'Source Portal']
+STORAGE_BACKEND = 'gsheet'
+SQLITE_PATH = 'jobs.db'
+
+class JobStore:
+    """Storage interface used by the app; the module-level functions above are the Google Sheets implementation."""
+
+    def get_all_jobs_df(self):
+        raise NotImplementedError
+
+    def iter_jobs_df(self, chunk_rows):
+        """Every stored job as DataFrames of at most chunk_rows rows. Backends that cannot read
+        incrementally yield everything as one DataFrame."""
+        yield self.get_all_jobs_df()
+
+    def add_jobs_df(self, new_jobs_df):
+        """Saves the jobs not stored yet and returns how many that was; raises StorageError if they could not be saved."""
+        raise NotImplementedError
 
-        mask = (df['Posted Date'].dt.tz_localize(None) >= start_datetime_naive) & (df['Posted Date'].dt.tz_localize(None) <= end_datetime_naive)
-        df = df.loc[mask]
+    def search_jobs(self, role, location, start_date=None, end_date=None):
+        raise NotImplementedError
 
-    return df
+    def data_version(self):
+        """A value that changes whenever the stored jobs change, used to key cached exports."""
+        raise NotImplementedError
+
+class GSheetStore(JobStore):
+    """Stores jobs in the "All Jobs" tab of a Google Sheet."""
+
+    def __init__(self, worksheet):
+        self.worksheet = worksheet
+
+    @classmethod
+    def connect(cls):
+        worksheet = connect_to_gsheet()
+        if worksheet is None:
+            return None
+        try:
+            recover_spooled_jobs(worksheet)
+        except Exception as e:
+            st.warning(f"Could not re-send spooled jobs to Google Sheet: {e}")
+        return cls(worksheet)
+
+    def get_all_jobs_df(self):
+        return get_all_jobs_df(self.worksheet)
+
+    def add_jobs_df(self, new_jobs_df):
+        return add_jobs_df(self.worksheet, new_jobs_df)
+
+    def search_jobs(self, role, location, start_date=None, end_date=None):
+        return search_jobs(self.worksheet, role, location, start_date, end_date)
+
+    def data_version(self):
+        mirror = get_sheet_mirror(self.worksheet)
+        mirror.refresh()
+        return f"gsheet-{getattr(self.worksheet, 'spreadsheet_id', '')}-{mirror.data_version()}"
+
+class SQLiteStore(JobStore):
+    """Stores jobs in a local SQLite file, deduplicated by a unique fingerprint and filtered in SQL."""
+
+    # Sheet column -> SQL column
+    COLUMNS = dict(zip(JOB_COLUMNS, ['company', 'role', 'location', 'experience', 'posted_date', 'source_portal']))
+
+    def __init__(self, path=SQLITE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        # Write-ahead logging lets inserts go ahead while an export is still reading
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.lock, self.conn:
+            self.conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY,
+                    {', '.join(f'{col} TEXT' for col in self.COLUMNS.values())},
+                    posted_on TEXT,
+                    fingerprint TEXT NOT NULL UNIQUE
+                )""")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_posted_on ON jobs (posted_on)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_source_portal ON jobs (source_portal)")
+
+    @classmethod
+    def connect(cls):
+        try:
+            store = cls(_get_setting("SQLITE_PATH", SQLITE_PATH))
+            print(f"Successfully opened SQLite database at {store.path}.")
+            return store
+        except Exception as e:
+            st.error(f"Failed to open SQLite database: {e}")
+            return None
+
+    def get_all_jobs_df(self):
+        return self._select("", [])
+
+    def iter_jobs_df(self, chunk_rows):
+        # A connection of its own, so the read does not hold the store's lock between chunks
+        conn = sqlite3.connect(self.path)
+        try:
+            query = f"SELECT {', '.join(self.COLUMNS.values())} FROM jobs ORDER BY id"
+            for df in pd.read_sql_query(query, conn, chunksize=chunk_rows):
+                df.columns = JOB_COLUMNS
+                yield df
+        finally:
+            conn.close()
+
+    def add_jobs_df(self, new_jobs_df):
+        if new_jobs_df.empty:
+            return 0
+        df = new_jobs_df.copy()
+        df.columns = _title_columns(df.columns)
+        for col in JOB_COLUMNS:
+            if col not in df.columns:
+                df[col] = ''
+        df = df[JOB_COLUMNS].fillna('').astype(str)
+        posted_on = parse_posted_dates(df['Posted Date']).dt.strftime('%Y-%m-%d')
+        rows = zip(*(df[col] for col in JOB_COLUMNS), posted_on.where(posted_on.notna(), None), job_fingerprints(df))
+        sql = (f"INSERT OR IGNORE INTO jobs ({', '.join(self.COLUMNS.values())}, posted_on, fingerprint) "
+               f"VALUES ({', '.join('?' * (len(JOB_COLUMNS) + 2))})")
+        try:
+            with self.lock, self.conn, span('sqlite.insert', rows=len(df)):
+                before = self.conn.total_changes
+                self.conn.executemany(sql, rows)
+                num_new_jobs = self.conn.total_changes - before
+        except Exception as e:
+            raise StorageError(f"Failed to write to SQLite database: {e}") from e
+        count('jobs.received', len(df))
+        count('jobs.deduped', len(df) - num_new_jobs)
+        count('jobs.written', num_new_jobs)
+        print(f"Successfully added {num_new_jobs} new rows to SQLite database.")
+        return num_new_jobs
+
+    def search_jobs(self, role, location, start_date=None, end_date=None):
+        clauses, params = [], []
+        for col, text in (('role', role), ('location', location)):
+            if text:
+                clauses.append(f"{col} LIKE ? ESCAPE '\\'")
+                params.append('%' + re.sub(r'([\\%_])', r'\\\1', text) + '%')
+        if start_date and end_date:
+            clauses.append("posted_on BETWEEN ? AND ?")
+            params += [pd.Timestamp(start_date).strftime('%Y-%m-%d'), pd.Timestamp(end_date).strftime('%Y-%m-%d')]
+        return self._select(f"WHERE {' AND '.join(clauses)}" if clauses else "", params)
+
+    def data_version(self):
+        # Jobs are only ever inserted, so the row count and the last id identify the contents
+        with self.lock:
+            total, last_id = self.conn.execute("SELECT COUNT(*), MAX(id) FROM jobs").fetchone()
+        return f"sqlite-{os.path.abspath(self.path)}-{total}-{last_id}"
+
+    def _select(self, where, params):
+        try:
+            with self.lock:
+                df = pd.read_sql_query(f"SELECT {', '.join(self.COLUMNS.values())} FROM jobs {where} ORDER BY id", self.conn, params=params)
+        except Exception as e:
+            st.error(f"Failed to read from SQLite database: {e}")
+            return pd.DataFrame()
+        df.columns = JOB_COLUMNS
+        return df if not df.empty else pd.DataFrame()
+
+STORAGE_BACKENDS = {'gsheet': GSheetStore, 'sqlite': SQLiteStore}
+
+@st.cache_resource
+def connect_store():
+    """Opens the storage backend named by the STORAGE_BACKEND secret ('gsheet' or 'sqlite')."""
+    backend = str(_get_setting("STORAGE_BACKEND", STORAGE_BACKEND)).lower()
+    if backend not in STORAGE_BACKENDS:
+        st.error(f"Unknown storage backend '{backend}'. Choose one of: {', '.join(STORAGE_BACKENDS)}.")
+        return None
+    return STORAGE_BACKENDS[backend].connect()
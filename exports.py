@@ -0,0 +1,104 @@
+import os
+import csv
+import glob
+import hashlib
+import threading
+
+from instrumentation import span
+
+EXPORT_DIR = os.path.join('.cache', 'exports')
+EXPORT_FORMATS = {
+    'xlsx': ('Excel', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'csv': ('CSV', 'text/csv'),
+    'parquet': ('Parquet', 'application/octet-stream')
+}
+EXPORT_CHUNK_ROWS = 10000
+
+_export_lock = threading.Lock()
+
+def available_formats():
+    """Export formats usable here; Parquet needs pyarrow (or fastparquet) installed."""
+    formats = ['xlsx', 'csv']
+    try:
+        import pyarrow # noqa: F401
+        formats.append('parquet')
+    except ImportError:
+        try:
+            import fastparquet # noqa: F401
+            formats.append('parquet')
+        except ImportError:
+            pass
+    return formats
+
+def _write_xlsx(chunks, path):
+    # Write-only mode streams rows to disk instead of keeping every cell object in memory
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Jobs')
+    for i, df in enumerate(chunks):
+        if i == 0:
+            sheet.append([str(col) for col in df.columns])
+        for row in df.itertuples(index=False, name=None):
+            sheet.append(list(row))
+    workbook.save(path)
+
+def _write_csv(chunks, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        for i, df in enumerate(chunks):
+            if i == 0:
+                writer.writerow(df.columns)
+            writer.writerows(df.itertuples(index=False, name=None))
+
+def _write_parquet(chunks, path):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        # fastparquet has no incremental writer, so the chunks are joined first
+        import pandas as pd
+        pd.concat([df.astype(str) for df in chunks]).to_parquet(path, index=False)
+        return
+    writer = None
+    try:
+        for df in chunks:
+            table = pa.Table.from_pandas(df.astype(str), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        pq.write_table(pa.table({}), path)
+
+WRITERS = {'xlsx': _write_xlsx, 'csv': _write_csv, 'parquet': _write_parquet}
+
+def export_path(store, fmt, export_dir=EXPORT_DIR):
+    """Path of an export of the whole database in fmt, building it only if the data changed since the last one."""
+    version = hashlib.blake2b(str(store.data_version()).encode('utf-8'), digest_size=8).hexdigest()
+    path = os.path.join(export_dir, f"jobs_{version}.{fmt}")
+    with _export_lock:
+        if os.path.exists(path):
+            return path
+        os.makedirs(export_dir, exist_ok=True)
+        with span('export', format=fmt):
+            tmp_path = f"{path}.tmp"
+            # SQLite is read EXPORT_CHUNK_ROWS at a time; the sheet mirror is already in memory and comes as one chunk
+            WRITERS[fmt](store.iter_jobs_df(EXPORT_CHUNK_ROWS), tmp_path)
+            os.replace(tmp_path, path)
+        # Older versions of this format are no longer needed
+        for old_path in glob.glob(os.path.join(export_dir, f"jobs_*.{fmt}")):
+            if old_path != path:
+                try:
+                    os.remove(old_path)
+                except OSError:
+                    pass
+    return path
+
+def export_bytes(store, fmt):
+    """The finished export file's contents. Streamlit serves downloads from memory, so the file is read
+    whole here; only building it is bounded."""
+    with open(export_path(store, fmt), 'rb') as f:
+        return f.read()
@@ -0,0 +1,136 @@
+import re
+
+try:
+    import lxml.html
+except ImportError: # BeautifulSoup's html.parser is used instead
+    lxml = None
+
+# data-testid of each field inside a job card, and the key it is returned under
+CARD_FIELDS = {
+    'job_title': 'title',
+    'job_location': 'location',
+    'job_experience': 'experience',
+    'date_posted': 'posted'
+}
+JOB_ID_PATTERN = re.compile(r'-(\d+)(?:\.html)?/?$')
+
+# Runs in the page and returns the same raw cards as parse_cards, without serialising the DOM.
+# Text is gathered like BeautifulSoup's get_text(strip=True): every text node stripped, then joined.
+EXTRACT_CARDS_JS = """
+(fields) => {
+    const text = (el) => {
+        const parts = [];
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) {
+            const part = walker.currentNode.nodeValue.trim();
+            if (part) parts.push(part);
+        }
+        return parts.join('');
+    };
+    const cards = [];
+    for (const title of document.querySelectorAll('p[data-testid="job_title"]')) {
+        const card = title.closest('div.MuiPaper-root');
+        if (!card || card.querySelector('p[data-testid="job_title"]') !== title) continue;
+        const raw = {};
+        for (const name of Object.values(fields)) raw[name] = '';
+        for (const el of card.querySelectorAll('[data-testid]')) {
+            const name = fields[el.getAttribute('data-testid')];
+            if (name && !raw[name]) raw[name] = text(el);
+        }
+        const link = card.querySelector('a[href]') || card.closest('a[href]');
+        raw.href = link ? link.getAttribute('href') : '';
+        cards.push(raw);
+    }
+    return cards;
+}
+"""
+
+# Href of every job card on the page ('' when a card has no link), in page order; cheap enough to run after every scroll
+CARD_HREFS_JS = """
+() => Array.from(document.querySelectorAll('p[data-testid="job_title"]'), (title) => {
+    const card = title.closest('div.MuiPaper-root') || title;
+    const link = card.querySelector('a[href]') || card.closest('a[href]');
+    return link ? link.getAttribute('href') : '';
+})
+"""
+
+def job_id_from_href(href):
+    """IIMJobs job id from a listing URL such as /j/product-manager-fintech-1234567.html."""
+    match = JOB_ID_PATTERN.search((href or '').split('?')[0])
+    return match.group(1) if match else ''
+
+def _finish(raw):
+    raw['job_id'] = job_id_from_href(raw.get('href'))
+    return raw
+
+def parse_cards_lxml(html):
+    """Raw job cards in one pass over each card, using lxml."""
+    cards, seen = [], set()
+    root = lxml.html.fromstring(html)
+    for title in root.iter('p'):
+        if title.get('data-testid') != 'job_title':
+            continue
+        card = next((el for el in title.iterancestors('div') if 'MuiPaper-root' in (el.get('class') or '').split()), None)
+        # Keep the elements themselves: lxml recycles the proxy objects (and their id()) once they are freed
+        if card is None or card in seen:
+            continue
+        seen.add(card)
+        raw = dict.fromkeys(CARD_FIELDS.values(), '')
+        href = ''
+        for el in card.iter():
+            if not isinstance(el.tag, str):
+                continue
+            name = CARD_FIELDS.get(el.get('data-testid'))
+            if name and not raw[name]:
+                raw[name] = ''.join(part.strip() for part in el.itertext())
+            if not href and el.tag == 'a':
+                href = el.get('href') or ''
+        if not href:
+            link = next(card.iterancestors('a'), None)
+            href = link.get('href') or '' if link is not None else ''
+        raw['href'] = href
+        cards.append(_finish(raw))
+    return cards
+
+def parse_cards_bs4(html):
+    """Raw job cards using BeautifulSoup's html.parser; the fallback when lxml is not installed."""
+    from bs4 import BeautifulSoup
+
+    cards = []
+    soup = BeautifulSoup(html, "html.parser")
+    for card in soup.select('div.MuiPaper-root:has(p[data-testid="job_title"])'):
+        # Only the innermost card around a title, so nested papers are not returned twice
+        if card.select_one(':scope div.MuiPaper-root p[data-testid="job_title"]'):
+            continue
+        raw = dict.fromkeys(CARD_FIELDS.values(), '')
+        for el in card.select('[data-testid]'):
+            name = CARD_FIELDS.get(el.get('data-testid'))
+            if name and not raw[name]:
+                raw[name] = el.get_text(strip=True)
+        link = card.find('a', href=True) or card.find_parent('a', href=True)
+        raw['href'] = link['href'] if link else ''
+        cards.append(_finish(raw))
+    return cards
+
+def parse_cards(html):
+    """Raw job cards from an IIMJobs listing page: title, location, experience, posted, href and job_id."""
+    if lxml is not None:
+        try:
+            return parse_cards_lxml(html)
+        except Exception as e:
+            print(f"lxml could not parse the IIMJobs page, falling back to BeautifulSoup: {e}")
+    return parse_cards_bs4(html)
+
+async def card_job_ids(page):
+    """Job ids of the cards currently on a live page, one per card ('' when unknown)."""
+    return [job_id_from_href(href) for href in await page.evaluate(CARD_HREFS_JS)]
+
+async def extract_cards(page):
+    """Raw job cards read straight from a live Playwright page, falling back to parsing its HTML."""
+    try:
+        cards = await page.evaluate(EXTRACT_CARDS_JS, CARD_FIELDS)
+        if cards:
+            return [_finish(raw) for raw in cards]
+    except Exception as e:
+        print(f"In-page IIMJobs extraction failed, parsing the HTML instead: {e}")
+    return parse_cards(await page.content())
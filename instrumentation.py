@@ -0,0 +1,91 @@
+import json
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+from collections import defaultdict
+
+# The report of the run the current code belongs to; threads and tasks must inherit it (see in_current_run)
+_current_report = contextvars.ContextVar('run_report', default=None)
+MAX_SPANS = 5000 # Per run; stage totals keep counting past it
+
+class RunReport:
+    """Timing spans and counters recorded while one scrape or import runs."""
+
+    def __init__(self, name):
+        self.name = name
+        self.started_at = time.time()
+        self.finished_at = None
+        self.spans = []
+        self.stages = defaultdict(lambda: {'calls': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+        self.counters = defaultdict(int)
+        self.lock = threading.Lock()
+
+    def add_span(self, name, seconds, labels):
+        with self.lock:
+            stage = self.stages[name]
+            stage['calls'] += 1
+            stage['seconds'] += seconds
+            stage['max_seconds'] = max(stage['max_seconds'], seconds)
+            if len(self.spans) < MAX_SPANS:
+                self.spans.append({'stage': name, 'seconds': round(seconds, 4), **labels})
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] += n
+
+    def stage_table(self):
+        """One row per stage with its call count and time, slowest first."""
+        with self.lock:
+            rows = [{'Stage': name, 'Calls': s['calls'], 'Total (s)': round(s['seconds'], 2), 'Max (s)': round(s['max_seconds'], 2)}
+                    for name, s in self.stages.items()]
+        return sorted(rows, key=lambda row: -row['Total (s)'])
+
+    def to_dict(self):
+        with self.lock:
+            return {
+                'name': self.name, 'started_at': self.started_at, 'finished_at': self.finished_at,
+                'seconds': round((self.finished_at or time.time()) - self.started_at, 3),
+                'stages': {name: dict(s) for name, s in self.stages.items()},
+                'counters': dict(self.counters), 'spans': list(self.spans)
+            }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=1, default=str)
+
+@contextmanager
+def record_run(name):
+    """Collects every span and counter recorded inside the block (and the threads it hands work to)."""
+    report = RunReport(name)
+    token = _current_report.set(report)
+    try:
+        yield report
+    finally:
+        report.finished_at = time.time()
+        _current_report.reset(token)
+
+def current_report():
+    return _current_report.get()
+
+@contextmanager
+def span(name, **labels):
+    """Times the block as one call of a stage in the current run; does nothing outside a run."""
+    report = _current_report.get()
+    if report is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        report.add_span(name, time.perf_counter() - started, labels)
+
+def count(name, n=1):
+    report = _current_report.get()
+    if report is not None:
+        report.count(name, n)
+
+def in_current_run(fn):
+    """Wraps fn so it records into the caller's run when started on another thread."""
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.copy().run(fn, *args, **kwargs)
@@ -0,0 +1,210 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+
+from instrumentation import record_run, span
+
+CHECKPOINT_DIR = os.path.join('.cache', 'checkpoints')
+CHECKPOINT_MAX_AGE = 12 * 3600 # Older checkpoints are treated as a fresh run
+MAX_WORKERS = 2
+SAVE_BATCH_SIZE = 25
+
+class ScrapeJob:
+    """One background scrape: its parameters, live progress and a checkpoint of the units it has finished."""
+
+    def __init__(self, job_id, kind, params, checkpoint_path=None):
+        self.job_id = job_id
+        self.kind = kind
+        self.params = params
+        self.checkpoint_path = checkpoint_path
+        self.status = 'queued' # queued -> running -> done / failed / cancelled
+        self.stage = ''
+        self.stage_done = 0
+        self.stage_total = 0
+        self.found = []
+        self.error = None
+        self.report = None
+        self.started_at = None
+        self.finished_at = None
+        self.lock = threading.Lock()
+        self._cancel = threading.Event()
+        self.checkpoint = self._load_checkpoint()
+
+    @property
+    def done_units(self):
+        return set(self.checkpoint['done_units'])
+
+    @property
+    def jobs_added(self):
+        return self.checkpoint['jobs_added']
+
+    @property
+    def resumed(self):
+        return bool(self.checkpoint['done_units'])
+
+    @property
+    def finished(self):
+        return self.status in ('done', 'failed', 'cancelled')
+
+    def kept(self, stage):
+        """Jobs kept so far by the finished units of a stage, including those from an earlier attempt."""
+        return self.checkpoint['kept'].get(stage, 0)
+
+    def cancel(self):
+        self._cancel.set()
+
+    def should_stop(self):
+        return self._cancel.is_set()
+
+    def progress(self):
+        """Snapshot for the UI to poll."""
+        with self.lock:
+            return {
+                'job_id': self.job_id, 'kind': self.kind, 'status': self.status, 'stage': self.stage,
+                'stage_done': self.stage_done, 'stage_total': self.stage_total,
+                'jobs_found': len(self.found), 'jobs_added': self.jobs_added,
+                'resumed': self.resumed, 'error': self.error
+            }
+
+    def found_df(self):
+        with self.lock:
+            return pd.DataFrame(self.found).fillna('') if self.found else pd.DataFrame()
+
+    def start_stage(self, stage, total):
+        with self.lock:
+            self.stage = stage
+            self.stage_total = total
+            self.stage_done = len([u for u in self.checkpoint['done_units'] if u.startswith(stage + ':')])
+            self.stage_total += self.stage_done
+
+    def finish_unit(self, stage, unit, kept, jobs_added):
+        """Records a finished unit once its jobs are saved, so a resumed run can skip it."""
+        with self.lock:
+            key = f"{stage}:{unit}"
+            if key not in self.checkpoint['done_units']:
+                self.checkpoint['done_units'].append(key)
+                self.stage_done += 1
+            self.checkpoint['kept'][stage] = self.checkpoint['kept'].get(stage, 0) + kept
+            self.checkpoint['jobs_added'] += jobs_added
+            self._save_checkpoint()
+
+    def clear_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def _load_checkpoint(self):
+        checkpoint = {'done_units': [], 'kept': {}, 'jobs_added': 0, 'saved_at': None}
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            try:
+                with open(self.checkpoint_path, encoding='utf-8') as f:
+                    saved = json.load(f)
+                if time.time() - saved.get('saved_at', 0) < CHECKPOINT_MAX_AGE:
+                    checkpoint.update(saved)
+            except Exception as e:
+                print(f"Ignoring unreadable checkpoint {self.checkpoint_path}: {e}")
+        return checkpoint
+
+    def _save_checkpoint(self):
+        if not self.checkpoint_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.checkpoint_path) or '.', exist_ok=True)
+            self.checkpoint['saved_at'] = time.time()
+            tmp_path = self.checkpoint_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.checkpoint, f)
+            os.replace(tmp_path, self.checkpoint_path)
+        except Exception as e:
+            print(f"Failed to save checkpoint {self.checkpoint_path}: {e}")
+
+class JobRunner:
+    """Runs scrapes on a small thread pool, off the Streamlit script run, and keeps a registry of them.
+
+    A job is identified by its kind and parameters. Submitting the same scrape again while it runs
+    returns the running job; submitting it after it failed or was cancelled resumes from its checkpoint.
+    """
+
+    def __init__(self, max_workers=MAX_WORKERS, checkpoint_dir=CHECKPOINT_DIR, save_batch_size=SAVE_BATCH_SIZE):
+        self.checkpoint_dir = checkpoint_dir
+        self.save_batch_size = save_batch_size
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape-job")
+
+    @staticmethod
+    def job_id(kind, params):
+        digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:12]
+        return f"{kind}-{digest}"
+
+    def submit(self, kind, params, iterate, save):
+        """Starts a job. iterate(job) must return the scraper's job iterator (with progress markers);
+        save(jobs_df) stores a batch and returns how many rows were new."""
+        job_id = self.job_id(kind, params)
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is not None and not job.finished:
+                return job
+            checkpoint_path = os.path.join(self.checkpoint_dir, f"{job_id}.json") if self.checkpoint_dir else None
+            job = self.jobs[job_id] = ScrapeJob(job_id, kind, params, checkpoint_path)
+        self._pool.submit(self._run, job, iterate, save)
+        return job
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def _run(self, job, iterate, save):
+        with record_run(f"{job.kind} scrape") as report:
+            job.report = report
+            self._consume(job, iterate, save)
+
+    def _consume(self, job, iterate, save):
+        from scraper import ScrapeProgress
+
+        with job.lock:
+            job.status, job.started_at = 'running', time.time()
+        pending = []
+
+        def flush():
+            nonlocal pending
+            if not pending:
+                return 0
+            with span('save', rows=len(pending)):
+                added = save(pd.DataFrame(pending))
+            pending = []
+            return added
+
+        try:
+            for item in iterate(job):
+                if isinstance(item, ScrapeProgress):
+                    if item.unit:
+                        job.finish_unit(item.stage, item.unit, item.kept, flush())
+                    else:
+                        job.start_stage(item.stage, item.total)
+                else:
+                    pending.append(item)
+                    with job.lock:
+                        job.found.append(item)
+                    if len(pending) >= self.save_batch_size:
+                        added = flush()
+                        with job.lock:
+                            job.checkpoint['jobs_added'] += added
+                if job.should_stop():
+                    break
+            added = flush()
+            with job.lock:
+                job.checkpoint['jobs_added'] += added
+                job.status = 'cancelled' if job.should_stop() else 'done'
+            if job.status == 'done':
+                job.clear_checkpoint()
+            else:
+                job._save_checkpoint()
+        except Exception as e:
+            print(f"Scrape job {job.job_id} failed: {e}")
+            with job.lock:
+                job.status, job.error = 'failed', str(e)
+        finally:
+            job.finished_at = time.time()
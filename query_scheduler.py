@@ -0,0 +1,196 @@
+import os
+import json
+import copy
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from instrumentation import span, in_current_run
+
+QUERY_STATS_PATH = os.path.join('.cache', 'query_stats.json')
+MAX_WORKERS = 3
+MAX_QUERIES = 10
+PROBE_LIMIT = 5
+MIN_YIELD = 0.25
+MAX_QUERY_LIMIT = 100
+
+def query_key(query):
+    """Stable identifier for a LinkedIn query: search text plus its locations."""
+    locations = getattr(query.options, 'locations', None) or []
+    return f"{query.query}|{','.join(locations)}"
+
+def with_limit(query, limit):
+    """Copy of a query whose options ask for at most `limit` jobs."""
+    query = copy.copy(query)
+    query.options = copy.copy(query.options)
+    query.options.limit = limit
+    return query
+
+class QueryStats:
+    """How many jobs each query has produced and how many of them were kept, stored as JSON."""
+
+    def __init__(self, path=QUERY_STATS_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.data = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self.data = json.load(f)
+            except Exception as e:
+                print(f"Ignoring unreadable query stats at {path}: {e}")
+
+    def score(self, key):
+        """Smoothed share of kept jobs, so unseen queries start at 0.5 and rank between good and bad ones."""
+        stats = self.data.get(key, {})
+        return (stats.get('kept', 0) + 1) / (stats.get('seen', 0) + 2)
+
+    def record(self, key, seen, kept):
+        with self.lock:
+            stats = self.data.setdefault(key, {'runs': 0, 'seen': 0, 'kept': 0})
+            stats['runs'] += 1
+            stats['seen'] += seen
+            stats['kept'] += kept
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with self.lock, open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, indent=1)
+        except Exception as e:
+            print(f"Failed to save query stats to {self.path}: {e}")
+
+class QueryScheduler:
+    """Runs LinkedIn queries on a bounded pool of scrapers and shares a budget of kept jobs between them.
+
+    With several queries, the best-ranked `max_queries` are first probed with `probe_limit` jobs each.
+    The rest of the budget then goes to the queries whose probe yield reached `min_yield`, in proportion
+    to that yield. Queries below it, or that ran out of results during the probe, stop there.
+
+    `scraper_factory()` must return an object with `.on(event, callback)` and `.run([query])`.
+    `on_data(event)` returns True for jobs it kept, False for jobs it rejected and None for jobs it
+    has already seen in this run (these do not count towards a query's yield).
+    `on_kept(event)`, if given, is called for each kept job once the budget has counted it, outside the
+    scheduler's lock; `on_data` runs under that lock, so it should stay cheap.
+    `on_query_done(key, seen, kept)` is called once a query has run its last round, with its totals over
+    all rounds; a query whose follow-up is still to come is not done. Once `should_stop()` returns True no
+    further queries are started.
+    """
+
+    def __init__(self, scraper_factory, data_event, on_data, stats=None, max_workers=MAX_WORKERS,
+                 max_queries=MAX_QUERIES, probe_limit=PROBE_LIMIT, min_yield=MIN_YIELD, max_query_limit=MAX_QUERY_LIMIT,
+                 on_query_done=None, should_stop=None, on_kept=None):
+        self.scraper_factory = scraper_factory
+        self.data_event = data_event
+        self.on_data = on_data
+        self.stats = stats if stats is not None else QueryStats()
+        self.max_workers = max(1, max_workers)
+        self.max_queries = max_queries
+        self.probe_limit = probe_limit
+        self.min_yield = min_yield
+        self.max_query_limit = max_query_limit
+        self.on_query_done = on_query_done
+        self.should_stop = should_stop
+        self.on_kept = on_kept
+        self.lock = threading.Lock()
+        self.kept_total = 0
+        self.total_limit = 0
+
+    def rank(self, queries):
+        """Queries ordered by past yield; ties keep their incoming order."""
+        return sorted(queries, key=lambda q: -self.stats.score(query_key(q)))
+
+    def run(self, queries, total_limit):
+        """Runs the queries until `total_limit` jobs are kept; returns {query key: (seen, kept)}."""
+        self.kept_total, self.total_limit = 0, total_limit
+        if len(queries) == 1:
+            results = self._run_round([queries[0]], self._query_done)
+        elif queries:
+            selected = self.rank(queries)[:self.max_queries]
+            probed = set()
+            results = self._run_round([with_limit(q, self.probe_limit) for q in selected], lambda key, seen, kept: probed.add(key))
+            followups = self._plan_followups(selected, results)
+            # Probes that get no follow-up are finished now; the others only once their follow-up has run
+            followed_up = {query_key(q) for q in followups}
+            for query in selected:
+                key = query_key(query)
+                if key in probed and key not in followed_up:
+                    self._query_done(key, *results[key])
+
+            def followup_done(key, seen, kept):
+                self._query_done(key, results[key][0] + seen, results[key][1] + kept)
+            for key, (seen, kept) in self._run_round(followups, followup_done).items():
+                results[key] = (results[key][0] + seen, results[key][1] + kept)
+        else:
+            results = {}
+        self.stats.save()
+        return results
+
+    def _plan_followups(self, selected, probes):
+        remaining = self.total_limit - self.kept_total
+        if remaining <= 0:
+            return []
+        yields = {}
+        for query in selected:
+            seen, kept = probes[query_key(query)]
+            # A probe that came back short has no more results to give
+            if seen >= self.probe_limit and kept / seen >= self.min_yield:
+                yields[query_key(query)] = kept / seen
+        total_yield = sum(yields.values())
+        followups = []
+        for query in selected:
+            rate = yields.get(query_key(query))
+            if rate:
+                share = remaining * rate / total_yield
+                # LinkedIn lists the probed jobs again, so the limit has to cover them too
+                limit = min(self.max_query_limit, self.probe_limit + math.ceil(share / rate))
+                followups.append(with_limit(query, limit))
+        return followups
+
+    def _query_done(self, key, seen, kept):
+        if self.on_query_done:
+            self.on_query_done(key, seen, kept)
+
+    def _run_round(self, queries, on_done=None):
+        """Runs queries in parallel; on_done(key, seen, kept) follows each one that actually ran."""
+        if not queries:
+            return {}
+        run_query = in_current_run(lambda query: self._run_query(query, on_done))
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(queries))) as pool:
+            return dict(zip([query_key(q) for q in queries], pool.map(run_query, queries)))
+
+    def _run_query(self, query, on_done=None):
+        counts = {'seen': 0, 'kept': 0}
+
+        def on_event(data):
+            with self.lock:
+                if self.kept_total >= self.total_limit:
+                    return
+                kept = self.on_data(data)
+                if kept is None:
+                    return
+                counts['seen'] += 1
+                if not kept:
+                    return
+                counts['kept'] += 1
+                self.kept_total += 1
+            if self.on_kept:
+                self.on_kept(data)
+
+        with self.lock:
+            if self.kept_total >= self.total_limit or (self.should_stop and self.should_stop()):
+                return 0, 0
+        try:
+            with span('linkedin.query', query=query_key(query), limit=query.options.limit):
+                scraper = self.scraper_factory()
+                # LinkedinScraper calls back from its own worker threads
+                scraper.on(self.data_event, in_current_run(on_event))
+                scraper.run([query])
+        except Exception as e:
+            print(f"[LinkedIn] Query '{query_key(query)}' failed: {e}")
+        self.stats.record(query_key(query), counts['seen'], counts['kept'])
+        if on_done:
+            on_done(query_key(query), counts['seen'], counts['kept'])
+        return counts['seen'], counts['kept']
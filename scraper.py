@@ -1,25 +1,36 @@
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import re
+import copy
 import logging
 import random
 import time
+import asyncio
+import threading
+import queue
+import contextvars
+import concurrent.futures
+from urllib.parse import urlparse
+from typing import NamedTuple
+from collections import Counter
 
 from linkedin_jobs_scraper import LinkedinScraper
 from linkedin_jobs_scraper.events import Events, EventData
 from linkedin_jobs_scraper.query import Query, QueryOptions, QueryFilters
 from linkedin_jobs_scraper.filters import TimeFilters, RelevanceFilters
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
-from bs4 import BeautifulSoup
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
-logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
+from query_scheduler import QueryScheduler, QueryStats, query_key, MAX_QUERIES
+from snapshots import SnapshotStore
+from watermarks import Watermarks, FrontierCutoff
+from instrumentation import span, count, in_current_run
+from iimjobs_parser import parse_cards, extract_cards, card_job_ids
 
-# --- GLOBAL VARIABLES & HELPER DATA ---
-linkedin_jobs_data = []
-linkedin_scraped_count = 0
-APPLY_STARTUP_FILTER = True # Global flag to control filtering
+logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
 
+# --- HELPER DATA ---
 STARTUP_INDICATORS = [
     'startup', 'stealth', 'early stage', 'seed stage', 'series a', 'series b', 'series c',
     'pre-series', 'venture backed', 'vc funded', 'angel funded', 'founded 20',
@@ -40,128 +51,660 @@ INDIAN_CITIES = [
 ]
 
 # --- HELPER FUNCTIONS ---
-def convert_date(text):
-    if text is None: return None
-    text = str(text).lower().strip()
-    today = datetime.today()
-    if re.search(r'^\d{4}-\d{2}-\d{2}', text):
-        try: return datetime.strptime(text.split('t')[0], '%Y-%m-%d').strftime('%d-%m-%Y')
+DATE_FORMAT = '%d-%m-%Y'
+ISO_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}')
+# (pattern, days per unit) in the order convert_date has always tried them
+RELATIVE_DATE_PATTERNS = [
+    (re.compile(r'^(\d+)h$'), 0), (re.compile(r'^(\d+)d$'), 1),
+    (re.compile(r'^(\d+)w$'), 7), (re.compile(r'^(\d+)mo$'), 30),
+]
+RELATIVE_DATE_TEXT_PATTERNS = [
+    (re.compile(r'(\d+)\s+days?'), 1), (re.compile(r'(\d+)\s+weeks?'), 7),
+    (re.compile(r'(\d+)\s+months?'), 30),
+]
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(text, today):
+    """Parses one lower-cased date string against a fixed reference date; memoized per (text, today)."""
+    if ISO_DATE_PATTERN.search(text):
+        try: return datetime.strptime(text.split('t')[0], '%Y-%m-%d').strftime(DATE_FORMAT)
         except ValueError: pass
-    if (m := re.search(r'^(\d+)h$', text)): return today.strftime('%d-%m-%Y')
-    if (m := re.search(r'^(\d+)d$', text)): return (today - timedelta(days=int(m.group(1)))).strftime('%d-%m-%Y')
-    if (m := re.search(r'^(\d+)w$', text)): return (today - timedelta(weeks=int(m.group(1)))).strftime('%d-%m-%Y')
-    if (m := re.search(r'^(\d+)mo$', text)): return (today - timedelta(days=int(m.group(1)) * 30)).strftime('%d-%m-%Y')
-    if "yesterday" in text: return (today - timedelta(days=1)).strftime('%d-%m-%Y')
-    if (m := re.search(r'(\d+)\s+days?', text)): return (today - timedelta(days=int(m.group(1)))).strftime('%d-%m-%Y')
-    if (m := re.search(r'(\d+)\s+weeks?', text)): return (today - timedelta(weeks=int(m.group(1)))).strftime('%d-%m-%Y')
-    if (m := re.search(r'(\d+)\s+months?', text)): return (today - timedelta(days=int(m.group(1)) * 30)).strftime('%d-%m-%Y')
-    return today.strftime('%d-%m-%Y')
+    for pattern, days in RELATIVE_DATE_PATTERNS:
+        if (m := pattern.search(text)): return (today - timedelta(days=int(m.group(1)) * days)).strftime(DATE_FORMAT)
+    if "yesterday" in text: return (today - timedelta(days=1)).strftime(DATE_FORMAT)
+    for pattern, days in RELATIVE_DATE_TEXT_PATTERNS:
+        if (m := pattern.search(text)): return (today - timedelta(days=int(m.group(1)) * days)).strftime(DATE_FORMAT)
+    return today.strftime(DATE_FORMAT)
+
+def convert_date(text, today=None):
+    if text is None: return None
+    return _parse_date_text(str(text).lower().strip(), today or date.today())
+
+def _term_suffix(term, plurals):
+    """What may follow a term within the same word: digits after 'founded 20', a plural 's', or nothing."""
+    if term[-1].isdigit(): return 'digits'
+    last = re.split(r'[\s-]', term)[-1]
+    # Only noun-like final words take a plural ('startups', 'scale-ups', but not 'series as')
+    if plurals and len(last) >= 2 and last.isalpha() and not last.endswith(('s', 'ed', 'ing')): return 'plural'
+    return ''
+
+# Below this length one regex pass costs less than a str.find per group of terms
+SHORT_TEXT = 64
+
+def _group_by_shared_word(terms):
+    """{literal: terms containing it}: terms sharing a word are grouped under it, the others stand alone."""
+    words = {term: re.findall(r'\w+', term) for term, _ in terms}
+    shared = Counter(word for term_words in words.values() for word in set(term_words))
+    groups = {}
+    for term, suffix in terms:
+        word = max(words[term], key=lambda w: (shared[w], len(w)))
+        groups.setdefault(word if shared[word] > 1 else term, []).append((term, suffix))
+    return groups
+
+class TermMatcher:
+    """Finds any of a list of terms as a whole word, ignoring case.
+
+    pattern is the whole list as one regex for Series.str.contains, which runs in pyarrow's RE2 for
+    string columns. search() checks a single text. A short one, like a company name, gets one pass of
+    that regex. On a long description Python's re would try every alternative at every position, so a
+    literal shared by a group of terms ('startup' for the seven '... startup' terms) is looked for with
+    str.find first, and only where it occurs does that group's regex run, from the earliest place one
+    of its terms could start.
+    """
+
+    SUFFIX_PATTERNS = {'digits': r'\d*', 'plural': 's?', '': ''}
+
+    def __init__(self, terms, plurals=False):
+        # search() tries groups in the order of their first term, so common ones listed first end it early
+        self.terms = [(term.lower(), _term_suffix(term, plurals)) for term in terms]
+        self.pattern = self._compile(self.terms, re.IGNORECASE)
+        self.regex = self._compile(self.terms)
+        self.groups = [(literal, max(term.index(literal) for term, _ in group), self._compile(group))
+                       for literal, group in _group_by_shared_word(self.terms).items()]
+
+    @classmethod
+    def _compile(cls, terms, flags=0):
+        # Every term starts and ends with a word character, so \b marks the word boundary on both sides
+        alternatives = '|'.join(re.escape(term) + cls.SUFFIX_PATTERNS[suffix]
+                                for term, suffix in sorted(terms, key=lambda t: len(t[0]), reverse=True))
+        return re.compile(r'\b(?:' + alternatives + r')\b', flags)
+
+    def search(self, text):
+        text = text.lower()
+        if len(text) < SHORT_TEXT: return self.regex.search(text) is not None
+        for literal, lead, regex in self.groups:
+            start = text.find(literal)
+            # No term of the group can start more than `lead` characters before its literal's first occurrence
+            if start != -1 and regex.search(text, max(0, start - lead)): return True
+        return False
+
+LARGE_COMPANIES = TermMatcher(EXCLUDE_LARGE_COMPANIES)
+STARTUP_TERMS = TermMatcher(STARTUP_INDICATORS, plurals=True)
 
 def is_startup_company(company_name, description=""):
     if not company_name: return False
-    company_lower = company_name.lower()
-    desc_lower = description.lower() if description else ""
-    for large_company in EXCLUDE_LARGE_COMPANIES:
-        if large_company in company_lower: return False
-    for indicator in STARTUP_INDICATORS:
-        if indicator in company_lower or indicator in desc_lower: return True
-    return False
+    if LARGE_COMPANIES.search(company_name): return False
+    # One pass over both; the line break keeps a term from spanning the company name and the description
+    return STARTUP_TERMS.search(f"{company_name}\n{description or ''}")
+
+def classify_startups(df, company_col='Company', description_col='Description'):
+    """Vectorized is_startup_company over a DataFrame; returns a boolean Series aligned to df."""
+    if df.empty: return pd.Series(False, index=df.index, dtype=bool)
+    company = df[company_col].fillna('').astype(str)
+    description = df[description_col].fillna('').astype(str) if description_col in df.columns else pd.Series('', index=df.index)
+    is_large = company.str.contains(LARGE_COMPANIES.pattern, na=False)
+    has_indicator = company.str.contains(STARTUP_TERMS.pattern, na=False) | description.str.contains(STARTUP_TERMS.pattern, na=False)
+    return (company != '') & ~is_large & has_indicator
 
+EXPERIENCE_RANGE_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*to\s*(\d+)\s*years', re.IGNORECASE), re.compile(r'(\d+)\s*-\s*(\d+)\s*years', re.IGNORECASE)
+]
+EXPERIENCE_MIN_PATTERN = re.compile(r'(\d+)\+?\s*years?', re.IGNORECASE)
+REMOTE_KEYWORDS = ['remote', 'work from home', 'wfh']
+HYBRID_KEYWORD = 'hybrid'
+REMOTE_PATTERN = re.compile('|'.join(map(re.escape, REMOTE_KEYWORDS)), re.IGNORECASE)
+HYBRID_PATTERN = re.compile(HYBRID_KEYWORD, re.IGNORECASE)
+
+# Single-job forms of extract_experience / extract_locations below, without building a Series per call
 def extract_experience_from_description(description):
     if not description: return ""
-    desc_lower = description.lower()
-    patterns = [
-        r'(\d+)\+?\s*to\s*(\d+)\s*years', r'(\d+)\s*-\s*(\d+)\s*years',
-        r'(\d+)\+?\s*years?'
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, desc_lower)
-        if match:
-            if len(match.groups()) == 2 and match.group(2):
-                return f"{match.group(1)}-{match.group(2)} years"
-            return f"{match.group(1)}+ years"
+    for pattern in EXPERIENCE_RANGE_PATTERNS:
+        if (m := pattern.search(description)): return f"{m.group(1)}-{m.group(2)} years"
+    if (m := EXPERIENCE_MIN_PATTERN.search(description)): return f"{m.group(1)}+ years"
     return ""
 
 def extract_detailed_location(description, location):
-    if not description: description = ""
-    text = (description + " " + location).lower()
-    if any(k in text for k in ['remote', 'work from home', 'wfh']): return "Remote"
-    if 'hybrid' in text: return f"Hybrid ({location})"
+    # Plain substring checks on lower-cased text beat a case-insensitive regex on one long description
+    text = f"{description or ''} {location or ''}".lower()
+    if any(keyword in text for keyword in REMOTE_KEYWORDS): return "Remote"
+    if HYBRID_KEYWORD in text: return f"Hybrid ({location or ''})"
     return location
 
+# --- BATCH ENRICHMENT ---
+def convert_dates(dates, today=None):
+    """convert_date over a Series, parsing each distinct value once against a single reference date."""
+    today = today or date.today()
+    mapping = {v: _parse_date_text(str(v).lower().strip(), today) for v in dates.dropna().unique()}
+    return dates.map(mapping)
+
+# Python's \d and \s are Unicode-aware; spelled out for RE2 so both engines find the same matches
+RE2_CLASSES = {r'\d': r'\p{Nd}', r'\s': r'[\s\x{1c}-\x{1f}\x{85}\p{Z}]'}
+
+def _re2_pattern(pattern):
+    """A compiled EXPERIENCE pattern as an RE2 pattern with named groups, for pyarrow.compute.extract_regex."""
+    source = pattern.pattern
+    for python_class, re2_class in RE2_CLASSES.items():
+        source = source.replace(python_class, re2_class)
+    groups = iter(range(pattern.groups))
+    source = re.sub(r'\((?!\?)', lambda m: f"(?P<g{next(groups)}>", source)
+    return ('(?i)' if pattern.flags & re.IGNORECASE else '') + source
+
+def _extract_groups(text, pattern):
+    """text.str.extract(pattern) for the rows that match, run in RE2 when the strings are pyarrow-backed."""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        array = pa.array(text.array)
+    except (ImportError, TypeError, ValueError):
+        return text.str.extract(pattern).dropna()
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    found = pc.extract_regex(array, _re2_pattern(pattern))
+    matched = found.is_valid().to_numpy(zero_copy_only=False)
+    groups = {i: found.field(i).filter(found.is_valid()).to_pylist() for i in range(pattern.groups)}
+    return pd.DataFrame(groups, index=text.index[matched], dtype=object)
+
+def extract_experience(descriptions):
+    text = descriptions.fillna('').astype(str)
+    result = pd.Series('', index=text.index, dtype=object)
+    pending = text != ''
+    for pattern in EXPERIENCE_RANGE_PATTERNS:
+        found = _extract_groups(text[pending], pattern)
+        result[found.index] = found[0] + '-' + found[1] + ' years'
+        pending[found.index] = False
+    found = _extract_groups(text[pending], EXPERIENCE_MIN_PATTERN)[0]
+    result[found.index] = found + '+ years'
+    return result
+
+def extract_locations(descriptions, locations):
+    location_text = locations.fillna('').astype(str)
+    text = descriptions.fillna('').astype(str) + ' ' + location_text
+    hybrid = ('Hybrid (' + location_text + ')').where(text.str.contains(HYBRID_PATTERN), locations)
+    return pd.Series('Remote', index=text.index, dtype=object).where(text.str.contains(REMOTE_PATTERN), hybrid)
+
+def enrich_job(raw, source_portal, today=None):
+    """enrich_jobs_df for a single raw job dict, in plain Python; returns one sheet row as a dict."""
+    return {
+        'Company': raw.get('company'), 'Role': raw.get('title'),
+        'Location': extract_detailed_location(raw.get('description'), raw.get('location')),
+        'Experience': extract_experience_from_description(raw.get('description')),
+        'Posted Date': convert_date(raw.get('date'), today), 'Source Portal': source_portal
+    }
+
+def enrich_jobs_df(raw_df, source_portal, today=None):
+    """Turns raw scraped jobs (company, title, description, location, date) into sheet rows, column-wise."""
+    if raw_df.empty:
+        return pd.DataFrame(columns=['Company', 'Role', 'Location', 'Experience', 'Posted Date', 'Source Portal'])
+    with span('enrich', source=source_portal):
+        return pd.DataFrame({
+            'Company': raw_df['company'], 'Role': raw_df['title'],
+            'Location': extract_locations(raw_df['description'], raw_df['location']),
+            'Experience': extract_experience(raw_df['description']),
+            'Posted Date': convert_dates(raw_df['date'], today), 'Source Portal': source_portal
+        })
+
 # --- LINKEDIN SCRAPER ---
-def on_linkedin_data(data: EventData):
-    global linkedin_jobs_data, linkedin_scraped_count, APPLY_STARTUP_FILTER
-    if APPLY_STARTUP_FILTER and not is_startup_company(data.company, data.description):
-        return
-    
-    linkedin_jobs_data.append({
-        'Company': data.company, 'Role': data.title,
-        'Location': extract_detailed_location(data.description, data.location),
-        'Experience': extract_experience_from_description(data.description),
-        'Posted Date': convert_date(data.date), 'Source Portal': 'LinkedIn'
-    })
-    linkedin_scraped_count += 1
-    print(f"[LinkedIn] Scraped job #{linkedin_scraped_count}: {data.title} at {data.company}")
-
-def run_linkedin_scraper(queries, limit=50):
-    global linkedin_jobs_data, linkedin_scraped_count
-    linkedin_jobs_data = []; linkedin_scraped_count = 0
-    
-    scraper = LinkedinScraper(headless=True, max_workers=1, slow_mo=1)
-    scraper.on(Events.DATA, on_linkedin_data)
-    
-    for query in queries:
-        if linkedin_scraped_count >= limit: break
+LINKEDIN_MAX_WORKERS = 3
+
+# Last-run watermarks per LinkedIn query+location and IIMJobs category, so repeat scrapes only fetch new postings
+WATERMARKS = Watermarks()
+LINKEDIN_TIME_WINDOWS = {'day': TimeFilters.DAY, 'week': TimeFilters.WEEK, 'month': TimeFilters.MONTH}
+TIME_FILTER_WIDTHS = [TimeFilters.DAY, TimeFilters.WEEK, TimeFilters.MONTH, TimeFilters.ANY]
+
+def linkedin_unit_key(query_text, location):
+    return f"linkedin:{query_text}|{location}"
+
+def linkedin_unit_keys(query):
+    # LinkedinScraper searches 'Worldwide' when a query has no locations
+    locations = getattr(query.options, 'locations', None) or ['Worldwide']
+    return [linkedin_unit_key(query.query, getattr(loc, 'label', loc)) for loc in locations]
+
+def narrow_query(query, watermarks):
+    """Copy of a query that only asks for postings since its last run, newest first; unchanged if it never ran."""
+    keys = linkedin_unit_keys(query)
+    if all(watermarks.age_days(key) is None for key in keys):
+        return query
+    return _narrowed(query, watermarks.window(keys))
+
+def _narrowed(query, window):
+    filters = copy.copy(query.options.filters) if query.options.filters else QueryFilters()
+    if window and TIME_FILTER_WIDTHS.index(LINKEDIN_TIME_WINDOWS[window]) < TIME_FILTER_WIDTHS.index(filters.time or TimeFilters.ANY):
+        filters.time = LINKEDIN_TIME_WINDOWS[window]
+    # The frontier cut-off assumes results arrive newest first
+    filters.relevance = RelevanceFilters.RECENT
+    query = copy.copy(query)
+    query.options = copy.copy(query.options)
+    query.options.filters = filters
+    return query
+
+def is_newest_first(query):
+    return getattr(query.options.filters, 'relevance', None) == RelevanceFilters.RECENT
+
+class LinkedinCollector:
+    """State of one LinkedIn run: applies the startup filter, drops repeats and keeps the raw jobs.
+
+    Each run gets its own collector, so concurrent scrapes (e.g. two Streamlit sessions) never share results.
+    on_data decides whether a job is kept; deliver then hands it to on_job, if given, as an enriched dict.
+    """
+
+    def __init__(self, apply_filter=True, on_job=None, cutoff=None):
+        self.apply_filter = apply_filter
+        self.on_job = on_job
+        self.cutoff = cutoff
+        self.rows = []
+        self.seen = set()
+        self.closed = False
+        self.lock = threading.Lock()
+
+    @property
+    def count(self):
+        return len(self.rows)
+
+    def on_data(self, data: EventData):
+        """Event handler; True if the job was kept, False if filtered out, None if already seen or closed."""
+        with self.lock:
+            job_key = data.job_id or (data.company, data.title, data.location)
+            if self.closed or job_key in self.seen: return None
+            self.seen.add(job_key)
+        # Postings at or past the query's frontier were handled by an earlier run
+        if self.cutoff and not self.cutoff.accept(linkedin_unit_key(data.query, data.location), data.job_id, data.date):
+            count('linkedin.past_frontier')
+            return None
+        count('linkedin.seen')
+        if self.apply_filter and not is_startup_company(data.company, data.description):
+            count('linkedin.filtered')
+            return False
+        count('linkedin.kept')
+        with self.lock:
+            self.rows.append(self._raw(data))
+        return True
+
+    def deliver(self, data: EventData):
+        """Passes a kept job on to on_job; called by the scheduler outside its lock, so workers don't queue behind it."""
+        print(f"[LinkedIn] Scraped job #{self.count}: {data.title} at {data.company}")
+        if self.on_job:
+            self.on_job(enrich_job(self._raw(data), 'LinkedIn'))
+
+    @staticmethod
+    def _raw(data):
+        return {'company': data.company, 'title': data.title, 'description': data.description, 'location': data.location, 'date': data.date}
+
+    def to_df(self):
+        with self.lock:
+            return enrich_jobs_df(pd.DataFrame(self.rows), 'LinkedIn')
+
+# Raw pages/payloads from earlier scrapes; answers repeat fetches within a time bucket and feeds replay mode
+SNAPSHOTS = SnapshotStore()
+LINKEDIN_SNAPSHOT_FIELDS = ('query', 'job_id', 'title', 'company', 'description', 'location', 'date')
+
+def linkedin_snapshot_key(query):
+    filters = getattr(query.options, 'filters', None)
+    return f"{query_key(query)}|{getattr(filters, 'time', '')}|{getattr(filters, 'relevance', '')}"
+
+def latest_linkedin_snapshot(snapshots, query):
+    """Newest snapshot of a query as given or as narrow_query may have narrowed it, since live runs save the latter."""
+    keys = [linkedin_snapshot_key(query)] + [linkedin_snapshot_key(_narrowed(query, window)) for window in (None, *LINKEDIN_TIME_WINDOWS)]
+    found = [snapshot for key in dict.fromkeys(keys) if (snapshot := snapshots.latest('linkedin', key))]
+    return max(found, key=lambda snapshot: snapshot['fetched_at'], default=None)
+
+class SnapshotLinkedinScraper:
+    """Stands in for LinkedinScraper: answers a query from a snapshot when it can, otherwise scrapes and records it.
+
+    A snapshot serves any query asking for no more jobs than it recorded (or whose run ran out of results),
+    except a newest-first query narrowed by its watermarks, which wants what was posted since the last run.
+    In replay mode the live scraper is never started and queries without a snapshot return nothing.
+    """
+
+    def __init__(self, snapshots, make_scraper, replay=False):
+        self.snapshots = snapshots
+        self.make_scraper = make_scraper
+        self.replay = replay
+        self.event, self.callback = None, None
+
+    def on(self, event, callback):
+        self.event, self.callback = event, callback
+
+    def run(self, queries):
+        for query in queries:
+            self._run(query)
+
+    def _run(self, query):
+        key, limit = linkedin_snapshot_key(query), query.options.limit
+        if self.replay:
+            snapshot = latest_linkedin_snapshot(self.snapshots, query)
+        else:
+            snapshot = None if is_newest_first(query) else self.snapshots.get('linkedin', key)
+        if snapshot and (self.replay or snapshot['data']['limit'] >= limit or len(snapshot['data']['events']) >= limit):
+            count('snapshots.hit')
+            for raw in snapshot['data']['events'][:limit]:
+                # The frontier cut-off keys on the event's query; snapshots saved before it was recorded lack it
+                self.callback(EventData(**{'query': query.query, **raw}))
+            return
+        count('snapshots.miss')
+        if self.replay:
+            return
+        events = []
+
+        def record(data):
+            events.append({field: getattr(data, field) for field in LINKEDIN_SNAPSHOT_FIELDS})
+            self.callback(data)
+        scraper = self.make_scraper()
+        scraper.on(self.event, record)
         scraper.run([query])
-        
-    return pd.DataFrame(linkedin_jobs_data)
+        self.snapshots.put('linkedin', key, {'limit': limit, 'events': events})
+
+def _linkedin_scraper_factory(snapshots, replay):
+    make_scraper = lambda: LinkedinScraper(headless=True, max_workers=1, slow_mo=1)
+    if snapshots is None:
+        return make_scraper
+    return lambda: SnapshotLinkedinScraper(snapshots, make_scraper, replay)
+
+def schedule_linkedin_queries(queries, limit, collector, max_workers=LINKEDIN_MAX_WORKERS, on_query_done=None, should_stop=None,
+                              snapshots=SNAPSHOTS, replay=False, scraper_factory=None):
+    """Runs the queries through a QueryScheduler into the collector; kept jobs reach collector.on_job as they arrive."""
+    scheduler = QueryScheduler(
+        scraper_factory or _linkedin_scraper_factory(snapshots, replay),
+        Events.DATA, collector.on_data, max_workers=max_workers,
+        # A replay must not teach the live scheduler anything
+        stats=QueryStats(path=None) if replay else None,
+        on_query_done=on_query_done, should_stop=should_stop, on_kept=collector.deliver
+    )
+    return scheduler.run(queries, limit)
+
+def run_linkedin_scraper(queries, limit=50, max_workers=LINKEDIN_MAX_WORKERS, collector=None, on_query_done=None, should_stop=None,
+                         snapshots=SNAPSHOTS, replay=False):
+    """Runs the queries and returns every kept job as one enriched DataFrame."""
+    collector = collector or LinkedinCollector()
+    schedule_linkedin_queries(queries, limit, collector, max_workers, on_query_done, should_stop, snapshots, replay)
+    return collector.to_df()
 
 # --- IIMJOBS SCRAPER ---
-def scrape_iimjobs_page(url, scroll_times=2):
-    jobs = []
-    with sync_playwright() as p:
+IIM_CATEGORIES = [
+    ("https://www.iimjobs.com/c/banking-finance-jobs", "Banking & Finance"),
+    ("https://www.iimjobs.com/c/sales-marketing-jobs", "Sales & Marketing"),
+    ("https://www.iimjobs.com/c/consulting-general-mgmt-jobs", "Consulting"),
+    ("https://www.iimjobs.com/c/hr-ir-jobs", "HR"),
+    ("https://www.iimjobs.com/c/it-systems-jobs", "IT & Systems"),
+    ("https://www.iimjobs.com/c/scm-operations-jobs", "SCM & Operations"),
+    ("https://www.iimjobs.com/c/legal-jobs", "Legal"),
+    ("https://www.iimjobs.com/c/bpo-jobs", "BPO")
+]
+
+IIM_MAX_CONCURRENCY = 4
+SCROLL_WAIT_TIMEOUT = 8.0 # Seconds to wait for a scroll to load more cards
+SCROLL_IDLE_SECONDS = 0.75 # No requests in flight for this long after a scroll means nothing more is coming
+SCROLL_POLL_SECONDS = 0.1
+
+class ScrollPlan(NamedTuple):
+    """When to stop scrolling a listing: after max_scrolls, at target_count cards, or once a seen job id shows up."""
+    max_scrolls: int
+    target_count: int = 0
+    seen_ids: frozenset = frozenset()
+
+# Requests we never need to render a job listing; aborted before they leave the browser.
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media'}
+BLOCKED_TRACKER_DOMAINS = [
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'facebook.net',
+    'hotjar.com', 'clarity.ms', 'moengage.com', 'clevertap.com', 'wzrkt.com', 'branch.io',
+    'amplitude.com', 'mixpanel.com', 'segment.io', 'bat.bing.com', 'ads.linkedin.com'
+]
+
+def iimjobs_card_to_job(card, today=None):
+    """Job row from a raw card returned by iimjobs_parser; relative post dates count back from today."""
+    full_title = card['title']
+    company, role = (parts[0].strip(), parts[1].strip()) if " - " in full_title and len(parts := full_title.split(" - ", 1)) >= 2 else (None, full_title)
+    return {
+        'Company': company, 'Role': role,
+        'Location': card['location'],
+        'Experience': card['experience'],
+        'Posted Date': convert_date(card['posted'], today),
+        'Source Portal': 'IIMJobs'
+    }
+
+def parse_iimjobs_html(html):
+    return [iimjobs_card_to_job(card) for card in parse_cards(html)]
+
+async def _block_heavy_requests(route):
+    request = route.request
+    host = urlparse(request.url).hostname or ''
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host == d or host.endswith('.' + d) for d in BLOCKED_TRACKER_DOMAINS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+class _NetworkActivity:
+    """Tracks a page's in-flight requests so a scroll can tell when loading has gone quiet."""
+
+    def __init__(self, page):
+        self.in_flight = 0
+        self.last_change = time.monotonic()
+        page.on("request", self._started)
+        page.on("requestfinished", self._ended)
+        page.on("requestfailed", self._ended)
+
+    def _started(self, request):
+        self.in_flight += 1
+        self.last_change = time.monotonic()
+
+    def _ended(self, request):
+        self.in_flight = max(0, self.in_flight - 1)
+        self.last_change = time.monotonic()
+
+    def idle_for(self, since):
+        """Seconds without any request in flight, counting from no earlier than since."""
+        return 0.0 if self.in_flight else time.monotonic() - max(self.last_change, since)
+
+async def _wait_for_more_cards(page, network, count, timeout=SCROLL_WAIT_TIMEOUT):
+    """Job ids on the page once it has more than count cards, the network has gone idle, or timeout passes."""
+    started = time.monotonic()
+    deadline = started + timeout
+    while True:
+        await asyncio.sleep(SCROLL_POLL_SECONDS)
+        ids = await card_job_ids(page)
+        if len(ids) > count or network.idle_for(started) >= SCROLL_IDLE_SECONDS or time.monotonic() >= deadline:
+            return ids
+
+async def scroll_for_cards(page, plan, network=None):
+    """Scrolls an infinite listing until plan says stop or a scroll adds no cards; returns new cards per scroll."""
+    network = network or _NetworkActivity(page)
+    ids = await card_job_ids(page)
+    added = []
+    for _ in range(plan.max_scrolls):
+        if plan.target_count and len(ids) >= plan.target_count: break
+        if plan.seen_ids and not plan.seen_ids.isdisjoint(ids): break
+        await page.evaluate("window.scrollBy(0, document.body.scrollHeight);")
+        new_ids = await _wait_for_more_cards(page, network, len(ids))
+        added.append(len(new_ids) - len(ids))
+        if len(new_ids) <= len(ids): break
+        ids = new_ids
+    return added
+
+def _iso_date(text):
+    try:
+        return datetime.strptime(text, DATE_FORMAT).date().isoformat()
+    except (TypeError, ValueError):
+        return None
+
+def _iimjobs_finisher(on_category, cutoff):
+    """finish(url, category, cards, fetched_on) turns a category's raw cards into jobs and reports them.
+
+    With a cutoff, cards an earlier run already saw, or posted before the newest one it saw, are dropped.
+    Each card is checked on its own, since promoted cards can sit above newer ones.
+    """
+    def finish(url, category, cards, fetched_on=None):
+        jobs = []
+        for card in cards:
+            job = iimjobs_card_to_job(card, fetched_on)
+            if cutoff and not cutoff.is_new(f"iimjobs:{url}", card.get('job_id'), _iso_date(job['Posted Date'])):
+                count('iimjobs.past_frontier')
+                continue
+            jobs.append(job)
+        if on_category: on_category(category, jobs)
+        return jobs
+    return finish
+
+async def _scrape_iimjobs_category(browser, semaphore, url, category, plan, finish, should_stop=None, snapshots=None):
+    cards = await _fetch_iimjobs_category(browser, semaphore, url, category, plan, should_stop)
+    if cards is None: return []
+    count('iimjobs.cards', len(cards))
+    if snapshots is not None and cards:
+        snapshots.put('iimjobs', url, {'max_scrolls': plan.max_scrolls, 'cards': cards})
+    return finish(url, category, cards)
+
+async def _fetch_iimjobs_category(browser, semaphore, url, category, plan, should_stop=None):
+    async with semaphore:
+        if should_stop and should_stop(): return None
+        if category: print(f"[IIMJobs] Scraping category: {category}")
+        context = await browser.new_context()
         try:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, timeout=60000)
-            for _ in range(scroll_times):
-                page.evaluate("window.scrollBy(0, document.body.scrollHeight);")
-                time.sleep(2)
-            html = page.content()
-            soup = BeautifulSoup(html, "html.parser")
-            for card in soup.select('div.MuiPaper-root:has(p[data-testid="job_title"])'):
-                title_tag = card.select_one('p[data-testid="job_title"]')
-                full_title = title_tag.get_text(strip=True) if title_tag else ''
-                company, role = (parts[0].strip(), parts[1].strip()) if " - " in full_title and len(parts := full_title.split(" - ", 1)) >= 2 else (None, full_title)
-                jobs.append({
-                    'Company': company, 'Role': role,
-                    'Location': card.select_one('p[data-testid="job_location"]').get_text(strip=True) if card.select_one('p[data-testid="job_location"]') else '',
-                    'Experience': card.select_one('span[data-testid="job_experience"]').get_text(strip=True) if card.select_one('span[data-testid="job_experience"]') else '',
-                    'Posted Date': convert_date(card.select_one('span[data-testid="date_posted"]').get_text(strip=True) if card.select_one('span[data-testid="date_posted"]') else ''),
-                    'Source Portal': 'IIMJobs'
-                })
-            browser.close()
+            await context.route("**/*", _block_heavy_requests)
+            page = await context.new_page()
+            network = _NetworkActivity(page)
+            with span('iimjobs.goto', category=category or url):
+                await page.goto(url, timeout=60000)
+            with span('iimjobs.scroll', category=category or url):
+                added = await scroll_for_cards(page, plan, network)
+            count('iimjobs.scrolls', len(added))
+            print(f"[IIMJobs] {category or url}: new cards per scroll {added}")
+            with span('iimjobs.extract', category=category or url):
+                return await extract_cards(page)
         except PlaywrightTimeoutError: print(f"Timeout error on {url}")
         except Exception as e: print(f"An error occurred during IIMJobs scraping: {e}")
-    return jobs
-
-def run_iimjobs_scraper(scroll_limit=2):
-    iim_categories = [
-        ("https://www.iimjobs.com/c/banking-finance-jobs", "Banking & Finance"),
-        ("https://www.iimjobs.com/c/sales-marketing-jobs", "Sales & Marketing"),
-        ("https://www.iimjobs.com/c/consulting-general-mgmt-jobs", "Consulting"),
-        ("https://www.iimjobs.com/c/hr-ir-jobs", "HR"),
-        ("https://www.iimjobs.com/c/it-systems-jobs", "IT & Systems"),
-        ("https://www.iimjobs.com/c/scm-operations-jobs", "SCM & Operations"),
-        ("https://www.iimjobs.com/c/legal-jobs", "Legal"),
-        ("https://www.iimjobs.com/c/bpo-jobs", "BPO")
-    ]
-    all_jobs = []
-    for url, category in iim_categories:
-        print(f"[IIMJobs] Scraping category: {category}")
-        all_jobs.extend(scrape_iimjobs_page(url, scroll_times=scroll_limit))
-    return pd.DataFrame(all_jobs)
+        finally:
+            await context.close()
+    return []
+
+def _iimjobs_from_snapshots(categories, plans, finish, should_stop, snapshots, replay):
+    """Answers categories from snapshots before any browser starts; returns (jobs, categories still to fetch)."""
+    results, to_fetch = [], []
+    for url, category in categories:
+        if should_stop and should_stop(): break
+        snapshot = snapshots.latest('iimjobs', url) if replay else snapshots.get('iimjobs', url)
+        count('snapshots.hit' if snapshot else 'snapshots.miss')
+        if snapshot and (replay or snapshot['data']['max_scrolls'] >= plans[url].max_scrolls):
+            jobs = finish(url, category, snapshot['data']['cards'], date.fromtimestamp(snapshot['fetched_at']))
+            print(f"[IIMJobs] {category or url}: {len(jobs)} jobs from snapshot")
+            results.extend(jobs)
+        elif not replay:
+            to_fetch.append((url, category))
+    return results, to_fetch
+
+async def _scrape_iimjobs_with_browser(browser, categories, plans, max_concurrency, finish, should_stop=None, snapshots=None):
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    results = await asyncio.gather(*(
+        _scrape_iimjobs_category(browser, semaphore, url, category, plans[url], finish, should_stop, snapshots)
+        for url, category in categories
+    ))
+    return [job for jobs in results for job in jobs]
+
+async def _scrape_iimjobs_categories_async(categories, plans, max_concurrency, finish, should_stop=None, snapshots=None):
+    async with async_playwright() as p:
+        with span('browser.launch'):
+            browser = await p.chromium.launch(headless=True)
+        try:
+            return await _scrape_iimjobs_with_browser(browser, categories, plans, max_concurrency, finish, should_stop, snapshots)
+        finally:
+            await browser.close()
+
+class WarmBrowser:
+    """A headless Chromium kept running on its own event loop thread, so a scrape does not pay for the launch."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.ready = threading.Event()
+        self.browser = None
+        threading.Thread(target=self._serve, name="warm-browser", daemon=True).start()
+
+    @property
+    def usable(self):
+        return self.ready.is_set() and self.browser is not None and self.browser.is_connected()
+
+    def run(self, make_coro):
+        """Runs make_coro(browser) on the browser's loop and waits for it, recording spans into the caller's run."""
+        result = concurrent.futures.Future()
+
+        def done(task):
+            if task.cancelled(): result.cancel()
+            elif task.exception(): result.set_exception(task.exception())
+            else: result.set_result(task.result())
+
+        def start():
+            self.loop.create_task(make_coro(self.browser)).add_done_callback(done)
+        self.loop.call_soon_threadsafe(start, context=contextvars.copy_context())
+        return result.result()
+
+    def _serve(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self._launch())
+        self.loop.run_forever()
+
+    async def _launch(self):
+        try:
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=True)
+            print("Pre-warmed browser is ready.")
+        except Exception as e:
+            print(f"Could not pre-warm a browser: {e}")
+        finally:
+            self.ready.set()
+
+_warm_browser = None
+_warm_browser_lock = threading.Lock()
+
+def prewarm_browser():
+    """Starts the shared browser used by IIMJobs scrapes, once; a new one replaces it if it has died."""
+    global _warm_browser
+    with _warm_browser_lock:
+        if _warm_browser is None or (_warm_browser.ready.is_set() and not _warm_browser.usable):
+            _warm_browser = WarmBrowser()
+        return _warm_browser
+
+def scrape_iimjobs_categories(categories, scroll_times=2, max_concurrency=IIM_MAX_CONCURRENCY, on_category=None, should_stop=None,
+                              target_count=0, seen_ids=(), snapshots=SNAPSHOTS, replay=False, watermarks=None):
+    """Scrapes (url, category) pairs with one shared browser and up to max_concurrency pages at a time.
+
+    Each listing is scrolled at most scroll_times times, stopping early once it has target_count cards,
+    shows a job id from seen_ids, or stops loading new cards. on_category(category, jobs), if given, is
+    called as each category finishes. Categories not yet started when should_stop() turns True are skipped.
+    Categories with a fresh snapshot are answered from it; with replay=True only snapshots are used.
+    With watermarks, each listing also stops scrolling at jobs an earlier run saw in it, and those are dropped.
+    """
+    cutoff = FrontierCutoff(watermarks) if watermarks is not None else None
+    # Each listing stops scrolling at its own frontier, not at ids another category has seen
+    plans = {url: ScrollPlan(scroll_times, target_count, frozenset(seen_ids).union(watermarks.frontier(f"iimjobs:{url}") if cutoff else ()))
+             for url, _ in categories}
+    finish = _iimjobs_finisher(on_category, cutoff)
+    results = []
+    try:
+        if snapshots is not None:
+            results, categories = _iimjobs_from_snapshots(categories, plans, finish, should_stop, snapshots, replay)
+        if not categories:
+            return results
+        warm = _warm_browser
+        if warm is not None and warm.usable:
+            return results + warm.run(lambda browser: _scrape_iimjobs_with_browser(browser, categories, plans, max_concurrency, finish, should_stop, snapshots))
+        return results + asyncio.run(_scrape_iimjobs_categories_async(categories, plans, max_concurrency, finish, should_stop, snapshots))
+    except Exception as e:
+        print(f"An error occurred during IIMJobs scraping: {e}")
+        return results
+    finally:
+        if cutoff: cutoff.commit()
+
+def scrape_iimjobs_page(url, scroll_times=2):
+    return scrape_iimjobs_categories([(url, None)], scroll_times=scroll_times, max_concurrency=1)
+
+def run_iimjobs_scraper(scroll_limit=2, max_concurrency=IIM_MAX_CONCURRENCY):
+    return pd.DataFrame(scrape_iimjobs_categories(IIM_CATEGORIES, scroll_times=scroll_limit, max_concurrency=max_concurrency))
 
 # --- ORCHESTRATOR FUNCTIONS ---
 def create_linkedin_broad_queries():
@@ -175,28 +718,144 @@ def create_linkedin_broad_queries():
     random.shuffle(queries)
     return queries
 
-def run_full_scrape(linkedin_limit, iimjobs_limit):
-    global APPLY_STARTUP_FILTER
-    APPLY_STARTUP_FILTER = True
-    print("Starting broad LinkedIn scrape...")
-    broad_queries = create_linkedin_broad_queries()
-    df_linkedin = run_linkedin_scraper(queries=broad_queries[:10], limit=linkedin_limit) 
-    print("\nStarting IIMJobs scrape...")
-    df_iim = run_iimjobs_scraper(scroll_limit=iimjobs_limit)
-    if df_linkedin.empty and df_iim.empty: return pd.DataFrame()
-    combined_df = pd.concat([df_linkedin, df_iim], ignore_index=True).fillna('')
-    combined_df.drop_duplicates(subset=['Company', 'Role', 'Location'], inplace=True, keep='first')
-    return combined_df
+_DONE = object()
 
-def scrape_targeted_jobs(role, location, limit=25, apply_filter=True):
-    global APPLY_STARTUP_FILTER
-    APPLY_STARTUP_FILTER = apply_filter
-    if not role and not location: return pd.DataFrame()
-    
+class ScrapeProgress(NamedTuple):
+    """Marker yielded between jobs by the iter_* functions when progress=True.
+
+    A stage start has an empty unit; a finished unit (a LinkedIn query key or an IIMJobs category)
+    comes after all of its jobs, with the number of jobs it kept.
+    """
+    stage: str
+    unit: str
+    total: int
+    kept: int = 0
+
+class _Relay:
+    """Callable that hands emitted jobs to whichever queue _stream attaches; drops progress markers unless asked."""
+
+    def __init__(self, progress=False):
+        self.queue = None
+        self.progress = progress
+
+    def __call__(self, item):
+        if self.progress or not isinstance(item, ScrapeProgress):
+            self.queue.put(item)
+
+def _stream(emit, produce):
+    """Runs produce() on a worker thread and yields everything passed to emit, as it is emitted.
+
+    Jobs are de-duplicated on Company/Role/Location. Errors raised by produce are re-raised to the caller.
+    """
+    items = emit.queue = queue.Queue()
+    errors = []
+
+    def worker():
+        try:
+            produce()
+        except Exception as e:
+            errors.append(e)
+        finally:
+            items.put(_DONE)
+
+    threading.Thread(target=in_current_run(worker), name="scrape-stream", daemon=True).start()
+    seen = set()
+    while (item := items.get()) is not _DONE:
+        if isinstance(item, ScrapeProgress):
+            yield item
+            continue
+        key = (item.get('Company') or '', item.get('Role') or '', item.get('Location') or '')
+        if key not in seen:
+            seen.add(key)
+            yield item
+        else:
+            count('jobs.stream_repeats')
+    if errors: raise errors[0]
+
+def _targeted_queries(role, location, limit):
     search_query = role if role else "startup"
     locations_list = [loc.strip() for loc in location.split(',')] if location else None
-    print(f"Targeted scrape: query='{search_query}', location='{locations_list}', limit={limit}, startup_filter={apply_filter}")
+    return [Query(query=search_query, options=QueryOptions(locations=locations_list, limit=limit, filters=QueryFilters(time=TimeFilters.MONTH)))]
+
+def _run_linkedin_stage(emit, queries, limit, collector, should_stop, replay=False, watermarks=None):
+    total = min(len(queries), MAX_QUERIES) if len(queries) > 1 else len(queries)
+    emit(ScrapeProgress('linkedin', '', total))
+    if watermarks is not None:
+        queries = [narrow_query(q, watermarks) for q in queries]
+        # Only recency-sorted results can be cut off at the frontier, or move it forward
+        collector.cutoff = FrontierCutoff(watermarks, [unit for q in queries if is_newest_first(q) for unit in linkedin_unit_keys(q)])
+    done = []
+
+    def on_query_done(key, seen, kept):
+        done.append(key)
+        emit(ScrapeProgress('linkedin', key, total, kept))
+    try:
+        # Jobs are streamed through collector.on_job, so no DataFrame is built at the end
+        schedule_linkedin_queries(queries, limit, collector, should_stop=should_stop, replay=replay, on_query_done=on_query_done)
+    finally:
+        if collector.cutoff:
+            ran = {query_key(q): q for q in queries}
+            collector.cutoff.commit([unit for key in dict.fromkeys(done) for unit in linkedin_unit_keys(ran[key])])
+
+def iter_targeted_jobs(role, location, limit=25, apply_filter=True, progress=False, should_stop=None, watermarks=WATERMARKS):
+    """Yields enriched LinkedIn jobs for one role/location search while the scrape is still running.
+
+    With watermarks, a search run before only looks back to its last run and stops at postings it already saw.
+    """
+    if not role and not location: return
+    print(f"Targeted scrape: query='{role or 'startup'}', location='{location}', limit={limit}, startup_filter={apply_filter}")
+    emit = _Relay(progress)
+    collector = LinkedinCollector(apply_filter=apply_filter, on_job=emit)
+    try:
+        yield from _stream(emit, lambda: _run_linkedin_stage(emit, _targeted_queries(role, location, limit), limit, collector, should_stop,
+                                                             watermarks=watermarks))
+    finally:
+        # Stop collecting once the caller is done, even if the browser is still paging through results
+        collector.closed = True
+
+def _replay_queries(queries):
+    """The queries that have a snapshot, in a fixed order so replays are repeatable."""
+    return sorted((q for q in queries if latest_linkedin_snapshot(SNAPSHOTS, q)), key=query_key)
 
-    queries = [Query(query=search_query, options=QueryOptions(locations=locations_list, limit=limit, filters=QueryFilters(time=TimeFilters.MONTH)))]
-    df_linkedin = run_linkedin_scraper(queries=queries, limit=limit)
-    return df_linkedin.fillna('').drop_duplicates(subset=['Company', 'Role', 'Location'], keep='first')
+def iter_broad_jobs(linkedin_limit, iimjobs_limit, progress=False, skip_units=(), should_stop=None, replay=False, watermarks=WATERMARKS):
+    """Yields enriched jobs from the broad LinkedIn queries, then from each IIMJobs category as it finishes.
+
+    Units named in skip_units (as 'linkedin:<query key>' or 'iimjobs:<category>') are not scraped again.
+    With replay=True everything comes from saved snapshots and no browser is started; watermarks are
+    neither used nor updated then.
+    """
+    if replay: watermarks = None
+    emit = _Relay(progress)
+    collector = LinkedinCollector(apply_filter=True, on_job=emit)
+    skip_units = set(skip_units)
+
+    def produce():
+        print("Starting broad LinkedIn scrape...")
+        queries = [q for q in create_linkedin_broad_queries() if f"linkedin:{query_key(q)}" not in skip_units]
+        if replay: queries = _replay_queries(queries)
+        if linkedin_limit > 0 and queries:
+            _run_linkedin_stage(emit, queries, linkedin_limit, collector, should_stop, replay, watermarks)
+        collector.closed = True
+        if should_stop and should_stop(): return
+        print("\nStarting IIMJobs scrape...")
+        categories = [(url, category) for url, category in IIM_CATEGORIES if f"iimjobs:{category}" not in skip_units]
+        emit(ScrapeProgress('iimjobs', '', len(categories)))
+
+        def on_category(category, jobs):
+            for job in jobs: emit(job)
+            emit(ScrapeProgress('iimjobs', category, len(categories), len(jobs)))
+        scrape_iimjobs_categories(categories, scroll_times=iimjobs_limit, on_category=on_category, should_stop=should_stop,
+                                  replay=replay, watermarks=watermarks)
+    try:
+        yield from _stream(emit, produce)
+    finally:
+        collector.closed = True
+
+def _jobs_to_df(jobs):
+    return pd.DataFrame(jobs).fillna('') if jobs else pd.DataFrame()
+
+def run_full_scrape(linkedin_limit, iimjobs_limit, replay=False):
+    return _jobs_to_df(list(iter_broad_jobs(linkedin_limit, iimjobs_limit, replay=replay)))
+
+def scrape_targeted_jobs(role, location, limit=25, apply_filter=True):
+    return _jobs_to_df(list(iter_targeted_jobs(role, location, limit, apply_filter)))
@@ -2,17 +2,55 @@
 import streamlit as st
 import subprocess
 import sys
+import os
+import json
+
+# Browsers the scrapers launch: full Chromium and the headless shell Playwright uses for headless=True
+REQUIRED_BROWSERS = ('chromium', 'chromium-headless-shell')
+
+def _browsers_dir():
+    """Where Playwright keeps downloaded browsers, following its own lookup rules."""
+    custom = os.environ.get('PLAYWRIGHT_BROWSERS_PATH')
+    if custom == '0':
+        import playwright
+        return os.path.join(os.path.dirname(playwright.__file__), 'driver', 'package', '.local-browsers')
+    if custom:
+        return custom
+    if sys.platform == 'win32':
+        return os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'ms-playwright')
+    if sys.platform == 'darwin':
+        return os.path.expanduser('~/Library/Caches/ms-playwright')
+    return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'ms-playwright')
+
+def chromium_installed():
+    """True when the Chromium builds this Playwright version expects are already downloaded."""
+    try:
+        import playwright
+        with open(os.path.join(os.path.dirname(playwright.__file__), 'driver', 'package', 'browsers.json'), encoding='utf-8') as f:
+            revisions = {b['name']: b['revision'] for b in json.load(f)['browsers']}
+        browsers_dir = _browsers_dir()
+        # Playwright writes this marker once a browser has been fully unpacked
+        return all(
+            os.path.exists(os.path.join(browsers_dir, f"{name.replace('-', '_')}-{revisions[name]}", 'INSTALLATION_COMPLETE'))
+            for name in REQUIRED_BROWSERS
+        )
+    except Exception as e:
+        print(f"Could not check for installed Playwright browsers: {e}")
+        return False
 
 @st.cache_resource
 def setup_playwright():
     """
     Downloads the necessary Playwright browsers without system dependencies.
+    Returns straight away when the matching Chromium is already installed.
     """
+    if chromium_installed():
+        return True
     st.info("Setting up Playwright browsers...")
     try:
-        # Command without --with-deps to avoid sudo
-        command = [sys.executable, "-m", "playwright", "install"]
-        
+        # Command without --with-deps to avoid sudo; only Chromium is ever launched
+        command = [sys.executable, "-m", "playwright", "install", "chromium"]
+
         process = subprocess.run(
             command,
             stdout=subprocess.PIPE,
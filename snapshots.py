@@ -0,0 +1,103 @@
+import os
+import re
+import json
+import gzip
+import time
+import hashlib
+import threading
+
+SNAPSHOT_DIR = os.path.join('.cache', 'snapshots')
+SNAPSHOT_BUCKET_SECONDS = 30 * 60 # A snapshot answers fetches made in the same half hour
+SNAPSHOT_MAX_AGE = 7 * 24 * 3600 # Older snapshots are evicted, newer ones stay available for replay
+SNAPSHOT_MAX_BYTES = 200 * 1024 * 1024
+EVICT_EVERY = 20 # Writes between eviction passes
+# <prefix>-<bucket>.json.gz; in-progress writes end in .tmp and must not match
+SNAPSHOT_NAME_PATTERN = re.compile(r'-(\d+)\.json\.gz')
+
+class SnapshotStore:
+    """Gzipped JSON payloads fetched by the scrapers, keyed by source, URL/query and time bucket.
+
+    get() only returns a snapshot from the current time bucket, so it works as a short-lived cache in
+    front of the browser. latest() ignores the bucket and is what replay mode reads.
+    """
+
+    def __init__(self, path=SNAPSHOT_DIR, bucket_seconds=SNAPSHOT_BUCKET_SECONDS, max_age=SNAPSHOT_MAX_AGE, max_bytes=SNAPSHOT_MAX_BYTES):
+        self.path = path
+        self.bucket_seconds = bucket_seconds
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.writes = 0
+
+    def _prefix(self, source, key):
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+        return os.path.join(self.path, source, digest)
+
+    def _bucket(self, now=None):
+        return int((now if now is not None else time.time()) // self.bucket_seconds)
+
+    def _read(self, file_path):
+        try:
+            with gzip.open(file_path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Ignoring unreadable snapshot {file_path}: {e}")
+            return None
+
+    def get(self, source, key, now=None):
+        """Snapshot {'key', 'fetched_at', 'data'} saved in the current time bucket, or None."""
+        return self._read(f"{self._prefix(source, key)}-{self._bucket(now)}.json.gz")
+
+    def latest(self, source, key):
+        """Newest snapshot for a key regardless of age, or None."""
+        prefix = self._prefix(source, key)
+        folder, name = os.path.split(prefix)
+        try:
+            matches = (SNAPSHOT_NAME_PATTERN.fullmatch(f[len(name):]) for f in os.listdir(folder) if f.startswith(name))
+            buckets = [int(m.group(1)) for m in matches if m]
+        except FileNotFoundError:
+            return None
+        return self._read(f"{prefix}-{max(buckets)}.json.gz") if buckets else None
+
+    def put(self, source, key, data, now=None):
+        now = now if now is not None else time.time()
+        file_path = f"{self._prefix(source, key)}-{self._bucket(now)}.json.gz"
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            tmp_path = f"{file_path}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump({'key': key, 'fetched_at': now, 'data': data}, f)
+            os.replace(tmp_path, file_path)
+        except Exception as e:
+            print(f"Failed to save snapshot for {key}: {e}")
+            return
+        with self.lock:
+            self.writes += 1
+            due = self.writes % EVICT_EVERY == 1
+        if due:
+            self.evict(now)
+
+    def evict(self, now=None):
+        """Drops snapshots older than max_age, then the oldest ones until the store fits in max_bytes."""
+        now = now if now is not None else time.time()
+        files = []
+        for root, _, names in os.walk(self.path):
+            for name in names:
+                file_path = os.path.join(root, name)
+                try:
+                    stat = os.stat(file_path)
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, file_path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        for mtime, size, file_path in files:
+            if now - mtime <= self.max_age and total <= self.max_bytes:
+                break
+            try:
+                os.remove(file_path)
+                total -= size
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,47 @@
+"""import_file: chunked imports into a real store, duplicate files skipped, failed imports not recorded."""
+import io
+
+import pytest
+
+import database as db
+from bulk_import import ImportLedger, import_file
+from benchmarks.fake_sheet import HEADER, make_jobs
+
+def csv_file(rows):
+    lines = [','.join(HEADER)] + [','.join(row) for row in rows]
+    return io.BytesIO('\n'.join(lines).encode('utf-8'))
+
+class FlakyStore(db.SQLiteStore):
+    """Raises StorageError on the given add_jobs_df calls (1-based)."""
+
+    def __init__(self, path, fail_on=()):
+        super().__init__(path)
+        self.fail_on = set(fail_on)
+        self.calls = 0
+
+    def add_jobs_df(self, new_jobs_df):
+        self.calls += 1
+        if self.calls in self.fail_on:
+            raise db.StorageError("Failed to write to SQLite database: disk I/O error")
+        return super().add_jobs_df(new_jobs_df)
+
+def test_imports_in_chunks_and_skips_the_same_file_next_time(tmp_path):
+    store, ledger = db.SQLiteStore(str(tmp_path / 'jobs.db')), ImportLedger(str(tmp_path / 'ledger.json'))
+    rows = make_jobs(25) + [['', 'No Company', '', '', '', '']]
+    progress = []
+    result = import_file(store, csv_file(rows), 'jobs.csv', ledger, lambda *args: progress.append(args), chunk_rows=10)
+    assert result == {'status': 'imported', 'rows': 26, 'added': 25, 'invalid': 1}
+    assert [p[1:] for p in progress] == [(10, 10), (20, 20), (26, 25)]
+    assert import_file(store, csv_file(rows), 'renamed.csv', ImportLedger(ledger.path))['status'] == 'duplicate'
+
+def test_a_failed_chunk_leaves_the_file_unrecorded_so_it_can_be_retried(tmp_path):
+    ledger = ImportLedger(str(tmp_path / 'ledger.json'))
+    store = FlakyStore(str(tmp_path / 'jobs.db'), fail_on={2})
+    rows = make_jobs(25)
+    with pytest.raises(db.StorageError):
+        import_file(store, csv_file(rows), 'jobs.csv', ledger, chunk_rows=10)
+    assert ledger.entries == {} and len(store.get_all_jobs_df()) == 10
+
+    result = import_file(store, csv_file(rows), 'jobs.csv', ledger, chunk_rows=10)
+    assert result == {'status': 'imported', 'rows': 25, 'added': 15, 'invalid': 0}
+    assert len(store.get_all_jobs_df()) == 25 and len(ledger.entries) == 1
@@ -0,0 +1,58 @@
+"""Batch enrichment and the single-job helpers must agree row for row."""
+from datetime import date
+
+import pandas as pd
+import pytest
+
+import scraper as sc
+
+TODAY = date(2026, 3, 15)
+DESCRIPTIONS = [
+    "3 to 5 years of experience, fully remote", "5-7 years in fintech", "2+ years; hybrid from our Pune office", "",
+    None, "Work From Home, 10 Years", "No experience listed", "1 year", "Hybrid role, 4 - 6 Years", "10+ years",
+    "WFH available", "remote-first team, 2 to 3 years", "3\xa0to\xa05 YEARS", "\u0663 years", "1 -\u20092 years, hybrid",
+]
+LOCATIONS = ["Bangalore", "Mumbai", "Pune", "Delhi", None, "Kochi", "Jaipur", "", "Goa", "Hybrid - Pune", "Chennai", None,
+             "Noida", "Indore", "Pune"]
+DATES = ["2h", "3d", "1w", "2mo", "yesterday", "5 days ago", "2 weeks ago", "1 month ago", "2026-01-05T00:00", "garbage", "", None,
+         "1d", "4w", "today"]
+
+def test_single_job_helpers_match_the_batch_stage():
+    raw = pd.DataFrame({'company': 'Acme', 'title': 'PM', 'description': DESCRIPTIONS, 'location': LOCATIONS, 'date': DATES}, dtype=object)
+    batch = sc.enrich_jobs_df(raw, 'LinkedIn', TODAY)
+    assert batch['Experience'].tolist() == [sc.extract_experience_from_description(d) for d in DESCRIPTIONS]
+    assert batch['Location'].fillna('').tolist() == [sc.extract_detailed_location(d, l) or '' for d, l in zip(DESCRIPTIONS, LOCATIONS)]
+    assert batch['Posted Date'].fillna('').tolist() == [sc.convert_date(d, TODAY) or '' for d in DATES]
+
+def test_enrich_job_matches_the_batch_stage():
+    raw = pd.DataFrame({'company': 'Acme', 'title': 'PM', 'description': DESCRIPTIONS, 'location': LOCATIONS, 'date': DATES}, dtype=object)
+    batch = sc.enrich_jobs_df(raw, 'LinkedIn', TODAY).astype(object).where(lambda df: df.notna(), None)
+    assert [sc.enrich_job(row, 'LinkedIn', TODAY) for row in raw.to_dict('records')] == batch.to_dict('records')
+
+def test_batch_stage_when_every_row_matches_the_first_pattern():
+    # Later patterns then see no rows at all, which pyarrow hands back as an empty chunked array
+    raw = pd.DataFrame([{'company': 'Acme', 'title': 'PM', 'description': d, 'location': 'Pune', 'date': '1d'}
+                        for d in ("3 to 5 years", "1 to 2 Years, remote")])
+    assert sc.enrich_jobs_df(raw, 'LinkedIn', TODAY)['Experience'].tolist() == ["3-5 years", "1-2 years"]
+
+@pytest.mark.parametrize('description,expected', [
+    ("3 to 5 years", "3-5 years"), ("5+ to 8 years", "5-8 years"), ("4 - 6 YEARS", "4-6 years"),
+    ("7+ years", "7+ years"), ("1 year", "1+ years"), ("no numbers here", ""), ("", ""), (None, ""),
+])
+def test_extract_experience_from_description(description, expected):
+    assert sc.extract_experience_from_description(description) == expected
+
+@pytest.mark.parametrize('description,location,expected', [
+    ("Remote role", "Pune", "Remote"), ("work from home", "", "Remote"), ("hybrid", "Goa", "Hybrid (Goa)"),
+    ("On-site", "Delhi", "Delhi"), (None, "Remote - India", "Remote"), ("", None, None),
+])
+def test_extract_detailed_location(description, location, expected):
+    assert sc.extract_detailed_location(description, location) == expected
+
+@pytest.mark.parametrize('text,expected', [
+    ("2h", "15-03-2026"), ("3d", "12-03-2026"), ("1w", "08-03-2026"), ("2mo", "14-01-2026"),
+    ("Yesterday", "14-03-2026"), ("Posted 5 days ago", "10-03-2026"), ("2 weeks ago", "01-03-2026"),
+    ("1 month ago", "13-02-2026"), ("2026-01-05", "05-01-2026"), ("anything else", "15-03-2026"), (None, None),
+])
+def test_convert_date(text, expected):
+    assert sc.convert_date(text, TODAY) == expected
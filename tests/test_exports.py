@@ -0,0 +1,37 @@
+"""Database exports: every format reads back as the stored jobs, built from chunks and reused until the data changes."""
+import os
+
+import pandas as pd
+import pytest
+
+import database as db
+import exports
+from benchmarks.fake_sheet import HEADER
+from tests.test_storage_conformance import JOBS
+
+READERS = {
+    'xlsx': lambda path: pd.read_excel(path, dtype=str, keep_default_na=False),
+    'csv': lambda path: pd.read_csv(path, dtype=str, keep_default_na=False),
+    'parquet': pd.read_parquet,
+}
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(exports, 'EXPORT_CHUNK_ROWS', 3)
+    return db.SQLiteStore(str(tmp_path / 'jobs.db'))
+
+@pytest.mark.parametrize('fmt', exports.available_formats())
+def test_export_reads_back_as_the_stored_jobs(store, tmp_path, fmt):
+    store.add_jobs_df(JOBS.copy())
+    path = exports.export_path(store, fmt, str(tmp_path / 'exports'))
+    assert READERS[fmt](path)[HEADER].values.tolist() == JOBS.values.tolist()
+
+def test_export_is_reused_until_jobs_are_added(store, tmp_path):
+    export_dir = str(tmp_path / 'exports')
+    store.add_jobs_df(JOBS.head(2).copy())
+    first = exports.export_path(store, 'csv', export_dir)
+    assert exports.export_path(store, 'csv', export_dir) == first
+    store.add_jobs_df(JOBS.tail(2).copy())
+    second = exports.export_path(store, 'csv', export_dir)
+    assert second != first and os.listdir(export_dir) == [os.path.basename(second)]
+    assert len(READERS['csv'](second)) == 4
@@ -0,0 +1,69 @@
+"""Both IIMJobs card parsers against a saved listing page and generated fixture-site pages, field for field."""
+import os
+from datetime import date
+
+import pytest
+
+import iimjobs_parser
+import scraper as sc
+from benchmarks.fixture_site import FixtureSite
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+PARSERS = [iimjobs_parser.parse_cards_lxml, iimjobs_parser.parse_cards_bs4, iimjobs_parser.parse_cards]
+
+def card(title, location, experience, posted, href, job_id):
+    return {'title': title, 'location': location, 'experience': experience, 'posted': posted, 'href': href, 'job_id': job_id}
+
+LISTING_CARDS = [
+    card("Zenfold Capital - Product Manager - Lending", "Bangalore", "3 - 6 yrs", "Posted today",
+         "/j/zenfold-capital-product-manager-lending-1452301.html", "1452301"),
+    card("Kiranapay & Co - Senior Analyst(Credit Risk)", "Mumbai,Pune", "2 - 5 yrs", "1 day ago",
+         "/j/kiranapay-senior-analyst-credit-risk-1452288.html?ref=listing&pos=2", "1452288"),
+    card("Orbitly Labs - Growth Marketing Lead", "Gurgaon/Gurugram", "5 - 9 yrs", "3 days ago",
+         "/j/orbitly-labs-growth-marketing-lead-1452250.html", "1452250"),
+    card("Stackwise - Founder's Office Associate", "", "", "1 week ago", "/j/stackwise-founders-office-associate-1452199.html", "1452199"),
+    card("Farmlink Agritech - Supply Chain Manager", "Delhi NCR", "4 - 8 yrs", "2 days ago",
+         "/j/farmlink-agritech-supply-chain-manager-1452410.html", "1452410"),
+    card("Nimbus Health - Data Engineer", "Hyderabad", "1 - 4 yrs", "3 weeks ago", "/j/nimbus-health-data-engineer-1452100/", "1452100"),
+    card("Confidential - HR Business Partner", "Chennai", "6 - 10 yrs", "", "", ""),
+]
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+@pytest.mark.parametrize('parse', PARSERS, ids=lambda parse: parse.__name__)
+def test_saved_listing(parse):
+    assert parse(read_fixture('iimjobs_listing.html')) == LISTING_CARDS
+
+@pytest.mark.parametrize('parse', PARSERS, ids=lambda parse: parse.__name__)
+@pytest.mark.parametrize('count', [1, 45, 400])
+def test_fixture_site_pages(parse, count):
+    # Large pages used to lose cards in the lxml parser, which keyed cards on recycled id()s
+    site = FixtureSite(categories=1, cards=count, first_batch=count)
+    slug = next(iter(site.slugs))
+    assert parse(site.page(slug)) == site.listings[slug]
+
+@pytest.mark.parametrize('parse', PARSERS, ids=lambda parse: parse.__name__)
+def test_pages_without_cards(parse):
+    assert parse('<html><body><div class="MuiPaper-root"><p>No jobs match your filters</p></div></body></html>') == []
+
+def test_parse_cards_falls_back_to_bs4(monkeypatch):
+    monkeypatch.setattr(iimjobs_parser, 'lxml', None)
+    assert iimjobs_parser.parse_cards(read_fixture('iimjobs_listing.html')) == LISTING_CARDS
+
+@pytest.mark.parametrize('href,job_id', [
+    ('/j/pm-fintech-1234567.html', '1234567'), ('/j/pm-fintech-1234567', '1234567'), ('/j/pm-fintech-1234567/', '1234567'),
+    ('/j/pm-fintech-1234567.html?ref=home', '1234567'), ('/j/pm-2024-roles.html', ''), ('', ''), (None, ''),
+])
+def test_job_id_from_href(href, job_id):
+    assert iimjobs_parser.job_id_from_href(href) == job_id
+
+def test_cards_to_jobs():
+    jobs = [sc.iimjobs_card_to_job(c, today=date(2026, 3, 15)) for c in LISTING_CARDS[:2]]
+    assert jobs == [
+        {'Company': 'Zenfold Capital', 'Role': 'Product Manager - Lending', 'Location': 'Bangalore', 'Experience': '3 - 6 yrs',
+         'Posted Date': '15-03-2026', 'Source Portal': 'IIMJobs'},
+        {'Company': 'Kiranapay & Co', 'Role': 'Senior Analyst(Credit Risk)', 'Location': 'Mumbai,Pune', 'Experience': '2 - 5 yrs',
+         'Posted Date': '14-03-2026', 'Source Portal': 'IIMJobs'},
+    ]
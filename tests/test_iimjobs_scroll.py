@@ -0,0 +1,103 @@
+"""Adaptive IIMJobs scrolling against a fake lazy-loading page, and against the fixture site when Chromium is installed."""
+import asyncio
+import time
+
+import pytest
+
+import scraper as sc
+import setup
+from benchmarks.fixture_site import FixtureSite
+from iimjobs_parser import CARD_HREFS_JS
+
+class LazyListingPage:
+    """Fake Playwright page: starts with `first` cards and loads `batch` more load_delay seconds after each scroll.
+
+    With stall=True a scroll starts a request that never finishes and never adds cards.
+    """
+
+    def __init__(self, total=50, first=20, batch=20, load_delay=0.05, stall=False):
+        self.total = total
+        self.loaded = min(first, total)
+        self.batch = batch
+        self.load_delay = load_delay
+        self.stall = stall
+        self.scrolls = 0
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    async def evaluate(self, script, arg=None):
+        if script == CARD_HREFS_JS:
+            return [f"/j/job-{i}.html" for i in range(self.loaded)]
+        assert 'scrollBy' in script
+        self.scrolls += 1
+        self._fire('request')
+        if not self.stall:
+            asyncio.get_running_loop().call_later(self.load_delay, self._load_more)
+
+    def _load_more(self):
+        self.loaded = min(self.total, self.loaded + self.batch)
+        self._fire('requestfinished')
+
+    def _fire(self, event):
+        for handler in self.handlers.get(event, []):
+            handler(object())
+
+def scroll(page, max_scrolls=10, target_count=0, seen_ids=()):
+    started = time.monotonic()
+    added = asyncio.run(sc.scroll_for_cards(page, sc.ScrollPlan(max_scrolls, target_count, frozenset(seen_ids))))
+    return added, time.monotonic() - started
+
+@pytest.fixture(autouse=True)
+def quick_polling(monkeypatch):
+    monkeypatch.setattr(sc, 'SCROLL_POLL_SECONDS', 0.01)
+    monkeypatch.setattr(sc, 'SCROLL_IDLE_SECONDS', 0.1)
+    monkeypatch.setattr(sc._wait_for_more_cards, '__defaults__', (1.0,))
+
+def test_stops_when_a_scroll_adds_nothing():
+    page = LazyListingPage(total=50)
+    added, _ = scroll(page)
+    assert added == [20, 10, 0] and page.loaded == 50
+
+def test_moves_on_as_soon_as_cards_arrive():
+    added, seconds = scroll(LazyListingPage(total=100, load_delay=0.02), max_scrolls=4)
+    assert added == [20, 20, 20, 20]
+    # Four fixed two-second sleeps used to take 8s
+    assert seconds < 1.0
+
+def test_waits_for_slow_loads_while_requests_are_in_flight():
+    # Each load takes longer than the idle window, but its request is still open, so the scroll keeps waiting
+    added, _ = scroll(LazyListingPage(total=60, load_delay=0.3))
+    assert added == [20, 20, 0]
+
+def test_stops_at_the_target_count():
+    page = LazyListingPage(total=200)
+    added, _ = scroll(page, target_count=45)
+    assert added == [20, 20] and page.loaded == 60
+
+def test_stops_at_a_job_seen_before():
+    page = LazyListingPage(total=200)
+    added, _ = scroll(page, seen_ids={'30'})
+    assert added == [20] and page.scrolls == 1
+
+def test_seen_job_already_on_the_first_screen_means_no_scrolling():
+    page = LazyListingPage(total=200)
+    assert scroll(page, seen_ids={'5'})[0] == [] and page.scrolls == 0
+
+def test_gives_up_after_the_timeout_when_nothing_loads():
+    added, seconds = scroll(LazyListingPage(total=200, stall=True))
+    assert added == [0]
+    assert 0.9 <= seconds < 2.0
+
+def test_never_scrolls_more_than_max_scrolls():
+    page = LazyListingPage(total=1000)
+    assert scroll(page, max_scrolls=3)[0] == [20, 20, 20] and page.scrolls == 3
+
+@pytest.mark.skipif(not setup.chromium_installed(), reason="Chromium for Playwright is not installed")
+def test_scrapes_the_fixture_site_with_a_real_browser(monkeypatch):
+    monkeypatch.setattr(sc, '_warm_browser', None)
+    with FixtureSite(categories=2, cards=50, load_delay=0.2) as site:
+        jobs = sc.scrape_iimjobs_categories(site.categories, scroll_times=5, snapshots=None)
+        assert len(jobs) == 100
+        assert site.requests['image'] == 0
@@ -0,0 +1,38 @@
+"""The modules app.py imports to draw the search UI stay inside an import-time budget and leave the
+scraping stack (LinkedIn scraper, Playwright, BeautifulSoup) to be imported when a scrape starts."""
+import os
+import subprocess
+import sys
+
+# Everything app.py imports at the top, in a fresh interpreter
+APP_IMPORTS = ['streamlit', 'pandas', 'database', 'exports', 'bulk_import', 'setup', 'job_runner']
+SCRAPER_STACK = ['scraper', 'linkedin_jobs_scraper', 'playwright', 'bs4']
+# About 1.6 s on a laptop; the scraper stack would add another 0.25 s
+IMPORT_BUDGET_SECONDS = 3.0
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_times(modules):
+    """{module: (cumulative seconds, nesting)} from python -X importtime, importing modules in a fresh interpreter."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {', '.join(modules)}"],
+                            capture_output=True, text=True, check=True, cwd=REPO_DIR)
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: <self us> | <cumulative us> | <indent><module>
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times.setdefault(name.strip(), (int(cumulative) / 1e6, len(name) - len(name.lstrip())))
+    return times
+
+def test_search_ui_imports_stay_within_budget_without_the_scraper_stack():
+    # The first run after an install also compiles bytecode; time the second
+    import_times(APP_IMPORTS)
+    times = import_times(APP_IMPORTS)
+    loaded = [name for name in times if name.split('.')[0] in SCRAPER_STACK]
+    assert loaded == [], f"The search UI imports the scraper stack: {loaded}"
+    top_level = min(indent for _, indent in times.values())
+    total = sum(seconds for seconds, indent in times.values() if indent == top_level)
+    assert total < IMPORT_BUDGET_SECONDS, f"App imports took {total:.2f}s, over the {IMPORT_BUDGET_SECONDS}s budget"
+
+def test_import_times_sees_the_scraper_stack_when_it_is_imported():
+    assert 'linkedin_jobs_scraper' in import_times(['scraper'])
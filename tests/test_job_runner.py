@@ -0,0 +1,126 @@
+"""JobRunner on stub scrapers: saving in batches, cancel, failure, and resuming from a checkpoint."""
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from job_runner import JobRunner
+from scraper import ScrapeProgress
+
+UNITS = {'pune': ['A', 'B', 'C'], 'goa': ['D', 'E'], 'kochi': ['F']}
+
+class StubScrape:
+    """iterate() for JobRunner: yields the jobs of each unit in UNITS, skipping units the job already finished.
+
+    pause_after / fail_after name a unit after which it blocks until released, or raises.
+    """
+
+    def __init__(self, pause_after=None, fail_after=None):
+        self.pause_after = pause_after
+        self.fail_after = fail_after
+        self.paused = threading.Event()
+        self.release = threading.Event()
+        self.skipped = None
+
+    def __call__(self, job):
+        self.skipped = set(job.done_units)
+        todo = [unit for unit in UNITS if f"linkedin:{unit}" not in job.done_units]
+        yield ScrapeProgress('linkedin', '', len(todo))
+        for unit in todo:
+            for company in UNITS[unit]:
+                yield {'Company': company, 'Role': 'PM', 'Location': unit}
+            yield ScrapeProgress('linkedin', unit, len(todo), len(UNITS[unit]))
+            if unit == self.fail_after:
+                raise RuntimeError("browser crashed")
+            if unit == self.pause_after:
+                self.paused.set()
+                self.release.wait(5)
+
+class StubStore:
+    """Keeps each company once, like the real stores' dedup; batches records what each save was given."""
+
+    def __init__(self):
+        self.batches = []
+        self.saved = []
+
+    def add_jobs_df(self, jobs_df):
+        self.batches.append(jobs_df['Company'].tolist())
+        new = [company for company in self.batches[-1] if company not in self.saved]
+        self.saved.extend(new)
+        return len(new)
+
+def wait_until_finished(job, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not job.finished:
+        assert time.monotonic() < deadline, f"job still {job.status}"
+        time.sleep(0.01)
+    return job
+
+@pytest.fixture
+def runner(tmp_path):
+    return JobRunner(checkpoint_dir=str(tmp_path / 'checkpoints'), save_batch_size=2)
+
+def test_runs_to_completion_and_clears_its_checkpoint(runner):
+    store = StubStore()
+    job = wait_until_finished(runner.submit('broad', {'limit': 5}, StubScrape(), store.add_jobs_df))
+    progress = job.progress()
+    assert (progress['status'], progress['jobs_found'], progress['jobs_added']) == ('done', 6, 6)
+    assert (progress['stage'], progress['stage_done'], progress['stage_total']) == ('linkedin', 3, 3)
+    assert store.saved == ['A', 'B', 'C', 'D', 'E', 'F']
+    # Saved every save_batch_size jobs and at the end of each unit
+    assert store.batches == [['A', 'B'], ['C'], ['D', 'E'], ['F']]
+    assert not os.path.exists(job.checkpoint_path)
+    assert job.report is not None
+
+def test_submitting_a_running_scrape_returns_the_same_job(runner):
+    scrape, store = StubScrape(pause_after='pune'), StubStore()
+    job = runner.submit('broad', {'limit': 5}, scrape, store.add_jobs_df)
+    assert scrape.paused.wait(5)
+    assert runner.submit('broad', {'limit': 5}, StubScrape(), store.add_jobs_df) is job
+    assert runner.submit('broad', {'limit': 6}, StubScrape(), store.add_jobs_df) is not job
+    scrape.release.set()
+    wait_until_finished(job)
+
+def test_cancel_then_resume_skips_finished_units(runner):
+    first, store = StubScrape(pause_after='pune'), StubStore()
+    job = runner.submit('broad', {'limit': 5}, first, store.add_jobs_df)
+    assert first.paused.wait(5)
+    job.cancel()
+    first.release.set()
+    wait_until_finished(job)
+    assert job.status == 'cancelled'
+    assert job.checkpoint['done_units'] == ['linkedin:pune'] and job.kept('linkedin') == 3
+    assert os.path.exists(job.checkpoint_path)
+
+    second = StubScrape()
+    resumed = wait_until_finished(runner.submit('broad', {'limit': 5}, second, store.add_jobs_df))
+    assert resumed is not job and resumed.job_id == job.job_id
+    assert second.skipped == {'linkedin:pune'}
+    assert resumed.status == 'done' and resumed.progress()['jobs_added'] == 6
+    assert store.saved == ['A', 'B', 'C', 'D', 'E', 'F']
+
+def test_failed_scrape_keeps_its_checkpoint_and_resumes(runner):
+    store = StubStore()
+    job = wait_until_finished(runner.submit('broad', {'limit': 5}, StubScrape(fail_after='goa'), store.add_jobs_df))
+    assert (job.status, job.error) == ('failed', 'browser crashed')
+    assert job.checkpoint['done_units'] == ['linkedin:pune', 'linkedin:goa']
+
+    second = StubScrape()
+    resumed = wait_until_finished(runner.submit('broad', {'limit': 5}, second, store.add_jobs_df))
+    assert second.skipped == {'linkedin:pune', 'linkedin:goa'}
+    assert resumed.status == 'done'
+    assert store.saved == ['A', 'B', 'C', 'D', 'E', 'F']
+
+def test_stale_checkpoints_start_over(runner, monkeypatch):
+    store = StubStore()
+    job = wait_until_finished(runner.submit('broad', {'limit': 5}, StubScrape(fail_after='pune'), store.add_jobs_df))
+    monkeypatch.setattr('job_runner.CHECKPOINT_MAX_AGE', 0)
+    second = StubScrape()
+    wait_until_finished(runner.submit('broad', {'limit': 5}, second, store.add_jobs_df))
+    assert job.status == 'failed' and second.skipped == set()
+
+def test_found_df(runner):
+    job = wait_until_finished(runner.submit('targeted', {'role': 'PM'}, StubScrape(), StubStore().add_jobs_df))
+    assert isinstance(job.found_df(), pd.DataFrame) and job.found_df()['Company'].tolist() == ['A', 'B', 'C', 'D', 'E', 'F']
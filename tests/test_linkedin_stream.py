@@ -0,0 +1,88 @@
+"""LinkedIn runs on stub scrapers: per-run isolation, delivery outside the scheduler lock, and streaming."""
+import threading
+import time
+
+import pytest
+from linkedin_jobs_scraper.events import EventData, Events
+
+import scraper as sc
+from query_scheduler import QueryScheduler, QueryStats
+
+class StubScraper:
+    """Stands in for LinkedinScraper: emits made-up jobs for each query from a thread of its own."""
+
+    def __init__(self, jobs_per_query=6, delay=0.001):
+        self.jobs_per_query = jobs_per_query
+        self.delay = delay
+        self.callback = None
+
+    def on(self, event, callback):
+        assert event == Events.DATA
+        self.callback = callback
+
+    def run(self, queries):
+        for query in queries:
+            worker = threading.Thread(target=self._emit, args=(query,))
+            worker.start()
+            worker.join()
+
+    def _emit(self, query):
+        location = (query.options.locations or ['Worldwide'])[0]
+        for i in range(self.jobs_per_query):
+            time.sleep(self.delay)
+            # Every other job is from a company the startup filter rejects
+            company = f"{query.query} Labs {i}" if i % 2 == 0 else 'Infosys'
+            self.callback(EventData(
+                query=query.query, location=location, job_id=f"{query.query}-{i}", title=f"{query.query} #{i}",
+                company=company, description='A seed-funded startup. 3 to 5 years, remote.', date='2026-03-01'
+            ))
+
+@pytest.fixture(autouse=True)
+def stub_linkedin(tmp_path, monkeypatch):
+    # Query stats and caches land in the test's own directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sc, '_linkedin_scraper_factory', lambda snapshots, replay: StubScraper)
+
+def test_concurrent_targeted_scrapes_stay_isolated():
+    results = {}
+
+    def scrape(role):
+        results[role] = list(sc.iter_targeted_jobs(role, 'Pune', limit=10, watermarks=None))
+    threads = [threading.Thread(target=scrape, args=(role,)) for role in ('Designer', 'Analyst', 'Engineer')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for role, jobs in results.items():
+        assert [job['Role'] for job in jobs] == [f"{role} #0", f"{role} #2", f"{role} #4"]
+        assert all(job['Company'].startswith(role) for job in jobs)
+
+def test_streamed_jobs_are_enriched_without_building_a_dataframe(monkeypatch):
+    monkeypatch.setattr(sc.LinkedinCollector, 'to_df', lambda self: pytest.fail("to_df called while streaming"))
+    jobs = list(sc.iter_targeted_jobs('Designer', 'Pune', limit=10, watermarks=None))
+    assert jobs[0] == {'Company': 'Designer Labs 0', 'Role': 'Designer #0', 'Location': 'Remote', 'Experience': '3-5 years',
+                       'Posted Date': '01-03-2026', 'Source Portal': 'LinkedIn'}
+
+def test_kept_jobs_are_delivered_outside_the_scheduler_lock():
+    collector = sc.LinkedinCollector()
+    delivered = []
+
+    def on_kept(data):
+        delivered.append((data.job_id, scheduler.lock.locked()))
+        collector.deliver(data)
+    scheduler = QueryScheduler(StubScraper, Events.DATA, collector.on_data, stats=QueryStats(path=None), on_kept=on_kept)
+    assert scheduler.run(sc._targeted_queries('Designer', 'Pune', 10), 10) == {'Designer|Pune': (6, 3)}
+    assert delivered == [('Designer-0', False), ('Designer-2', False), ('Designer-4', False)]
+
+def test_budget_stops_delivery_across_workers():
+    collector = sc.LinkedinCollector()
+    queries = sc._targeted_queries('Designer', 'Pune', 10) + sc._targeted_queries('Analyst', 'Goa', 10)
+    kept = []
+    collector.on_job = kept.append
+    sc.schedule_linkedin_queries(queries, 4, collector, snapshots=None)
+    assert len(kept) == collector.count == 4
+
+def test_run_linkedin_scraper_still_returns_a_dataframe():
+    df = sc.run_linkedin_scraper(sc._targeted_queries('Analyst', 'Goa', 10), limit=10, snapshots=None)
+    assert df['Role'].tolist() == ['Analyst #0', 'Analyst #2', 'Analyst #4']
+    assert df['Location'].tolist() == ['Remote'] * 3
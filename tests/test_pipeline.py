@@ -0,0 +1,25 @@
+"""The offline end-to-end pipeline from benchmarks.bench_pipeline, small enough to run with the tests."""
+from argparse import Namespace
+
+import database as db
+from benchmarks.bench_pipeline import run_pipeline
+from benchmarks.fake_sheet import HEADER
+
+def test_broad_scrape_reaches_the_sheet_and_the_run_report(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(db, 'CACHE_DIR', str(tmp_path / 'cache'))
+    args = Namespace(linkedin_limit=20, jobs_per_query=10, job_delay=0, scrolls=1, existing=50)
+    job, sheet = run_pipeline(args, categories=[])
+
+    progress, report = job.progress(), job.report.to_dict()
+    assert progress['status'] == 'done' and progress['error'] is None
+    added = progress['jobs_added']
+    assert 0 < added <= 20 and len(sheet.values) == 1 + 50 + added
+    assert sheet.values[0] == HEADER and all(row[5] == 'LinkedIn' for row in sheet.values[51:])
+    counters = report['counters']
+    # Jobs kept from different queries can still be the same Company/Role/Location, and are streamed once
+    assert counters['linkedin.kept'] == progress['jobs_found'] + counters.get('jobs.stream_repeats', 0) and counters['jobs.written'] == added
+    assert counters['linkedin.seen'] == counters['linkedin.kept'] + counters['linkedin.filtered']
+    assert {'linkedin.query', 'save', 'dedup', 'sheet.append_rows'} <= set(report['stages'])
+    # The sheet is downloaded once, when the store first loads, and never again during the scrape
+    assert sheet.calls['get_all_values'] == 1
@@ -0,0 +1,127 @@
+"""QueryScheduler on a stub scraper that emits synthetic events: probes, follow-up limits, the budget,
+ranking by past yield and when queries count as done."""
+import math
+import threading
+
+import pytest
+from linkedin_jobs_scraper.events import EventData
+from linkedin_jobs_scraper.query import Query, QueryOptions
+
+from query_scheduler import QueryScheduler, QueryStats, query_key
+
+# Query text -> (results LinkedIn has for it, which of them the startup filter keeps)
+PROFILES = {
+    'good': (100, lambda i: True),
+    'okay': (100, lambda i: i % 2 == 0),
+    'poor': (100, lambda i: i % 10 == 0 and i > 0),
+    'short': (3, lambda i: True),
+}
+
+def make_query(text):
+    return Query(query=text, options=QueryOptions(locations=['Pune'], limit=25))
+
+class StubScraper:
+    """Emits the first `limit` results of a query from a thread of its own, like LinkedinScraper re-listing them each run."""
+
+    def __init__(self, log):
+        self.log = log
+        self.callback = None
+
+    def on(self, event, callback):
+        self.callback = callback
+
+    def run(self, queries):
+        for query in queries:
+            self.log.append(('run', query.query, query.options.limit))
+            available, _ = PROFILES[query.query]
+            worker = threading.Thread(target=lambda: [
+                self.callback(EventData(query=query.query, location='Pune', job_id=f"{query.query}-{i}"))
+                for i in range(min(available, query.options.limit))
+            ])
+            worker.start()
+            worker.join()
+
+class Collector:
+    """on_data as LinkedinCollector does it: None for repeats, else whether the job is kept."""
+
+    def __init__(self):
+        self.seen = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, data):
+        with self.lock:
+            if data.job_id in self.seen:
+                return None
+            self.seen.add(data.job_id)
+        text, i = data.job_id.rsplit('-', 1)
+        return PROFILES[text][1](int(i))
+
+@pytest.fixture
+def log():
+    return []
+
+def scheduler(log, stats=None, **options):
+    return QueryScheduler(lambda: StubScraper(log), 'data', Collector(), stats=stats or QueryStats(path=None),
+                          max_workers=1, **options)
+
+def runs(log):
+    return [entry[1:] for entry in log if entry[0] == 'run']
+
+def test_followups_share_the_rest_of_the_budget_by_probe_yield(log):
+    s = scheduler(log)
+    results = s.run([make_query(text) for text in ('good', 'okay', 'poor')], 20)
+    # Probes keep 5/5, 3/5 and 0/5: 12 jobs left, shared 1 : 0.6 between 'good' and 'okay'; 'poor' is below MIN_YIELD
+    remaining, total_yield = 20 - 8, 1 + 0.6
+    good_limit = 5 + math.ceil(remaining * 1 / total_yield / 1)
+    okay_limit = 5 + math.ceil(remaining * 0.6 / total_yield / 0.6)
+    assert runs(log) == [('good', 5), ('okay', 5), ('poor', 5), ('good', good_limit), ('okay', okay_limit)]
+    assert results['poor|Pune'] == (5, 0)
+    assert s.kept_total == sum(kept for _, kept in results.values()) == 20
+
+def test_followup_limits_are_capped_per_query(log):
+    s = scheduler(log, max_query_limit=40)
+    s.run([make_query(text) for text in ('good', 'poor')], 500)
+    assert runs(log) == [('good', 5), ('poor', 5), ('good', 40)]
+
+def test_low_yield_and_exhausted_probes_get_no_followup(log):
+    s = scheduler(log)
+    results = s.run([make_query(text) for text in ('poor', 'short')], 20)
+    assert runs(log) == [('poor', 5), ('short', 5)]
+    assert results == {'poor|Pune': (5, 0), 'short|Pune': (3, 3)}
+
+def test_kept_jobs_never_exceed_the_budget(log):
+    s = scheduler(log)
+    results = s.run([make_query(text) for text in ('good', 'okay', 'short')], 9)
+    # The probes alone reach the budget: 'short' keeps only the one job left, and nothing follows up
+    assert runs(log) == [('good', 5), ('okay', 5), ('short', 5)]
+    assert s.kept_total == sum(kept for _, kept in results.values()) == 9
+    assert results['short|Pune'] == (1, 1)
+
+def test_stats_from_one_run_rank_the_next(log):
+    stats = QueryStats(path=None)
+    queries = [make_query(text) for text in ('poor', 'okay', 'good')]
+    s = scheduler(log, stats=stats)
+    # Unseen queries all score 0.5 and keep their order
+    assert [q.query for q in s.rank(queries)] == ['poor', 'okay', 'good']
+    s.run(queries, 20)
+    assert [q.query for q in scheduler(log, stats=stats).rank(queries)] == ['good', 'okay', 'poor']
+    # With one query slot, the next run probes only the best of them
+    log.clear()
+    scheduler(log, stats=stats, max_queries=1).run(queries, 3)
+    assert runs(log) == [('good', 5)]
+
+def test_a_query_is_done_only_after_its_last_round(log):
+    s = scheduler(log, on_query_done=lambda key, seen, kept: log.append(('done', key, seen, kept)))
+    results = s.run([make_query(text) for text in ('good', 'poor', 'short')], 20)
+    done = [entry[1:] for entry in log if entry[0] == 'done']
+    # Probes without a follow-up are done right after the probe round; 'good' only with its follow-up, totals summed
+    assert done == [('poor|Pune', 5, 0), ('short|Pune', 3, 3), ('good|Pune', *results['good|Pune'])]
+    assert log.index(('done', 'poor|Pune', 5, 0)) < log.index(('run', 'good', 17))
+
+def test_a_scrape_stopped_between_rounds_leaves_followed_up_queries_unfinished(log):
+    done = []
+    # Stop once the three probes have run
+    s = scheduler(log, on_query_done=lambda key, seen, kept: done.append(key), should_stop=lambda: len(log) >= 3)
+    s.run([make_query(text) for text in ('good', 'poor', 'short')], 20)
+    assert log == [('run', 'good', 5), ('run', 'poor', 5), ('run', 'short', 5)]
+    assert done == ['poor|Pune', 'short|Pune']
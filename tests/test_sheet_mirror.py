@@ -0,0 +1,65 @@
+"""SheetMirror.refresh against a fake worksheet: appends cost one batch_get, conflicts one full resync,
+and a persisted mirror picks up where it left off."""
+import pytest
+
+import database as db
+from benchmarks.fake_sheet import FakeWorksheet, HEADER, make_jobs
+
+def synced_mirror(rows, path=None):
+    """A mirror of a sheet holding `rows`, after its first (full) sync, with the call counts reset."""
+    sheet = FakeWorksheet([HEADER] + rows)
+    mirror = db.SheetMirror(sheet, path=path)
+    mirror.refresh()
+    assert sheet.calls['get_all_values'] == 1
+    sheet.calls.clear()
+    return sheet, mirror
+
+def test_an_external_append_is_fetched_with_one_batch_get():
+    sheet, mirror = synced_mirror(make_jobs(5))
+    version = mirror.data_version()
+    sheet.values.extend(make_jobs(3, seed=1, prefix='New'))
+    mirror.refresh(force=True)
+    assert sheet.calls == {'batch_get': 1}
+    assert mirror.rows == sheet.values[1:] and mirror.resyncs == 1
+    assert mirror.data_version() != version
+
+def test_an_unchanged_sheet_is_checked_once_per_refresh_interval():
+    sheet, mirror = synced_mirror(make_jobs(5))
+    mirror.refresh()
+    assert sheet.calls == {}
+    mirror.refresh(force=True)
+    assert sheet.calls == {'batch_get': 1} and mirror.rows == sheet.values[1:]
+
+def rename_column(values):
+    values[0][HEADER.index('Posted Date')] = 'Date Posted'
+
+def edit_last_row(values):
+    values[-1][HEADER.index('Company')] = 'Someone Else'
+
+def shrink(values):
+    del values[-2:]
+
+@pytest.mark.parametrize('change', [rename_column, edit_last_row, shrink])
+def test_a_conflicting_change_costs_one_full_resync(change):
+    sheet, mirror = synced_mirror(make_jobs(5))
+    change(sheet.values)
+    mirror.refresh(force=True)
+    assert sheet.calls == {'batch_get': 1, 'get_all_values': 1}
+    assert [mirror.header] + mirror.rows == sheet.values and mirror.resyncs == 2
+
+def test_a_persisted_mirror_reloads_and_only_fetches_new_rows(tmp_path):
+    path = str(tmp_path / 'mirror.db')
+    sheet, mirror = synced_mirror(make_jobs(5), path=path)
+    sheet.values.extend(make_jobs(2, seed=1, prefix='New'))
+    mirror.refresh(force=True)
+    local = make_jobs(1, seed=2, prefix='Local')
+    sheet.append_rows(local)
+    mirror.append_local(local)
+
+    reloaded = db.SheetMirror(sheet, path=path)
+    assert (reloaded.header, reloaded.rows) == (HEADER, sheet.values[1:])
+    sheet.values.extend(make_jobs(1, seed=3, prefix='Later'))
+    sheet.calls.clear()
+    reloaded.refresh()
+    assert sheet.calls == {'batch_get': 1}
+    assert reloaded.rows == sheet.values[1:] and reloaded.resyncs == 0
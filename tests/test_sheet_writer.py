@@ -0,0 +1,107 @@
+"""SheetWriter retries quota and server errors, including gspread errors whose body is not JSON, in the
+foreground and behind the app's back, and recovers spooled rows."""
+import json
+import time
+
+import pandas as pd
+import pytest
+import requests
+from gspread.exceptions import APIError
+
+import database as db
+from benchmarks.fake_sheet import HEADER, FakeWorksheet, make_jobs
+
+def api_error(status, body):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body.encode('utf-8')
+    return APIError(response)
+
+def json_error(status):
+    return api_error(status, json.dumps({'error': {'code': status, 'message': 'error', 'status': 'ERROR'}}))
+
+def html_error(status):
+    return api_error(status, '<html><body>Bad Gateway</body></html>')
+
+class QuotaError(Exception):
+    code = 429
+
+@pytest.mark.parametrize('error,retryable', [
+    (json_error(429), True), (json_error(503), True), (json_error(400), False), (json_error(403), False),
+    (html_error(502), True), (html_error(503), True), (html_error(404), False),
+    (QuotaError(), True), (ValueError('bad row'), False),
+])
+def test_is_retryable(error, retryable):
+    assert db._is_retryable(error) is retryable
+
+def test_html_error_has_no_json_code():
+    assert html_error(503).code == -1
+
+def test_write_retries_server_errors_until_the_rows_land(tmp_path):
+    sheet = FakeWorksheet()
+    sheet.fail_next(html_error(503), json_error(429))
+    delays = []
+    writer = db.SheetWriter(sheet, chunk_size=2, spool_dir=str(tmp_path), sleep=delays.append)
+    writer.write(make_jobs(3))
+    assert sheet.values[1:] == make_jobs(3)
+    assert sheet.calls['append_rows'] == 4 and len(delays) == 2
+    assert writer.spooled_batches() == []
+
+def test_write_gives_up_on_client_errors_and_keeps_unsent_rows_spooled(tmp_path):
+    sheet = FakeWorksheet()
+    sheet.fail_next(None, json_error(400))
+    writer = db.SheetWriter(sheet, chunk_size=2, spool_dir=str(tmp_path), sleep=lambda delay: None)
+    with pytest.raises(APIError):
+        writer.write(make_jobs(3), keys=['a', 'b', 'c'])
+    assert sheet.values == [HEADER] + make_jobs(3)[:2]
+    [(_, rows, keys)] = writer.spooled_batches()
+    assert rows == make_jobs(3)[2:] and keys == ['c']
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+def test_submit_writes_in_the_background_and_clears_pending_keys(tmp_path):
+    sheet = FakeWorksheet()
+    writer = db.SheetWriter(sheet, chunk_size=2, spool_dir=str(tmp_path), sleep=lambda delay: None)
+    writer.submit(make_jobs(3), keys=['a', 'b', 'c'])
+    writer.flush()
+    assert sheet.values[1:] == make_jobs(3)
+    assert writer.pending_keys == set() and writer.spooled_batches() == []
+
+def test_submit_requeues_a_batch_after_retryable_errors_until_it_lands(tmp_path):
+    sheet = FakeWorksheet()
+    sheet.fail_next(json_error(503), html_error(502))
+    writer = db.SheetWriter(sheet, max_retries=0, max_delay=0.01, spool_dir=str(tmp_path), sleep=lambda delay: None)
+    writer.submit(make_jobs(2), keys=['a', 'b'])
+    wait_until(lambda: len(sheet.values) == 3)
+    wait_until(lambda: not writer.pending_keys)
+    assert sheet.calls['append_rows'] == 3 and writer.spooled_batches() == []
+
+def test_submit_keeps_a_permanently_failing_batch_spooled_without_retrying_it(tmp_path):
+    sheet = FakeWorksheet()
+    sheet.fail_next(json_error(400))
+    writer = db.SheetWriter(sheet, max_delay=0.01, spool_dir=str(tmp_path), sleep=lambda delay: None)
+    writer.submit(make_jobs(2), keys=['a', 'b'])
+    writer.flush()
+    time.sleep(0.1)
+    assert sheet.calls['append_rows'] == 1 and sheet.values == [HEADER]
+    # Its jobs are not in the sheet, so they must not count as duplicates of pending writes
+    assert writer.pending_keys == set()
+    [(_, rows, keys)] = writer.spooled_batches()
+    assert rows == make_jobs(2) and keys == ['a', 'b']
+
+def test_recover_spooled_jobs_only_resends_rows_that_did_not_land(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, 'CACHE_DIR', str(tmp_path / 'cache'))
+    rows = make_jobs(3)
+    keys = db.job_fingerprints(pd.DataFrame(rows, columns=HEADER)).tolist()
+    # A previous run spooled three rows and crashed after the first one landed
+    sheet = FakeWorksheet([HEADER] + rows[:1])
+    writer = db.get_sheet_writer(sheet)
+    writer._spool(rows, keys)
+    assert db.recover_spooled_jobs(sheet) == 2
+    writer.flush()
+    assert sheet.values[1:] == rows
+    assert writer.spooled_batches() == [] and writer.pending_keys == set()
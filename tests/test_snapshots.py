@@ -0,0 +1,54 @@
+"""SnapshotStore: time-bucketed get, latest for replay, and eviction."""
+import os
+
+import pytest
+
+from snapshots import SnapshotStore
+
+BUCKET = 1800
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(str(tmp_path), bucket_seconds=BUCKET)
+
+def test_get_only_answers_within_the_time_bucket(store):
+    store.put('linkedin', 'pm|Pune', {'events': [1]}, now=10 * BUCKET + 5)
+    assert store.get('linkedin', 'pm|Pune', now=10 * BUCKET + 100)['data'] == {'events': [1]}
+    assert store.get('linkedin', 'pm|Pune', now=11 * BUCKET) is None
+    assert store.get('linkedin', 'pm|Goa', now=10 * BUCKET + 100) is None
+
+def test_latest_returns_the_newest_bucket(store):
+    store.put('iimjobs', 'url', {'cards': 'old'}, now=9 * BUCKET)
+    store.put('iimjobs', 'url', {'cards': 'new'}, now=12 * BUCKET)
+    store.put('iimjobs', 'url', {'cards': 'middle'}, now=10 * BUCKET)
+    assert store.latest('iimjobs', 'url')['data'] == {'cards': 'new'}
+    assert store.latest('iimjobs', 'other') is None
+    assert store.latest('nothing-saved-yet', 'url') is None
+
+def test_latest_ignores_writes_in_progress_and_stray_files(store):
+    store.put('iimjobs', 'url', {'cards': 'done'}, now=10 * BUCKET)
+    prefix = store._prefix('iimjobs', 'url')
+    # A write another thread has not renamed yet, plus files that merely share the prefix
+    for name in (f"{prefix}-12.json.gz.140230.tmp", f"{prefix}-latest.json.gz", f"{prefix}0-11.json.gz"):
+        with open(name, 'wb') as f:
+            f.write(b'partial')
+    assert store.latest('iimjobs', 'url')['data'] == {'cards': 'done'}
+
+def test_an_unreadable_newest_snapshot_reads_as_missing(store):
+    store.put('iimjobs', 'url', {'cards': 1}, now=10 * BUCKET)
+    with open(f"{store._prefix('iimjobs', 'url')}-11.json.gz", 'wb') as f:
+        f.write(b'not gzip')
+    assert store.latest('iimjobs', 'url') is None
+    assert store.get('iimjobs', 'url', now=10 * BUCKET)['data'] == {'cards': 1}
+
+def test_evict_drops_old_snapshots_then_the_oldest_until_under_budget(store, tmp_path):
+    for i in range(4):
+        store.put('linkedin', f"q{i}", {'payload': 'x' * 1000}, now=10 * BUCKET)
+        os.utime(f"{store._prefix('linkedin', f'q{i}')}-10.json.gz", (1000 + i, 1000 + i))
+    store.max_age = 10 ** 9
+    store.max_bytes = 2 * os.path.getsize(f"{store._prefix('linkedin', 'q0')}-10.json.gz")
+    store.evict(now=2000)
+    assert [store.get('linkedin', f"q{i}", now=10 * BUCKET) is not None for i in range(4)] == [False, False, True, True]
+    store.max_age = 0
+    store.evict(now=2000)
+    assert not any(store.get('linkedin', f"q{i}", now=10 * BUCKET) for i in range(4))
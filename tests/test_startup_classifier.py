@@ -0,0 +1,54 @@
+"""Golden cases pinning the word-boundary semantics of the startup classifier."""
+import pandas as pd
+import pytest
+
+from scraper import is_startup_company, classify_startups
+
+GOLDEN = [
+    # (company, description, is a startup)
+    ('Acme', 'We are an early stage startup.', True),
+    ('Acme', 'Startups welcome', True),                    # plurals of indicators match
+    ('Acme', 'Backed by top VCs, unicorns in the making', True),
+    ('Acme', 'A scale-ups programme', True),
+    ('Acme', 'Series A-funded and growing', True),
+    ('Acme', 'Founded 2019 in Pune', True),                # 'founded 20' runs on into the year
+    ('Stealth Labs', '', True),                            # indicators count in the company name too
+    ('Acme', 'Startupish vibes', False),                   # but only as whole words
+    ('Acme', 'Startupish vibes at an edtech startup', True),  # a later whole-word match still counts
+    ('Acme', 'Pre-seed stage', True),
+    ('Acme', 'Judge the series as a whole', False),        # single-letter terms take no plural
+    ('Acme', 'Upscaling our infra', False),
+    ('Acme', 'An established enterprise', False),
+    ('Heyday Labs', 'startup', True),                      # 'ey' does not match inside 'Heyday'
+    ('Datatata', 'seed stage', True),                      # 'tata' does not match inside 'Datatata'
+    ('EY', 'startup', False),                              # large companies are excluded as whole words
+    ('Tata Digital', 'startup', False),
+    ('Google India', 'AI startup culture', False),
+    ("Google's Area 120", 'startup', False),
+    ('Metaverse Works', 'startup', True),
+    ('', 'startup', False),
+    (None, 'startup', False),
+    ('Acme', None, False),
+]
+
+@pytest.mark.parametrize('company,description,expected', GOLDEN)
+def test_is_startup_company(company, description, expected):
+    assert is_startup_company(company, description) is expected
+
+# Long texts take the literal-prefilter path of TermMatcher.search, short ones a single regex pass
+PADDING = 'We value ownership, clear writing and shipping often.'
+
+@pytest.mark.parametrize('company,description,expected', GOLDEN)
+def test_is_startup_company_on_long_descriptions(company, description, expected):
+    assert is_startup_company(company, f"{PADDING} {description or ''} {PADDING}") is expected
+
+def test_classify_startups_matches_row_by_row():
+    df = pd.DataFrame(GOLDEN, columns=['Company', 'Description', 'Expected'])
+    assert classify_startups(df).tolist() == df['Expected'].tolist()
+
+def test_classify_startups_without_descriptions():
+    df = pd.DataFrame({'Company': ['Stealth Labs', 'Acme', 'EY']})
+    assert classify_startups(df).tolist() == [True, False, False]
+
+def test_classify_startups_empty():
+    assert classify_startups(pd.DataFrame(columns=['Company', 'Description'])).empty
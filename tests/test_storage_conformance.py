@@ -0,0 +1,119 @@
+"""One behavioural suite for every JobStore backend: Google Sheets on a fake worksheet, and SQLite."""
+from datetime import date
+
+import pandas as pd
+import pytest
+
+import database as db
+from benchmarks.fake_sheet import HEADER, FakeWorksheet
+
+JOBS = pd.DataFrame([
+    ['Acme Labs', 'Product Manager', 'Bangalore', '3-5 years', '10-03-2026', 'LinkedIn'],
+    ['Kiranapay', 'Senior Analyst', 'Mumbai', '2+ years', '01-02-2026', 'IIMJobs'],
+    ['Orbitly', 'Growth Marketing Lead', 'Remote', '', '28-02-2026', 'LinkedIn'],
+    ['Stackwise', 'Product Analyst', 'Hybrid (Pune)', '1-3 years', '', 'File Upload'],
+], columns=HEADER)
+
+@pytest.fixture(params=['gsheet', 'sqlite'])
+def store(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(db, 'CACHE_DIR', str(tmp_path / 'cache'))
+    if request.param == 'gsheet':
+        return db.GSheetStore(FakeWorksheet())
+    return db.SQLiteStore(str(tmp_path / 'jobs.db'))
+
+def rows(df):
+    return df[HEADER].values.tolist() if not df.empty else []
+
+def test_starts_empty(store):
+    assert store.get_all_jobs_df().empty
+    assert store.search_jobs('Product', '').empty
+
+def test_add_returns_the_number_of_new_jobs_and_keeps_their_order(store):
+    assert store.add_jobs_df(JOBS.copy()) == 4
+    assert rows(store.get_all_jobs_df()) == JOBS.values.tolist()
+
+def test_add_skips_jobs_already_stored_or_repeated_in_the_batch(store):
+    store.add_jobs_df(JOBS.copy())
+    again = pd.DataFrame([
+        ['ACME LABS Pvt Ltd', 'product  manager', 'Bengaluru', '', '', 'LinkedIn'],
+        ['Nimbus Health', 'Data Engineer', 'Chennai', '', '', 'LinkedIn'],
+        ['Nimbus Health', 'Data Engineer', 'Chennai', '', '', 'IIMJobs'],
+    ], columns=HEADER)
+    assert store.add_jobs_df(again) == 1
+    assert rows(store.get_all_jobs_df())[-1] == ['Nimbus Health', 'Data Engineer', 'Chennai', '', '', 'LinkedIn']
+    assert store.add_jobs_df(JOBS.copy()) == 0
+
+def test_add_accepts_snake_case_columns_and_fills_missing_ones(store):
+    added = store.add_jobs_df(pd.DataFrame({'company': ['Quillbyte'], 'role': ['Legal Counsel'], 'location': ['Delhi']}))
+    assert added == 1
+    assert rows(store.get_all_jobs_df()) == [['Quillbyte', 'Legal Counsel', 'Delhi', '', '', '']]
+
+def test_add_nothing(store):
+    assert store.add_jobs_df(pd.DataFrame(columns=HEADER)) == 0
+
+@pytest.mark.parametrize('query,expected', [
+    ({'role': 'product', 'location': ''}, ['Acme Labs', 'Stackwise']),
+    ({'role': 'ANALYST', 'location': 'pune'}, ['Stackwise']),
+    ({'role': '', 'location': 'remote'}, ['Orbitly']),
+    ({'role': '', 'location': '', 'start_date': date(2026, 2, 1), 'end_date': date(2026, 2, 28)}, ['Kiranapay', 'Orbitly']),
+    ({'role': 'product', 'location': '', 'start_date': date(2026, 3, 10), 'end_date': date(2026, 3, 10)}, ['Acme Labs']),
+    ({'role': '', 'location': ''}, ['Acme Labs', 'Kiranapay', 'Orbitly', 'Stackwise']),
+    ({'role': 'chef', 'location': ''}, []),
+    ({'role': '100%', 'location': ''}, []),
+])
+def test_search(store, query, expected):
+    store.add_jobs_df(JOBS.copy())
+    found = store.search_jobs(**query)
+    assert (found['Company'].tolist() if not found.empty else []) == expected
+
+def test_search_sees_jobs_added_after_the_first_search(store):
+    store.add_jobs_df(JOBS.head(2).copy())
+    assert len(store.search_jobs('', '')) == 2
+    store.add_jobs_df(JOBS.tail(2).copy())
+    assert store.search_jobs('product analyst', '')['Company'].tolist() == ['Stackwise']
+
+def test_iter_jobs_df_yields_every_job_in_order(store):
+    assert rows(pd.concat(list(store.iter_jobs_df(3)))) == []
+    store.add_jobs_df(JOBS.copy())
+    chunks = list(store.iter_jobs_df(3))
+    assert rows(pd.concat(chunks)) == JOBS.values.tolist()
+    if isinstance(store, db.SQLiteStore):
+        assert [len(chunk) for chunk in chunks] == [3, 1]
+
+def test_data_version_changes_only_when_jobs_are_added(store):
+    empty = store.data_version()
+    store.add_jobs_df(JOBS.copy())
+    filled = store.data_version()
+    assert filled != empty
+    store.add_jobs_df(JOBS.copy())
+    assert store.data_version() == filled
+
+class OfflineWorksheet(FakeWorksheet):
+    def batch_get(self, ranges):
+        raise ConnectionError('offline')
+
+    def get_all_values(self):
+        raise ConnectionError('offline')
+
+def test_a_failed_write_raises_instead_of_reporting_nothing_new(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, 'CACHE_DIR', str(tmp_path / 'cache'))
+    sheet = FakeWorksheet()
+    sheet.fail_next(ValueError('bad request'))
+    with pytest.raises(db.StorageError, match="write to Google Sheet"):
+        db.GSheetStore(sheet).add_jobs_df(JOBS.copy())
+    with pytest.raises(db.StorageError, match="read data from Google Sheet"):
+        db.GSheetStore(OfflineWorksheet(id=1)).add_jobs_df(JOBS.copy())
+    sqlite_store = db.SQLiteStore(str(tmp_path / 'jobs.db'))
+    sqlite_store.conn.close()
+    with pytest.raises(db.StorageError, match="write to SQLite"):
+        sqlite_store.add_jobs_df(JOBS.copy())
+
+def test_gsheet_store_appends_without_downloading_the_sheet(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, 'CACHE_DIR', str(tmp_path / 'cache'))
+    sheet = FakeWorksheet([HEADER] + JOBS.values.tolist())
+    store = db.GSheetStore(sheet)
+    store.get_all_jobs_df()
+    sheet.calls.clear()
+    db.get_sheet_mirror(sheet)._checked_at = None
+    assert store.add_jobs_df(pd.DataFrame([['Farmlink Agritech', 'HR Business Partner', 'Pune', '', '', '']], columns=HEADER)) == 1
+    assert sheet.calls == {'batch_get': 1, 'append_rows': 1}
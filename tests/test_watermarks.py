@@ -0,0 +1,141 @@
+"""Incremental scrapes on synthetic event streams: frontier cut-offs, relevance-sorted runs, IIMJobs cards and replay."""
+import threading
+from datetime import date
+
+import pytest
+from linkedin_jobs_scraper.events import EventData
+from linkedin_jobs_scraper.filters import RelevanceFilters, TimeFilters
+from linkedin_jobs_scraper.query import Query, QueryFilters, QueryOptions
+
+import scraper as sc
+from watermarks import FrontierCutoff, Watermarks
+
+class ScriptedScraper:
+    """Stands in for LinkedinScraper: each run emits the next scripted stream of (job_id, date), from its own thread."""
+    streams = []
+    queries = []
+
+    def __init__(self, **options):
+        self.callback = None
+
+    def on(self, event, callback):
+        self.callback = callback
+
+    def run(self, queries):
+        for query in queries:
+            ScriptedScraper.queries.append(query)
+            stream = ScriptedScraper.streams.pop(0)
+            worker = threading.Thread(target=self._emit, args=(query, stream))
+            worker.start()
+            worker.join()
+
+    def _emit(self, query, stream):
+        for job_id, posted in stream:
+            self.callback(EventData(query=query.query, location=query.options.locations[0], job_id=job_id, title=f"Analyst {job_id}",
+                                    company=f"Startup {job_id}", description='A seed-funded startup.', date=posted))
+
+@pytest.fixture(autouse=True)
+def scripted_linkedin(tmp_path, monkeypatch):
+    # Query stats and snapshots land in the test's own directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sc, 'LinkedinScraper', ScriptedScraper)
+    monkeypatch.setattr(ScriptedScraper, 'streams', [])
+    monkeypatch.setattr(ScriptedScraper, 'queries', [])
+
+def test_a_newest_first_stream_is_cut_off_at_the_frontier():
+    watermarks = Watermarks(path=None)
+    watermarks.update('unit', ['j3', 'j4'], '2026-03-01')
+    cutoff = FrontierCutoff(watermarks)
+    stream = [('j1', '2026-03-03'), ('j2', '2026-03-02'), ('j3', '2026-03-01'), ('j0', '2026-03-04')]
+    assert [cutoff.accept('unit', job_id, posted) for job_id, posted in stream] == [True, True, False, False]
+    assert cutoff.reached_frontier('unit')
+    cutoff.commit()
+    assert watermarks.data['unit']['frontier'] == ['j1', 'j2', 'j3', 'j4']
+    assert watermarks.newest('unit') == '2026-03-03'
+
+def test_a_stream_in_another_order_is_not_cut_and_leaves_the_frontier_alone():
+    watermarks = Watermarks(path=None)
+    watermarks.update('unit', ['j3'], '2026-03-01', now=0)
+    cutoff = FrontierCutoff(watermarks, newest_first=[])
+    stream = [('j1', '2026-03-02'), ('j3', '2026-03-01'), ('j2', '2026-03-05')]
+    assert all(cutoff.accept('unit', job_id, posted) for job_id, posted in stream)
+    cutoff.commit()
+    assert watermarks.frontier('unit') == {'j3'}
+    assert watermarks.newest('unit') == '2026-03-05' and watermarks.age_days('unit') < 1
+
+def test_linkedin_runs_only_cut_off_once_results_come_newest_first():
+    # Snapshots stay on: the runs share one time bucket, but a narrowed query must not be answered from it
+    watermarks = Watermarks(path=None)
+    unit = sc.linkedin_unit_key('Analyst', 'Pune')
+
+    def run(*stream):
+        ScriptedScraper.streams.append(list(stream))
+        jobs = list(sc.iter_targeted_jobs('Analyst', 'Pune', limit=10, apply_filter=False, watermarks=watermarks))
+        return [job['Role'] for job in jobs]
+
+    # First run: LinkedIn's default order, so nothing is cut and no frontier is recorded, only that the unit ran
+    assert run(('j2', '2026-03-02'), ('j1', '2026-03-01')) == ['Analyst j2', 'Analyst j1']
+    assert watermarks.frontier(unit) == set() and watermarks.age_days(unit) is not None
+    # Second run asks for the last day, newest first, and records where it got to
+    assert run(('j4', '2026-03-04'), ('j3', '2026-03-03')) == ['Analyst j4', 'Analyst j3']
+    filters = ScriptedScraper.queries[-1].options.filters
+    assert (filters.relevance, filters.time) == (RelevanceFilters.RECENT, TimeFilters.DAY)
+    assert watermarks.data[unit]['frontier'] == ['j4', 'j3']
+    # Third run stops at the first job the second one saw
+    assert run(('j6', '2026-03-05'), ('j5', '2026-03-05'), ('j4', '2026-03-04'), ('j7', '2026-03-05')) == ['Analyst j6', 'Analyst j5']
+    assert watermarks.data[unit]['frontier'][:3] == ['j6', 'j5', 'j4']
+    assert ScriptedScraper.streams == [] and len(ScriptedScraper.queries) == 3
+
+def test_jobs_served_from_a_snapshot_keep_their_query_for_the_cut_off():
+    query = Query(query='Analyst', options=QueryOptions(locations=['Pune'], limit=5,
+                                                       filters=QueryFilters(time=TimeFilters.MONTH, relevance=RelevanceFilters.RELEVANT)))
+    ScriptedScraper.streams.append([('j2', '2026-03-02'), ('j1', '2026-03-01')])
+    sc.schedule_linkedin_queries([query], 5, sc.LinkedinCollector(apply_filter=False))
+    # The second run in the same bucket comes from the snapshot, not the scraper
+    cutoff = FrontierCutoff(Watermarks(path=None), newest_first=[])
+    sc.schedule_linkedin_queries([query], 5, sc.LinkedinCollector(apply_filter=False, cutoff=cutoff))
+    assert len(ScriptedScraper.queries) == 1
+    assert cutoff.new_ids == {sc.linkedin_unit_key('Analyst', 'Pune'): ['j2', 'j1']}
+
+def iim_card(job_id, posted):
+    return {'title': f"Startup {job_id} - Analyst", 'location': 'Pune', 'experience': '1 - 3 yrs', 'posted': posted, 'href': '', 'job_id': job_id}
+
+def test_iimjobs_drops_seen_and_older_cards_without_cutting_off_newer_ones():
+    watermarks = Watermarks(path=None)
+    watermarks.update('iimjobs:url', ['c2'], '2026-03-08')
+    finish = sc._iimjobs_finisher(None, FrontierCutoff(watermarks))
+    # A promoted card already seen sits above new ones; an old unseen card is further down
+    cards = [iim_card('c2', '2 days ago'), iim_card('c5', 'Posted today'), iim_card('c4', '1 day ago'),
+             iim_card('c1', '5 days ago'), iim_card('c3', '2 days ago')]
+    jobs = finish('url', 'Category', cards, date(2026, 3, 10))
+    assert [job['Company'] for job in jobs] == ['Startup c5', 'Startup c4', 'Startup c3']
+
+def test_each_iimjobs_listing_stops_scrolling_at_its_own_frontier(monkeypatch):
+    watermarks = Watermarks(path=None)
+    watermarks.update('iimjobs:a', ['a1'])
+    watermarks.update('iimjobs:b', ['b1', 'b2'])
+    plans = {}
+
+    async def fetch(categories, plans_by_url, *args):
+        plans.update(plans_by_url)
+        return []
+    monkeypatch.setattr(sc, '_warm_browser', None)
+    monkeypatch.setattr(sc, '_scrape_iimjobs_categories_async', fetch)
+    sc.scrape_iimjobs_categories([('a', 'A'), ('b', 'B'), ('c', 'C')], snapshots=None, watermarks=watermarks)
+    assert {url: plan.seen_ids for url, plan in plans.items()} == {'a': {'a1'}, 'b': {'b1', 'b2'}, 'c': set()}
+
+def test_replay_finds_snapshots_saved_by_narrowed_runs():
+    query = Query(query='Analyst', options=QueryOptions(locations=['Pune'], limit=5,
+                                                       filters=QueryFilters(time=TimeFilters.MONTH, relevance=RelevanceFilters.RELEVANT)))
+    watermarks = Watermarks(path=None)
+    watermarks.update(sc.linkedin_unit_key('Analyst', 'Pune'), [])
+    narrowed = sc.narrow_query(query, watermarks)
+    assert sc.linkedin_snapshot_key(narrowed) != sc.linkedin_snapshot_key(query)
+
+    ScriptedScraper.streams.append([('j2', '2026-03-02'), ('j1', '2026-03-01')])
+    sc.schedule_linkedin_queries([narrowed], 5, sc.LinkedinCollector(apply_filter=False))
+    assert sc._replay_queries([query]) == [query]
+    replayed = sc.LinkedinCollector(apply_filter=False)
+    sc.schedule_linkedin_queries([query], 5, replayed, replay=True)
+    assert [row['title'] for row in replayed.rows] == ['Analyst j2', 'Analyst j1']
+    assert ScriptedScraper.streams == []
@@ -0,0 +1,135 @@
+import os
+import json
+import time
+import threading
+
+WATERMARKS_PATH = os.path.join('.cache', 'watermarks.json')
+FRONTIER_SIZE = 30 # Newest job ids kept per unit; a later run stops once it reaches any of them
+# Search windows from narrowest to widest, in days, and the slack added to the gap since the last run
+TIME_WINDOWS = [('day', 1), ('week', 7), ('month', 30)]
+WINDOW_MARGIN_DAYS = 0.25
+
+class Watermarks:
+    """Per-unit scrape watermarks (a LinkedIn query+location or an IIMJobs category), stored as JSON.
+
+    Each unit keeps when it was last scraped, the newest posted date seen and the ids of its newest jobs.
+    """
+
+    def __init__(self, path=WATERMARKS_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.data = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self.data = json.load(f)
+            except Exception as e:
+                print(f"Ignoring unreadable watermarks at {path}: {e}")
+
+    def frontier(self, key):
+        with self.lock:
+            return frozenset(self.data.get(key, {}).get('frontier', ()))
+
+    def newest(self, key):
+        """ISO date of the newest posting seen in the unit, or None."""
+        with self.lock:
+            return self.data.get(key, {}).get('newest')
+
+    def age_days(self, key, now=None):
+        """Days since the unit was last scraped, or None if it never was."""
+        with self.lock:
+            scraped_at = self.data.get(key, {}).get('scraped_at')
+        if scraped_at is None:
+            return None
+        return ((now if now is not None else time.time()) - scraped_at) / 86400
+
+    def window(self, keys, now=None):
+        """Narrowest of TIME_WINDOWS covering the time since every one of the units was last scraped, or None."""
+        ages = [self.age_days(key, now) for key in keys]
+        if not ages or any(age is None for age in ages):
+            return None
+        gap = max(ages) + WINDOW_MARGIN_DAYS
+        return next((name for name, days in TIME_WINDOWS if gap <= days), None)
+
+    def update(self, key, new_ids, newest=None, now=None):
+        """Puts the ids found this run (newest first) in front of the frontier and marks the unit as scraped."""
+        with self.lock:
+            entry = self.data.setdefault(key, {'frontier': [], 'newest': None})
+            frontier = list(dict.fromkeys([i for i in new_ids if i] + entry['frontier']))[:FRONTIER_SIZE]
+            entry['frontier'] = frontier
+            if newest and (entry['newest'] is None or newest > entry['newest']):
+                entry['newest'] = newest
+            entry['scraped_at'] = now if now is not None else time.time()
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with self.lock:
+                payload = json.dumps(self.data, indent=1)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"Failed to save watermarks to {self.path}: {e}")
+
+class FrontierCutoff:
+    """Drops postings of each unit that an earlier run already handled; commit() writes this run back to the watermarks.
+
+    Only units in newest_first (every unit, by default) return results newest first. Their frontier is moved
+    forward and accept() cuts them off at it; for the rest nothing is cut and only the run and its newest
+    posting are recorded, since the first ids of a listing in another order (e.g. by relevance) are not its newest.
+    """
+
+    def __init__(self, watermarks, newest_first=None):
+        self.watermarks = watermarks
+        self.newest_first = None if newest_first is None else frozenset(newest_first)
+        self.lock = threading.Lock()
+        self.new_ids = {}
+        self.newest = {}
+        self.reached = set()
+
+    def _ordered(self, key):
+        return self.newest_first is None or key in self.newest_first
+
+    def _keep(self, key, job_id, posted):
+        self.new_ids[key].append(job_id)
+        if posted and posted > self.newest.get(key, ''):
+            self.newest[key] = posted
+
+    def accept(self, key, job_id, posted=None):
+        """True for a posting newer than the unit's frontier, in a stream that arrives newest first; posted is an ISO date."""
+        with self.lock:
+            if key in self.reached:
+                return False
+            self.new_ids.setdefault(key, [])
+            if self._ordered(key) and job_id and job_id in self.watermarks.frontier(key):
+                self.reached.add(key)
+                return False
+            self._keep(key, job_id, posted)
+            return True
+
+    def is_new(self, key, job_id, posted=None):
+        """True for a posting neither in the unit's frontier nor posted before its newest one; never cuts what follows."""
+        with self.lock:
+            self.new_ids.setdefault(key, [])
+            newest = self.watermarks.newest(key)
+            if (job_id and job_id in self.watermarks.frontier(key)) or (posted and newest and posted < newest):
+                return False
+            self._keep(key, job_id, posted)
+            return True
+
+    def reached_frontier(self, key):
+        with self.lock:
+            return key in self.reached
+
+    def commit(self, keys=None):
+        """Updates the watermarks of the given units (all units seen, by default) and saves them."""
+        with self.lock:
+            keys = list(self.new_ids) if keys is None else list(keys)
+            for key in keys:
+                new_ids = self.new_ids.get(key, []) if self._ordered(key) else []
+                self.watermarks.update(key, new_ids, self.newest.get(key))
+        self.watermarks.save()